@@ -0,0 +1,156 @@
+"""Offline stand-ins for the Binance REST client and websocket manager.
+
+install_fakes replaces the classes where the terminal looks them up, so it
+must run after news_terminal modules are imported and before the app starts.
+"""
+import random
+import threading
+import time
+
+import requests
+
+BENCH_COINS = ("BTC", "ETH", "SOL", "ARB", "PEPE", "OP", "INJ")
+
+
+def _futures_symbol(coin: str) -> dict:
+    return {
+        "symbol": f"{coin}USDT",
+        "baseAsset": coin,
+        "quoteAsset": "USDT",
+        "contractType": "PERPETUAL",
+        "quantityPrecision": 3,
+        "filters": [
+            {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
+            {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+            {"filterType": "MARKET_LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+            {"filterType": "MIN_NOTIONAL", "notional": "5"},
+        ],
+    }
+
+
+class FakeClient(object):
+    """Binance client answering from memory with plausible payloads."""
+
+    FUTURES_URL = "https://fapi.binance.com/fapi"
+    FUTURES_TESTNET_URL = "https://testnet.binancefuture.com/fapi"
+    SIDE_BUY = "BUY"
+    SIDE_SELL = "SELL"
+    FUTURE_ORDER_TYPE_MARKET = "MARKET"
+
+    def __init__(self, api_key=None, api_secret=None, testnet=False, **kwargs):
+        """Initialize shared attributes"""
+        self.testnet = testnet
+        self.session = requests.Session()
+
+    def get_exchange_info(self) -> dict:
+        return {
+            "symbols": [
+                {"symbol": f"{coin}{quote}", "baseAsset": coin, "quoteAsset": quote}
+                for coin in BENCH_COINS
+                for quote in ("USDT", "BUSD")
+            ]
+        }
+
+    def futures_exchange_info(self) -> dict:
+        return {"symbols": [_futures_symbol(coin) for coin in BENCH_COINS]}
+
+    def futures_leverage_bracket(self) -> list[dict]:
+        return [
+            {"symbol": f"{coin}USDT", "brackets": [{"initialLeverage": 50}]}
+            for coin in BENCH_COINS
+        ]
+
+    def futures_account_balance(self) -> list[dict]:
+        return [{"asset": "USDT", "balance": "1000"}]
+
+    def futures_change_leverage(self, symbol: str, leverage: int) -> dict:
+        return {"symbol": symbol, "leverage": leverage, "maxNotionalValue": "1000000"}
+
+    def futures_mark_price(self, symbol: str) -> dict:
+        return {"symbol": symbol, "markPrice": "100"}
+
+    def futures_ping(self) -> dict:
+        return {}
+
+    def futures_create_order(self, **order) -> dict:
+        return dict(order, orderId=1, status="NEW", updateTime=int(time.time() * 1000))
+
+    def _klines(self, limit: int = 500, **kwargs) -> list[list]:
+        start = (int(time.time()) // 60 - limit + 1) * 60
+        return [
+            [(start + 60 * i) * 1000, "100", "101", "99", "100", "10", 0, "1000"]
+            for i in range(limit)
+        ]
+
+    def _agg_trades(self, startTime: int, endTime: int, **kwargs) -> list[dict]:
+        return [
+            {"p": "100", "q": "1", "T": second * 1000}
+            for second in range(startTime // 1000, endTime // 1000 + 1)
+        ]
+
+    get_klines = futures_klines = _klines
+    get_aggregate_trades = futures_aggregate_trades = _agg_trades
+
+
+class FakeWebSocketManager(object):
+    """Websocket manager producing random walk trades for subscribed markets.
+
+    Messages have the shape of the combined stream and are handed to the
+    process_stream_data callback of the stream from a thread, like the real
+    manager does.
+    """
+
+    trade_rate = 200.0
+
+    def __init__(self, exchange: str, **kwargs) -> None:
+        """Initialize shared attributes"""
+        self.exchange = exchange
+        self.markets: set[str] = set()
+        self.sent = 0
+        self._callback = None
+        self._prices: dict[str, float] = {}
+        self._stopped = threading.Event()
+
+    def create_stream(self, channels, markets, process_stream_data=None, **kwargs):
+        self.subscribe_to_stream("fake", channels, markets)
+        if self._callback is None:
+            # One producer for the markets of every stream
+            self._callback = process_stream_data
+            threading.Thread(target=self._produce, daemon=True).start()
+        return "fake"
+
+    def subscribe_to_stream(self, stream_id, channels, markets) -> bool:
+        self.markets.update([markets] if isinstance(markets, str) else markets)
+        return True
+
+    def unsubscribe_from_stream(self, stream_id, channels=None, markets=None) -> bool:
+        self.markets.difference_update(markets or [])
+        return True
+
+    def stop_manager_with_all_streams(self) -> None:
+        self._stopped.set()
+
+    def _produce(self) -> None:
+        rng = random.Random(self.exchange)
+        while not self._stopped.wait(1 / self.trade_rate):
+            for market in list(self.markets):
+                price = self._prices.get(market, 100.0) * rng.uniform(0.999, 1.001)
+                self._prices[market] = price
+                trade = {
+                    "e": "trade",
+                    "s": market.upper(),
+                    "p": f"{price:.4f}",
+                    "q": "1.000",
+                    "T": int(time.time() * 1000),
+                }
+                self._callback({"stream": f"{market}@trade", "data": trade})
+                self.sent += 1
+
+
+def install_fakes() -> None:
+    """Replace the Binance client and websocket manager used by the terminal."""
+    from news_terminal import _binance_data, _binance_trade
+
+    _binance_data.Client = FakeClient
+    _binance_data.BinanceWebSocketApiManager = FakeWebSocketManager
+    _binance_trade.Client = FakeClient
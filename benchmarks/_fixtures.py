@@ -0,0 +1,72 @@
+"""Recorded and synthetic news captures shared by the benchmarks."""
+import json
+import random
+import time
+from pathlib import Path
+
+DEFAULT_NEWS_CAPTURE = Path(__file__).parent / "fixtures" / "news.jsonl"
+
+_WORDS = (
+    "Binance will list {coin} in the innovation zone",
+    "{coin} mainnet upgrade scheduled, deposits suspended",
+    "[@{user}] says {coin} partnership confirmed",
+    "Exploit reported on {coin} bridge, funds moved",
+    "{coin} foundation announces token buyback",
+    # Lowercases to a longer text, tickers must still be found
+    "İstanbul exchange lists {coin}",
+)
+_LINKS = (
+    "https://twitter.com/{user}/status/{id}",
+    "https://www.binance.com/en/support/announcement/{id}",
+    "https://medium.com/@{user}/update-{id}",
+    "www.example.org/{user}",
+    # Quotes inside a link must be removed before the link is made clickable
+    "https://x.com/[@{user}]",
+    "https://x.com/[@{user}]/status/{id}",
+)
+_SOURCES = ("Binance EN", "Upbit", "Blogs", "direct", "Coinbase")
+
+
+def load_news_capture(path: Path | None = None) -> list[dict]:
+    """Load a JSONL capture of Tree of Alpha messages, one message per line."""
+    path = path or DEFAULT_NEWS_CAPTURE
+    with open(path) as capture:
+        return [json.loads(line) for line in capture if line.strip()]
+
+
+def synthetic_news(count: int = 5000, seed: int = 42) -> list[dict]:
+    """Build messages with the shape of the Tree of Alpha feed."""
+    rng = random.Random(seed)
+    start = time.time() * 1000
+    messages = []
+    for index in range(count):
+        coin = rng.choice(("BTC", "ETH", "SOL", "ARB", "PEPE", "OP", "INJ"))
+        user = rng.choice(("cz_binance", "VitalikButerin", "tree_news"))
+        link = rng.choice(_LINKS).format(user=user, id=rng.randint(1, 10**9))
+        body = " ".join(
+            rng.choice(_WORDS).format(coin=coin, user=user) for _ in range(3)
+        )
+        message = {
+            "title": rng.choice(_WORDS).format(coin=coin, user=user),
+            "body": f"{body} {link} (via {rng.choice(_LINKS)})".format(
+                user=user, id=index
+            ),
+            "source": rng.choice(_SOURCES),
+            "url": link,
+            "time": start + index * 250,
+            "_id": f"{index:024x}",
+        }
+        if rng.random() < 0.5:
+            message["coin"] = coin
+        if rng.random() < 0.3:
+            message["actions"] = [{"title": f"{coin}USDT PERP"}]
+        messages.append(message)
+    return messages
+
+
+def news_messages(path: Path | None = None, count: int = 5000) -> list[dict]:
+    """Recorded messages if a capture exists, synthetic ones otherwise."""
+    if path or DEFAULT_NEWS_CAPTURE.exists():
+        return load_news_capture(path)
+    print("No recorded news capture found, using synthetic messages")
+    return synthetic_news(count)
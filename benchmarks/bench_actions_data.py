@@ -0,0 +1,140 @@
+"""Benchmark the market universe join against the previous nested loop.
+
+Usage:
+    python benchmarks/bench_actions_data.py [--fixture PATH] [--record]
+
+The fixture is a JSON file with the "spot" and "futures" symbol lists of the
+exchange info endpoints, use --record to store one from the live exchange.
+A synthetic fixture with the same shape is used when none is found.
+"""
+import argparse
+import json
+import random
+import string
+import timeit
+from collections import defaultdict
+from pathlib import Path
+
+from news_terminal._binance_data import (
+    DISABLED_ENDS,
+    STABLE_COINS,
+    get_futures_symbols,
+    get_spot_symbols,
+    join_actions_data,
+)
+
+DEFAULT_FIXTURE = Path(__file__).parent / "fixtures" / "exchange_info.json"
+
+
+def legacy_actions_data(spot_pairs: list, future_pairs: list) -> dict:
+    """Previous build_actions_data body, kept as the baseline."""
+    actions_data = defaultdict(list)
+    for pair in spot_pairs:
+        if not pair.endswith("USDT") and not pair.endswith("BUSD"):
+            continue
+        ticker = pair[:-4]
+        if ticker in STABLE_COINS:
+            continue
+        if ticker.endswith(DISABLED_ENDS):
+            continue
+        if ticker[-1].isdigit():
+            continue
+
+        for f_pair in future_pairs:
+            compare_pair = f_pair
+            if f_pair.startswith("1000"):
+                compare_pair = f_pair[4:]
+
+            if ticker == compare_pair[:-4]:
+                temp_action = {}
+                formated_f_pair = f"{f_pair[:-4]}{f_pair[-4:]}"
+                temp_action["title"] = f"{formated_f_pair} PERP"
+                if temp_action not in actions_data[ticker]:
+                    actions_data[ticker].append(temp_action)
+
+        formated_pair = f"{pair[:-4]}/{pair[-4:]}"
+        temp_action = {"title": formated_pair}
+        if temp_action not in actions_data[ticker]:
+            actions_data[ticker].append(temp_action)
+
+    return actions_data
+
+
+def synthetic_fixture(seed: int = 42) -> dict:
+    """Build a fixture of about 2000 spot and 300 futures symbols."""
+    rng = random.Random(seed)
+    bases = set()
+    while len(bases) < 600:
+        bases.add("".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 6))))
+    bases = sorted(bases)
+
+    spot = []
+    for base in bases:
+        for quote in ("USDT", "BUSD", "BTC", "ETH", "BNB", "TRY", "EUR"):
+            if len(spot) < 2000 and (quote == "USDT" or rng.random() < 0.45):
+                spot.append(
+                    {"symbol": f"{base}{quote}", "baseAsset": base, "quoteAsset": quote}
+                )
+
+    futures = []
+    for base in rng.sample(bases, 300):
+        f_base = f"1000{base}" if rng.random() < 0.03 else base
+        futures.append(
+            {
+                "symbol": f"{f_base}USDT",
+                "baseAsset": f_base,
+                "quoteAsset": "USDT",
+                "contractType": "PERPETUAL",
+            }
+        )
+        if rng.random() < 0.1:
+            futures.append(
+                {
+                    "symbol": f"{f_base}BUSD",
+                    "baseAsset": f_base,
+                    "quoteAsset": "BUSD",
+                    "contractType": "PERPETUAL",
+                }
+            )
+    return {"spot": spot, "futures": futures}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        fixture = {"spot": get_spot_symbols(), "futures": get_futures_symbols()}
+        args.fixture.parent.mkdir(parents=True, exist_ok=True)
+        args.fixture.write_text(json.dumps(fixture))
+    elif args.fixture.exists():
+        fixture = json.loads(args.fixture.read_text())
+    else:
+        print("No recorded fixture found, using a synthetic one")
+        fixture = synthetic_fixture()
+
+    spot_pairs = [symbol["symbol"] for symbol in fixture["spot"]]
+    future_pairs = [symbol["symbol"] for symbol in fixture["futures"]]
+    print(f"{len(spot_pairs)} spot symbols, {len(future_pairs)} futures symbols")
+
+    legacy = legacy_actions_data(spot_pairs, future_pairs)
+    indexed = join_actions_data(fixture["spot"], fixture["futures"])
+    if dict(legacy) != indexed:
+        print("WARNING: indexed join differs from the legacy output")
+
+    timings = {
+        "legacy": lambda: legacy_actions_data(spot_pairs, future_pairs),
+        "indexed": lambda: join_actions_data(fixture["spot"], fixture["futures"]),
+    }
+    results = {}
+    for name, func in timings.items():
+        results[name] = min(timeit.repeat(func, number=args.number, repeat=3))
+        print(f"{name:>8}: {results[name] / args.number * 1000:.3f} ms per build")
+    print(f"speedup: {results['legacy'] / results['indexed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
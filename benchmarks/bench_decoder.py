@@ -0,0 +1,56 @@
+"""Benchmark the news feed JSON decoders on recorded payloads.
+
+Usage:
+    python benchmarks/bench_decoder.py [--capture PATH] [--count N]
+
+Every available decoder parses the same payloads, as text frames and as
+bytes frames, the best of 3 runs is reported.
+"""
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from _fixtures import news_messages
+
+from news_terminal.news._decoder import DECODER_NAME, DECODERS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", type=Path)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    messages = news_messages(args.capture, args.count)[: args.count]
+    payloads = {"str": [json.dumps(message) for message in messages]}
+    payloads["bytes"] = [payload.encode() for payload in payloads["str"]]
+    size = sum(len(payload) for payload in payloads["bytes"])
+    print(f"{len(messages)} messages, {size / 2**20:.2f} MiB, using {DECODER_NAME}")
+
+    for name, decoder in DECODERS.items():
+        if [decoder(payload) for payload in payloads["bytes"]] != messages:
+            print(f"WARNING: {name} decodes differently than the recorded messages")
+
+    results = {}
+    for name, decoder in DECODERS.items():
+        for kind, batch in payloads.items():
+            results[name, kind] = min(
+                timeit.repeat(
+                    lambda: [decoder(payload) for payload in batch],
+                    number=1,
+                    repeat=3,
+                )
+            )
+            elapsed = results[name, kind]
+            print(
+                f"{name:>8} {kind:>5}: {elapsed / len(batch) * 1e6:.2f} us per message,"
+                f" {size / elapsed / 2**20:.1f} MiB/s"
+            )
+    baseline = results["json", "str"]
+    for kind in payloads:
+        print(f"speedup {kind:>5}: {baseline / results[DECODER_NAME, kind]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark the news text formatter against the previous regex passes.
+
+Usage:
+    python benchmarks/bench_formatter.py [--capture PATH] [--count N]
+"""
+import argparse
+import re
+import timeit
+from pathlib import Path
+
+from _fixtures import news_messages
+
+from news_terminal.news._formatter import format_news_data, format_news_message
+from news_terminal.news.data_format import NewsData
+
+
+def _legacy_format_links_for_click(text):
+    return re.sub(
+        r"(?:https?://|www\.)\S+(?<![\!)\]])", _legacy_replace_with_click, text
+    )
+
+
+def _legacy_replace_with_click(match) -> str:
+    url = match.group(0)
+    url = re.sub(r"[{}|^[\]`]", "", url)
+    link = _legacy_nice_link_format(url)
+    return f'[@click=app.open_link("{url}")]{link}[/]'
+
+
+def _legacy_nice_link_format(url):
+    domain_match = re.search(r"(?<=://)[\w\.]+(?=/|$)", url)
+    link = "Link"
+    if domain_match:
+        link = f"{domain_match.group()}/..."
+    return link
+
+
+def _legacy_format_quotes(text):
+    return re.sub(r"\[@(\w+)\]", r"@\1", text)
+
+
+def _legacy_record(record: NewsData) -> dict:
+    """Dict with the fields the legacy formatter rewrites."""
+    return {
+        "title": record.title,
+        "body": record.body,
+        "link": record.link,
+        "coin": record.coin,
+    }
+
+
+def legacy_format_news_message(news_message):
+    """Previous format_news_message, kept as the baseline."""
+    news_message["title"] = _legacy_format_quotes(news_message["title"])
+    news_message["title"] = _legacy_format_links_for_click(news_message["title"])
+    if news_message["body"]:
+        news_message["body"] = _legacy_format_quotes(news_message["body"])
+        news_message["body"] = _legacy_format_links_for_click(news_message["body"])
+    if news_message["link"]:
+        _link = news_message["link"]
+        _link = f'[@click=app.open_link("{_link}")]{_legacy_nice_link_format(_link)}[/]'
+        news_message["link"] = _link
+    if news_message["coin"]:
+        news_message["coin"] = f"Coin: {news_message['coin']}"
+    return news_message
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", type=Path)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    records = [format_news_data(message) for message in news_messages(args.capture)]
+    records = records[: args.count]
+    print(f"{len(records)} messages")
+
+    mismatches = 0
+    for record in records:
+        legacy = legacy_format_news_message(_legacy_record(record))
+        rendered = format_news_message(record)
+        mismatches += any(
+            legacy[field] != getattr(rendered, field)
+            for field in ("title", "body", "link", "coin")
+        )
+    if mismatches:
+        print(f"WARNING: {mismatches} messages differ from the legacy output")
+
+    formatters = {
+        "legacy": (legacy_format_news_message, _legacy_record),
+        "compiled": (format_news_message, lambda record: record),
+    }
+    results = {}
+    for name, (formatter, convert) in formatters.items():
+        # Legacy formats dicts in place, each run gets fresh ones
+        copies = [[convert(record) for record in records] for _ in range(3)]
+        results[name] = min(
+            timeit.timeit(lambda: [formatter(record) for record in batch], number=1)
+            for batch in copies
+        )
+        per_message = results[name] / len(records) * 1e6
+        print(f"{name:>8}: {per_message:.2f} us per message")
+    print(f"speedup: {results['legacy'] / results['compiled']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
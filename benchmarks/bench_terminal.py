@@ -0,0 +1,138 @@
+"""Benchmark the whole terminal against a local replay of the news feed.
+
+Usage:
+    python benchmarks/bench_terminal.py [--capture PATH] [--count N]
+        [--speed SPEED] [--burst N] [--binary] [--trade-rate RATE]
+        [--tracemalloc]
+
+NewsTerminalApp runs headless through Textual's pilot. News comes from
+replay_server on a free local port and Binance is replaced by the fakes of
+_fakes, so nothing leaves the machine. Reports news messages per second,
+the latency of every stage up to first paint, the price stream backlog and
+memory. Use --speed 0 to measure throughput, --speed 1 for live-like latency.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from _fakes import FakeWebSocketManager, install_fakes
+from _fixtures import news_messages
+from replay_server import serve_replay
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("localhost", 0))
+        return probe.getsockname()[1]
+
+
+def configure_environment(port: int) -> None:
+    """Point the terminal to the replay server, must run before importing it."""
+    for key in (
+        "TWITTER_BEARER_TOKEN",
+        "BINANCE_KEY",
+        "BINANCE_SECRET",
+        "BINANCE_KEY_TEST",
+        "BINANCE_SECRET_TEST",
+    ):
+        os.environ.setdefault(key, "bench")
+    os.environ["NEWS_FEEDS"] = f"ws://localhost:{port}"
+    os.environ["NEWS_FEED_CONNECTIONS"] = "1"
+    os.environ["NEWS_TERMINAL_CACHE_DIR"] = tempfile.mkdtemp(prefix="news_bench_")
+
+
+async def run(args: argparse.Namespace, port: int) -> None:
+    from news_terminal.news._latency import NEWS_LATENCY, percentile
+    from news_terminal.news._twitter_monitor import TRACKED_USERS
+    from news_terminal.terminal import NewsTerminalApp
+    from news_terminal.widgets._price_tracker import PriceTracker
+
+    install_fakes()
+    FakeWebSocketManager.trade_rate = args.trade_rate
+    # No stream rules to fetch from the Twitter api
+    TRACKED_USERS._rules = {}
+
+    messages = news_messages(args.capture, args.count)[: args.count]
+    server = await serve_replay(
+        messages,
+        "localhost",
+        port,
+        speed=args.speed,
+        burst=args.burst,
+        binary=args.binary,
+    )
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    app = NewsTerminalApp()
+    async with app.run_test(size=(160, 50)) as pilot:
+        price_tracker = app.query_one(PriceTracker)
+        price_tracker.subscribe_to_action(args.pair)
+        started = time.perf_counter()
+        deadline = started + args.timeout
+        while NEWS_LATENCY.count < len(messages) and time.perf_counter() < deadline:
+            await pilot.pause(0.05)
+        elapsed = time.perf_counter() - started
+        exchange = (
+            "binance.com-futures" if args.pair.endswith("PERP") else "binance.com"
+        )
+        trades_sent = price_tracker._market_data.get_manager(exchange).sent
+        price_backlog = price_tracker._stream_queue.qsize()
+
+    server.close()
+    await server.wait_closed()
+
+    print(f"{NEWS_LATENCY.count}/{len(messages)} messages painted in {elapsed:.2f}s")
+    print(f"throughput: {NEWS_LATENCY.count / elapsed:.1f} messages/s")
+    stages = defaultdict(list)
+    for source_stages in NEWS_LATENCY.samples.values():
+        for stage, samples in source_stages.items():
+            stages[stage].extend(samples)
+    print(f"{'stage':>8} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for stage, samples in stages.items():
+        samples.sort()
+        print(
+            f"{stage:>8} {percentile(samples, 50):9.2f}"
+            f" {percentile(samples, 99):9.2f} {samples[-1]:9.2f}"
+        )
+    print(
+        f"price stream: {trades_sent / elapsed:.0f} trades/s,"
+        f" {price_backlog} left in the queue"
+    )
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"max rss: {rss_after / 1024:.1f} MiB (+{(rss_after - rss_before) / 1024:.1f})"
+    )
+    if args.tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        print(f"traced peak: {peak / 2**20:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", type=Path)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--speed", type=float, default=0.0)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--binary", action="store_true")
+    parser.add_argument("--trade-rate", type=float, default=200.0)
+    parser.add_argument("--pair", default="BTCUSDT PERP")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--tracemalloc", action="store_true")
+    args = parser.parse_args()
+
+    port = free_port()
+    configure_environment(port)
+    asyncio.run(run(args, port))
+
+
+if __name__ == "__main__":
+    main()
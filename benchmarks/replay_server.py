@@ -0,0 +1,115 @@
+"""Local websocket server replaying recorded news captures.
+
+Usage:
+    python benchmarks/replay_server.py [--capture PATH] [--port PORT]
+        [--speed SPEED] [--burst N] [--keep-time] [--binary]
+
+Every client receives the whole capture. --speed 1 keeps the original gaps
+between messages, higher values replay faster and 0 sends without waiting.
+--burst sends N messages at once before each wait. The "time" of every
+message is set to the moment it is sent, so the feed delay measured by the
+terminal is the local transport only, use --keep-time to send it as recorded.
+--binary sends bytes frames instead of text frames.
+Point the terminal to it with NEWS_FEEDS=ws://localhost:PORT.
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from websockets.server import WebSocketServer, WebSocketServerProtocol, serve
+
+from _fixtures import news_messages
+
+
+async def replay(
+    websocket: WebSocketServerProtocol,
+    messages: list[dict],
+    speed: float = 1.0,
+    burst: int = 1,
+    keep_time: bool = False,
+    max_gap: float = 5.0,
+    binary: bool = False,
+) -> None:
+    """Send the messages to the client, spaced as in the capture.
+
+    Args:
+        websocket: Connected client
+        messages (list[dict]): Messages ordered by time
+        speed (float): Replay speed, 0 to send without waiting
+        burst (int): Messages sent at once before each wait
+        keep_time (bool): Keep the recorded "time" of the messages
+        max_gap (float): Longest wait in seconds, quiet periods are cut short
+        binary (bool): Send bytes frames instead of text frames
+    """
+    for start in range(0, len(messages), burst):
+        batch = messages[start : start + burst]
+        if speed and start:
+            gap = (batch[0]["time"] - messages[start - 1]["time"]) / 1000 / speed
+            await asyncio.sleep(min(max(gap, 0), max_gap))
+        for message in batch:
+            if not keep_time:
+                message = dict(message, time=time.time() * 1000)
+            payload = json.dumps(message)
+            await websocket.send(payload.encode() if binary else payload)
+
+
+async def serve_replay(
+    messages: list[dict],
+    host: str = "localhost",
+    port: int = 8765,
+    **replay_options,
+) -> WebSocketServer:
+    """Start a server replaying the messages to every client.
+
+    Args:
+        messages (list[dict]): Messages to replay
+        host (str): Interface to listen on
+        port (int): Port to listen on, 0 for any free port
+        replay_options: Options passed to replay
+
+    Returns:
+        WebSocketServer: Running server, close it when done
+    """
+    messages = sorted(messages, key=lambda message: message["time"])
+
+    async def handler(websocket: WebSocketServerProtocol) -> None:
+        await replay(websocket, messages, **replay_options)
+        # Stay open like the live feed, the client decides when to leave
+        await websocket.wait_closed()
+
+    return await serve(handler, host, port)
+
+
+async def run(args: argparse.Namespace) -> None:
+    messages = news_messages(args.capture, args.count)
+    server = await serve_replay(
+        messages,
+        args.host,
+        args.port,
+        speed=args.speed,
+        burst=args.burst,
+        keep_time=args.keep_time,
+        binary=args.binary,
+    )
+    print(f"Replaying {len(messages)} messages on ws://{args.host}:{args.port}")
+    await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", type=Path)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--keep-time", action="store_true")
+    parser.add_argument("--binary", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
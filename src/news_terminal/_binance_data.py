@@ -1,10 +1,18 @@
+from unicorn_binance_websocket_api.connection_settings import CONNECTION_SETTINGS
 from unicorn_binance_websocket_api.manager import BinanceWebSocketApiManager
 from binance.client import Client
 
 from collections import defaultdict
+from functools import partial
+import threading
+import time
+from typing import Callable
 
 DEFAULT_CHANNELS = ["kline_1m", "kline_5m", "kline_15m", "trade"]
 
+# Reactions only record trades
+REACTION_CHANNELS = ["trade"]
+
 STABLE_COINS = {
     "T",
     "BUSD",
@@ -22,46 +30,227 @@ STABLE_COINS = {
 
 DISABLED_ENDS = ("BEAR", "DOWN", "UP", "BULL")
 
+SPOT_QUOTES = {"USDT", "BUSD"}
 
-def subscribe_to_market(
-    api_manager: BinanceWebSocketApiManager | None,
-    stream: None | str,
-    market: str,
-    exchange: str = "binance.com-futures",
-) -> tuple[BinanceWebSocketApiManager, str]:
-    new_api_manager = BinanceWebSocketApiManager(
-        exchange=exchange, output_default="dict", high_performance=True
-    )
-    if stream and api_manager:
-        api_manager.stop_manager_with_all_streams()
+FUTURES_QUOTES = {"USDT", "BUSD", "USDC"}
+
+
+class MarketDataManager(object):
+    """One long-lived websocket manager per exchange, shared by all markets.
+
+    Changing markets updates the subscriptions of the existing streams
+    instead of starting a new manager with its own threads and sockets.
+    A stream takes the same channels of each of its markets, up to the limit
+    of subscriptions per stream of the exchange, further markets go to
+    another stream of the same manager.
+    With process_stream_data every message is handed to the callback, along
+    with its exchange, from the websocket threads instead of being stored in
+    the stream buffer.
+    """
+
+    def __init__(
+        self,
+        channels: list[str] = DEFAULT_CHANNELS,
+        process_stream_data: Callable[[dict, str], None] | None = None,
+    ) -> None:
+        """Initialize shared attributes"""
+        self.channels = channels
+        self.process_stream_data = process_stream_data
+        self.markets: dict[str, set[str]] = defaultdict(set)
+        self._managers: dict[str, BinanceWebSocketApiManager] = {}
+        # Markets of every stream id, by exchange and channels
+        self._streams: dict[
+            tuple[str, tuple[str, ...]], dict[str, set[str]]
+        ] = defaultdict(dict)
+        self._market_streams: dict[tuple[str, str], tuple[tuple[str, ...], str]] = {}
+
+    def get_manager(self, exchange: str) -> BinanceWebSocketApiManager | None:
+        return self._managers.get(exchange)
+
+    def max_markets(self, exchange: str, channels: list[str] | None = None) -> int:
+        """Get the markets a single stream of the exchange can take."""
+        return CONNECTION_SETTINGS[exchange][0] // len(channels or self.channels)
+
+    def subscribe(
+        self, market: str, exchange: str, channels: list[str] | None = None
+    ) -> bool:
+        """Subscribe to the channels of the market, every channel by default.
+
+        A market subscribed to other channels is moved to a stream of the
+        given ones, unless it already has all of them.
+
+        Returns:
+            bool: False if the subscription failed
+        """
+        channels_key = tuple(channels or self.channels)
+        subscribed = self._market_streams.get((market, exchange))
+        if subscribed is not None:
+            if set(channels_key) <= set(subscribed[0]):
+                return True
+            self.unsubscribe(market, exchange)
+        manager = self._managers.get(exchange)
+        if manager is None:
+            manager = BinanceWebSocketApiManager(
+                exchange=exchange, output_default="dict", high_performance=True
+            )
+            self._managers[exchange] = manager
+        streams = self._streams[(exchange, channels_key)]
+        max_markets = self.max_markets(exchange, list(channels_key))
+        stream_id = next(
+            (
+                stream_id
+                for stream_id, markets in streams.items()
+                if len(markets) < max_markets
+            ),
+            None,
+        )
+        if stream_id is None:
+            process_stream_data = None
+            if self.process_stream_data is not None:
+                process_stream_data = partial(
+                    self.process_stream_data, exchange=exchange
+                )
+            stream_id = manager.create_stream(
+                channels=list(channels_key),
+                markets=market,
+                process_stream_data=process_stream_data,
+            )
+            if not stream_id:
+                return False
+            streams[stream_id] = set()
+        elif not manager.subscribe_to_stream(
+            stream_id, channels=list(channels_key), markets=[market]
+        ):
+            return False
+        streams[stream_id].add(market)
+        self._market_streams[(market, exchange)] = (channels_key, stream_id)
+        self.markets[exchange].add(market)
+        return True
+
+    def unsubscribe(self, market: str, exchange: str) -> None:
+        if market not in self.markets[exchange]:
+            return
+        self.markets[exchange].discard(market)
+        channels_key, stream_id = self._market_streams.pop((market, exchange))
+        self._streams[(exchange, channels_key)][stream_id].discard(market)
+        # Without channels only the market is dropped, giving channels
+        # drops them for every market of the stream
+        self._managers[exchange].unsubscribe_from_stream(stream_id, markets=[market])
+
+    def switch(
+        self,
+        market: str,
+        exchange: str,
+        keep: set[tuple[str, str]] | frozenset = frozenset(),
+    ) -> float:
+        """Subscribe to the market, dropping every other subscription.
+
+        Args:
+            market (str): Market to subscribe to
+            exchange (str): Exchange of the market
+            keep (set[tuple[str, str]]): (market, exchange) subscriptions to keep
+
+        Returns:
+            float: Time taken in ms
+        """
+        started = time.perf_counter()
+        for current_exchange, markets in self.markets.items():
+            for current_market in list(markets):
+                key = (current_market, current_exchange)
+                if key != (market, exchange) and key not in keep:
+                    self.unsubscribe(current_market, current_exchange)
+        self.subscribe(market, exchange)
+        return (time.perf_counter() - started) * 1000
+
+    def stop(self) -> None:
+        for manager in self._managers.values():
+            manager.stop_manager_with_all_streams()
 
-    new_stream = new_api_manager.create_stream(
-        channels=DEFAULT_CHANNELS, markets=market
-    )
-    return new_api_manager, new_stream
 
+_public_client: Client | None = None
+_public_client_lock = threading.Lock()
 
-def get_all_future_pairs() -> list:
-    client = Client()
+
+def get_public_client() -> Client:
+    """Get the unauthenticated client shared by the market data requests.
+
+    It is created on first use, as creating a client pings the api, and
+    reused so requests go over its open connections.
+    """
+    global _public_client
+    with _public_client_lock:
+        if _public_client is None:
+            _public_client = Client()
+        return _public_client
+
+
+def get_futures_symbols() -> list[dict]:
+    client = get_public_client()
     info = client.futures_exchange_info()
-    return [symbol["symbol"] for symbol in info["symbols"]]
+    return info["symbols"]
 
 
-def get_all_spot_pairs() -> list:
-    client = Client()
+def get_spot_symbols() -> list[dict]:
+    client = get_public_client()
     info = client.get_exchange_info()
-    return [symbol["symbol"] for symbol in info["symbols"]]
+    return info["symbols"]
+
 
+def get_recent_klines(market: str, exchange: str, limit: int) -> list[list]:
+    """Get the last 1m klines of a stream market, oldest first.
 
-def build_actions_data() -> dict:
-    future_pairs = get_all_future_pairs()
-    spot_pairs = get_all_spot_pairs()
+    Args:
+        market (str): Market as used by the streams, like "btcusdt"
+        exchange (str): Exchange of the stream, spot or futures
+        limit (int): Number of klines
+
+    Returns:
+        list[list]: Klines as returned by the api
+    """
+    client = get_public_client()
+    if exchange == "binance.com-futures":
+        return client.futures_klines(symbol=market.upper(), interval="1m", limit=limit)
+    return client.get_klines(symbol=market.upper(), interval="1m", limit=limit)
+
+
+def get_agg_trades(market: str, exchange: str, start: int, end: int) -> list[dict]:
+    """Get the aggregated trades of a stream market between two ms timestamps."""
+    client = get_public_client()
+    if exchange == "binance.com-futures":
+        return client.futures_aggregate_trades(
+            symbol=market.upper(), startTime=start, endTime=end
+        )
+    return client.get_aggregate_trades(
+        symbol=market.upper(), startTime=start, endTime=end
+    )
 
-    actions_data = defaultdict(list)
-    for pair in spot_pairs:
-        if not pair.endswith("USDT") and not pair.endswith("BUSD"):
+
+def join_actions_data(spot_symbols: list[dict], futures_symbols: list[dict]) -> dict:
+    """Join spot pairs with the perpetual contracts of the same base asset.
+
+    Args:
+        spot_symbols (list[dict]): Symbols from the spot exchange info
+        futures_symbols (list[dict]): Symbols from the futures exchange info
+
+    Returns:
+        dict[str][list]: Dict with ticker and its actions, perpetuals first
+    """
+    perpetuals = defaultdict(list)
+    for f_symbol in futures_symbols:
+        if f_symbol.get("contractType", "PERPETUAL") != "PERPETUAL":
+            continue
+        if f_symbol["quoteAsset"] not in FUTURES_QUOTES:
             continue
-        ticker = pair[:-4]
+        base_asset = f_symbol["baseAsset"].removeprefix("1000")
+        perpetuals[base_asset].append(f"{f_symbol['symbol']} PERP")
+
+    actions_data = {}
+    seen_titles = {}
+    for symbol in spot_symbols:
+        quote_asset = symbol["quoteAsset"]
+        if quote_asset not in SPOT_QUOTES:
+            continue
+        ticker = symbol["baseAsset"]
         if ticker in STABLE_COINS:
             continue
         if ticker.endswith(DISABLED_ENDS):
@@ -69,25 +258,44 @@ def build_actions_data() -> dict:
         if ticker[-1].isdigit():
             continue
 
-        for f_pair in future_pairs:
+        titles = seen_titles.get(ticker)
+        if titles is None:
+            titles = seen_titles[ticker] = set()
+            actions_data[ticker] = []
+            for title in perpetuals.get(ticker, ()):
+                if title not in titles:
+                    titles.add(title)
+                    actions_data[ticker].append({"title": title})
 
-            compare_pair = f_pair
-            if f_pair.startswith("1000"):
-                compare_pair = f_pair[4:]
+        title = f"{ticker}/{quote_asset}"
+        if title not in titles:
+            titles.add(title)
+            actions_data[ticker].append({"title": title})
 
-            if ticker == compare_pair[:-4]:
-                temp_action = {}
-                formated_f_pair = f"{f_pair[:-4]}{f_pair[-4:]}"
-                temp_action["title"] = f"{formated_f_pair} PERP"
-                if temp_action not in actions_data[ticker]:
-                    actions_data[ticker].append(temp_action)
+    return actions_data
 
-        formated_pair = f"{pair[:-4]}/{pair[-4:]}"
-        temp_action = {"title": formated_pair}
-        if temp_action not in actions_data[ticker]:
-            actions_data[ticker].append(temp_action)
 
-    return actions_data
+def parse_symbol_filters(futures_symbols: list[dict]) -> dict:
+    """Keep the order filters of every futures symbol.
 
+    Args:
+        futures_symbols (list[dict]): Symbols from the futures exchange info
 
-ACTIONS_DATA = build_actions_data()
+    Returns:
+        dict[str][dict]: Dict with symbol and its quantity_precision, tick_size,
+            step_size, min_qty, max_qty and min_notional, numbers as strings
+    """
+    symbol_filters = {}
+    for f_symbol in futures_symbols:
+        filters = {_filter["filterType"]: _filter for _filter in f_symbol["filters"]}
+        # Market orders are bound by MARKET_LOT_SIZE, LOT_SIZE otherwise
+        lot_size = filters.get("MARKET_LOT_SIZE", filters.get("LOT_SIZE", {}))
+        symbol_filters[f_symbol["symbol"]] = {
+            "quantity_precision": f_symbol["quantityPrecision"],
+            "tick_size": filters.get("PRICE_FILTER", {}).get("tickSize", "0"),
+            "step_size": lot_size.get("stepSize", "0"),
+            "min_qty": lot_size.get("minQty", "0"),
+            "max_qty": lot_size.get("maxQty", "0"),
+            "min_notional": filters.get("MIN_NOTIONAL", {}).get("notional", "0"),
+        }
+    return symbol_filters
@@ -1,23 +1,48 @@
 """Module with class to handle trading in Binance"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+import functools
+from pathlib import Path
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from binance.helpers import round_step_size
 
+from news_terminal._binance_data import parse_symbol_filters
+from news_terminal._market_universe import (
+    MARKET_UNIVERSE,
+    REFRESH_ERRORS,
+    read_snapshot,
+    write_snapshot,
+)
+from news_terminal._price_store import LAST_PRICES
 from news_terminal.config import (
     BINANCE_KEY,
     BINANCE_KEY_TEST,
     BINANCE_SECRET,
     BINANCE_SECRET_TEST,
+    CACHE_DIR,
+    MARKET_UNIVERSE_TTL,
 )
 
+LEVERAGE_SNAPSHOT_VERSION = 1
+FILTERS_SNAPSHOT_VERSION = 1
+
+
+class OrderValidationError(Exception):
+    """Order rejected locally by the cached symbol filters."""
+
 
 class BinanceTrader(object):
     """Class to handle trading in binance"""
 
     def __init__(self, testnet: bool) -> None:
         """Initialize shared attributes"""
+        self.testnet = testnet
         if testnet:
             self.client = Client(
                 api_key=BINANCE_KEY_TEST,  # type: ignore
@@ -31,7 +56,93 @@ class BinanceTrader(object):
                 testnet=False,
             )
 
-        self.symbols_precision = self.get_all_symbol_precision()
+        # Mainnet filters are shared with the market universe snapshot,
+        # testnet lists other symbols, with other steps
+        self.testnet_filters: dict[str, dict] = {}
+        self.testnet_filters_updated = 0.0
+        if testnet:
+            self.testnet_filters = self.get_testnet_filters()
+        elif not MARKET_UNIVERSE.futures_filters:
+            MARKET_UNIVERSE.fetch()
+        self.max_leverage_updated = 0.0
+        self.max_leverage = self.get_max_leverage()
+
+    @property
+    def symbol_filters(self) -> dict[str, dict]:
+        if self.testnet:
+            return self.testnet_filters
+        return MARKET_UNIVERSE.futures_filters
+
+    def _get_filters(self, symbol: str) -> dict:
+        filters = self.symbol_filters.get(symbol)
+        if filters is None:
+            raise OrderValidationError(f"Unknown futures symbol {symbol}")
+        return filters
+
+    def get_max_leverage(self, refresh: bool = False) -> dict[str, int]:
+        """Get the max leverage by symbol, from disk unless stale.
+
+        Leverage brackets depend on the account, so each network has its own
+        snapshot, the last one is kept if the api can not be reached.
+        """
+        network = "testnet" if self.testnet else "mainnet"
+        path = Path(CACHE_DIR) / f"leverage_{network}.json"
+        snapshot = read_snapshot(path, LEVERAGE_SNAPSHOT_VERSION)
+        if snapshot:
+            self.max_leverage_updated = snapshot["updated"]
+            if not refresh and time.time() - snapshot["updated"] < MARKET_UNIVERSE_TTL:
+                return snapshot["max_leverage"]
+        try:
+            brackets = self.client.futures_leverage_bracket()
+        except REFRESH_ERRORS:
+            return snapshot["max_leverage"] if snapshot else {}
+        max_leverage = {
+            bracket["symbol"]: bracket["brackets"][0]["initialLeverage"]
+            for bracket in brackets
+        }
+        self.max_leverage_updated = time.time()
+        write_snapshot(
+            path,
+            LEVERAGE_SNAPSHOT_VERSION,
+            updated=self.max_leverage_updated,
+            max_leverage=max_leverage,
+        )
+        return max_leverage
+
+    def get_testnet_filters(self, refresh: bool = False) -> dict[str, dict]:
+        """Get the testnet symbol filters, from disk unless stale.
+
+        The last snapshot is kept if the api can not be reached.
+        """
+        path = Path(CACHE_DIR) / "futures_filters_testnet.json"
+        snapshot = read_snapshot(path, FILTERS_SNAPSHOT_VERSION)
+        if snapshot:
+            self.testnet_filters_updated = snapshot["updated"]
+            if not refresh and time.time() - snapshot["updated"] < MARKET_UNIVERSE_TTL:
+                return snapshot["futures_filters"]
+        try:
+            info = self.client.futures_exchange_info()
+        except REFRESH_ERRORS:
+            return snapshot["futures_filters"] if snapshot else {}
+        futures_filters = parse_symbol_filters(info["symbols"])
+        self.testnet_filters_updated = time.time()
+        write_snapshot(
+            path,
+            FILTERS_SNAPSHOT_VERSION,
+            updated=self.testnet_filters_updated,
+            futures_filters=futures_filters,
+        )
+        return futures_filters
+
+    def refresh_snapshots(self) -> None:
+        """Refresh the max leverage and testnet filters once stale."""
+        if time.time() - self.max_leverage_updated >= MARKET_UNIVERSE_TTL:
+            self.max_leverage = self.get_max_leverage(refresh=True)
+        if (
+            self.testnet
+            and time.time() - self.testnet_filters_updated >= MARKET_UNIVERSE_TTL
+        ):
+            self.testnet_filters = self.get_testnet_filters(refresh=True)
 
     def get_futures_balance(self, symbol: str = "USDT") -> Decimal:
         """Get the futures balance of the given symbol"""
@@ -49,37 +160,266 @@ class BinanceTrader(object):
             return {}
 
     def get_price(self, symbol: str) -> Decimal:
-        """Get price of the given symbol."""
+        """Get price of the given symbol, streamed if recent enough."""
+        # Streamed prices are from mainnet, testnet prices can drift away
+        if not self.testnet:
+            token_price = LAST_PRICES.get(symbol)
+            if token_price is not None:
+                return token_price
         token_price = self.client.futures_mark_price(symbol=symbol)
         token_price = Decimal(token_price["markPrice"])
         return token_price
 
-    def get_all_symbol_precision(self) -> dict:
-        info = self.client.futures_exchange_info()
-        symbols_precision = {}
-        for token in info["symbols"]:
-            symbols_precision[token["symbol"]] = token["quantityPrecision"]
-        return symbols_precision
-
     def calculate_position_side(
-        self, symbol: str, money_to_spend: Decimal, leverage: int
+        self,
+        symbol: str,
+        money_to_spend: Decimal,
+        leverage: int,
+        token_price: Decimal | None = None,
     ) -> Decimal:
-        token_price = self.get_price(symbol)
-        return round(
-            (money_to_spend * leverage) / token_price, self.symbols_precision[symbol]
+        filters = self._get_filters(symbol)
+        if token_price is None:
+            token_price = self.get_price(symbol)
+        quantity = (money_to_spend * leverage) / token_price
+        step_size = Decimal(filters["step_size"])
+        if not step_size:
+            return round(quantity, filters["quantity_precision"])
+        return Decimal(str(round_step_size(quantity, step_size)))
+
+    def validate_order(
+        self, symbol: str, quantity: Decimal, token_price: Decimal, leverage: int
+    ) -> None:
+        """Check the order against the cached filters, without a request.
+
+        Raises:
+            OrderValidationError: If the exchange would reject the order
+        """
+        filters = self._get_filters(symbol)
+        min_qty = Decimal(filters["min_qty"])
+        max_qty = Decimal(filters["max_qty"])
+        min_notional = Decimal(filters["min_notional"])
+        if quantity <= 0 or quantity < min_qty:
+            raise OrderValidationError(f"{symbol} quantity {quantity} below {min_qty}")
+        if max_qty and quantity > max_qty:
+            raise OrderValidationError(f"{symbol} quantity {quantity} above {max_qty}")
+        if quantity * token_price < min_notional:
+            raise OrderValidationError(
+                f"{symbol} notional {quantity * token_price:.2f} below {min_notional}"
+            )
+        max_leverage = self.max_leverage.get(symbol)
+        if max_leverage and leverage > max_leverage:
+            raise OrderValidationError(
+                f"{symbol} leverage {leverage} above {max_leverage}"
+            )
+
+    def prepare_leverage_trade(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Decimal,
+        leverage: int,
+        token_price: Decimal | None = None,
+    ) -> dict:
+        """Build and validate the order parameters, locally if the price is given.
+
+        Raises:
+            OrderValidationError: If the exchange would reject the order
+        """
+        self._get_filters(symbol)
+        if token_price is None:
+            token_price = self.get_price(symbol)
+        position_side = self.calculate_position_side(
+            symbol=symbol,
+            money_to_spend=quantity,
+            leverage=leverage,
+            token_price=token_price,
         )
+        self.validate_order(symbol, position_side, token_price, leverage)
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "quantity": position_side,
+        }
+
+    def submit_order(self, order: dict) -> dict:
+        """Send the order, adding how long it took and if the connection was reused."""
+        connections = self._futures_connections()
+        started = time.perf_counter()
+        trade = self.client.futures_create_order(**order)
+        trade["requestTime"] = f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        if connections is None:
+            trade["connection"] = "unknown"
+        elif self._futures_connections() == connections:
+            trade["connection"] = "warm"
+        else:
+            trade["connection"] = "new (TCP+TLS setup included)"
+        return trade
 
     def create_leverage_trade(
         self, symbol: str, side: str, order_type: str, quantity: Decimal, leverage: int
     ) -> dict:
+        order = self.prepare_leverage_trade(
+            symbol, side, order_type, quantity, leverage
+        )
+        return self.submit_order(order)
+
+    def _futures_connections(self) -> int | None:
+        """Count connections opened so far to the futures api host.
+
+        Every pool of the host is counted, as the pool requests sends with
+        is keyed by TLS settings only found with version specific calls.
 
-        quantity = self.calculate_position_side(
-            symbol=symbol, money_to_spend=quantity, leverage=leverage
+        Returns:
+            int | None: Connections opened, None if they can not be counted
+        """
+        url = (
+            self.client.FUTURES_TESTNET_URL if self.testnet else self.client.FUTURES_URL
         )
-        trade = self.client.futures_create_order(
-            symbol=symbol,
-            side=side,
-            type=order_type,
-            quantity=quantity,
+        try:
+            host = urlsplit(url).hostname
+            pools = self.client.session.get_adapter(url).poolmanager.pools
+            return sum(
+                pools[key].num_connections
+                for key in pools.keys()
+                if key.key_host == host
+            )
+        except Exception:
+            # Only reported with the order, never in the way of sending it
+            return None
+
+    def ping(self) -> float:
+        """Ping the futures api to keep the connection open.
+
+        Returns:
+            float: Round trip in ms
+        """
+        started = time.perf_counter()
+        self.client.futures_ping()
+        return (time.perf_counter() - started) * 1000
+
+
+# Orders must not wait behind slower calls as balance updates
+BINANCE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="binance")
+
+
+class AsyncBinanceTrader(object):
+    """Async facade running BinanceTrader calls on a worker pool.
+
+    The python-binance client is synchronous, awaiting these methods keeps
+    the event loop, and so the UI, free while a request is in flight.
+    """
+
+    def __init__(
+        self, trader: BinanceTrader, executor: ThreadPoolExecutor = BINANCE_EXECUTOR
+    ) -> None:
+        """Initialize shared attributes"""
+        self.trader = trader
+        self.executor = executor
+
+    @classmethod
+    async def create(
+        cls, testnet: bool, executor: ThreadPoolExecutor = BINANCE_EXECUTOR
+    ) -> "AsyncBinanceTrader":
+        """Create the trader on the worker pool, as it already makes requests."""
+        loop = asyncio.get_running_loop()
+        trader = await loop.run_in_executor(executor, BinanceTrader, testnet)
+        return cls(trader, executor)
+
+    @property
+    def client(self) -> Client:
+        return self.trader.client
+
+    def get_streamed_price(self, symbol: str) -> Decimal | None:
+        """Get the streamed price usable by this trader, never requested."""
+        if self.trader.testnet:
+            return None
+        return LAST_PRICES.get(symbol)
+
+    def has_symbol(self, symbol: str) -> bool:
+        return symbol in self.trader.symbol_filters
+
+    def prepare_leverage_trade(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Decimal,
+        leverage: int,
+        token_price: Decimal,
+    ) -> dict:
+        """Build the order parameters locally, without a request."""
+        return self.trader.prepare_leverage_trade(
+            symbol, side, order_type, quantity, leverage, token_price
         )
-        return trade
+
+    async def _run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_futures_balance(self, symbol: str = "USDT") -> Decimal:
+        return await self._run(self.trader.get_futures_balance, symbol)
+
+    async def change_leverage(self, symbol: str, leverage: int) -> dict:
+        return await self._run(self.trader.change_leverage, symbol, leverage)
+
+    async def create_leverage_trade(
+        self, symbol: str, side: str, order_type: str, quantity: Decimal, leverage: int
+    ) -> dict:
+        return await self._run(
+            self.trader.create_leverage_trade,
+            symbol,
+            side,
+            order_type,
+            quantity,
+            leverage,
+        )
+
+    async def submit_order(self, order: dict) -> dict:
+        return await self._run(self.trader.submit_order, order)
+
+    async def ping(self) -> float:
+        return await self._run(self.trader.ping)
+
+    async def refresh_snapshots(self) -> None:
+        await self._run(self.trader.refresh_snapshots)
+
+
+class TraderPool(object):
+    """Mainnet and testnet traders, created once and kept warm."""
+
+    def __init__(self, executor: ThreadPoolExecutor = BINANCE_EXECUTOR) -> None:
+        """Initialize shared attributes"""
+        self.executor = executor
+        self._traders: dict[bool, AsyncBinanceTrader] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, testnet: bool) -> AsyncBinanceTrader:
+        """Get the trader, creating it on first use."""
+        async with self._lock:
+            if testnet not in self._traders:
+                self._traders[testnet] = await AsyncBinanceTrader.create(
+                    testnet, self.executor
+                )
+            return self._traders[testnet]
+
+    async def keep_warm(self) -> dict[bool, float]:
+        """Ping every trader so orders go out over open connections.
+
+        Returns:
+            dict[bool][float]: Round trip in ms by testnet flag
+        """
+        round_trips = {}
+        for testnet, trader in list(self._traders.items()):
+            try:
+                round_trips[testnet] = await trader.ping()
+            except REFRESH_ERRORS:
+                continue
+            await trader.refresh_snapshots()
+        return round_trips
+
+
+TRADER_POOL = TraderPool()
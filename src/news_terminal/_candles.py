@@ -0,0 +1,165 @@
+"""Module with rolling candles aggregated locally from the trade stream."""
+from array import array
+import math
+
+WINDOW_UNITS = {"s": 1, "m": 60, "h": 60 * 60}
+
+
+def parse_window(window: str) -> int:
+    """Get the seconds of a window written as "30s", "5m" or "1h"."""
+    return int(window[:-1]) * WINDOW_UNITS[window[-1]]
+
+
+def trade_price_at(trades: list[dict], second: int) -> float | None:
+    """Get the last price up to the second, or the first one after it.
+
+    Args:
+        trades (list[dict]): Aggregated trades from the api, oldest first
+        second (int): Exchange timestamp in seconds
+
+    Returns:
+        float | None: Price of the trade, None without trades
+    """
+    price = None
+    for trade in trades:
+        if trade["T"] // 1000 > second:
+            return float(trade["p"]) if price is None else price
+        price = float(trade["p"])
+    return price
+
+
+class WindowStats(object):
+    """Aggregated trades of one rolling window."""
+
+    def __init__(
+        self,
+        open_price: float = math.nan,
+        close_price: float = math.nan,
+        volume: float = 0.0,
+        quote_volume: float = 0.0,
+    ) -> None:
+        """Initialize shared attributes"""
+        self.open_price = open_price
+        self.close_price = close_price
+        self.volume = volume
+        self.quote_volume = quote_volume
+
+    @property
+    def change(self) -> float | None:
+        if math.isnan(self.open_price) or self.open_price == 0:
+            return None
+        return (self.close_price * 100 / self.open_price) - 100
+
+    @property
+    def vwap(self) -> float | None:
+        if not self.volume:
+            return None
+        return self.quote_volume / self.volume
+
+
+class RollingCandles(object):
+    """One second candles of a market in ring buffers of flat arrays.
+
+    The bucket of second s is at index s % size and is valid while times
+    holds s, so old seconds are overwritten without any cleanup. Seconds
+    are exchange timestamps, as received in trades and klines.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize shared attributes"""
+        self.size = size
+        self.times = array("q", [-1] * size)
+        self.opens = array("d", [0.0] * size)
+        self.closes = array("d", [0.0] * size)
+        self.volumes = array("d", [0.0] * size)
+        self.quote_volumes = array("d", [0.0] * size)
+        self.first_time: int | None = None
+        self.last_time = -1
+        self.last_price: float | None = None
+
+    def add_trade(self, second: int, price: float, quantity: float) -> None:
+        index = second % self.size
+        if self.times[index] != second:
+            self.times[index] = second
+            self.opens[index] = price
+            self.volumes[index] = 0.0
+            self.quote_volumes[index] = 0.0
+        self.closes[index] = price
+        self.volumes[index] += quantity
+        self.quote_volumes[index] += price * quantity
+        if second >= self.last_time:
+            self.last_time = second
+            self.last_price = price
+        if self.first_time is None or second < self.first_time:
+            self.first_time = second
+
+    def add_kline(self, kline: list) -> None:
+        """Seed the bucket at the open second of a REST kline.
+
+        Buckets already filled by live trades are kept.
+        """
+        second = int(kline[0]) // 1000
+        if second <= self.last_time - self.size:
+            return
+        index = second % self.size
+        if self.times[index] == second:
+            return
+        self.times[index] = second
+        self.opens[index] = float(kline[1])
+        self.closes[index] = float(kline[4])
+        self.volumes[index] = float(kline[5])
+        self.quote_volumes[index] = float(kline[7])
+        if second > self.last_time:
+            self.last_time = second
+            self.last_price = self.closes[index]
+        if self.first_time is None or second < self.first_time:
+            self.first_time = second
+
+    def window_stats(self, windows: list[int], now: int) -> list[WindowStats]:
+        """Aggregate every window ending at now in a single backwards pass.
+
+        Args:
+            windows (list[int]): Window lengths in seconds, shortest first
+            now (int): Last second of the windows
+
+        Returns:
+            list[WindowStats]: Stats of each window, empty when the buckets
+                do not reach back to the window start
+        """
+        stats = [WindowStats() for _ in windows]
+        close_price = self.price_at(now)
+        if close_price is None:
+            return stats
+        # Windows without trades keep the last price, a change of zero
+        open_price = close_price
+        volume = quote_volume = 0.0
+        window_index = 0
+        for age in range(min(windows[-1], self.size)):
+            second = now - age
+            index = second % self.size
+            if self.times[index] == second:
+                open_price = self.opens[index]
+                volume += self.volumes[index]
+                quote_volume += self.quote_volumes[index]
+            while window_index < len(windows) and age + 1 == windows[window_index]:
+                if self.first_time is not None and self.first_time <= second:
+                    stats[window_index] = WindowStats(
+                        open_price, close_price, volume, quote_volume
+                    )
+                window_index += 1
+        return stats
+
+    def price_at(self, second: int) -> float | None:
+        """Get the last price at the given second, None if out of the buffer."""
+        if self.first_time is None or second < self.first_time:
+            return None
+        if second <= self.last_time - self.size:
+            return None
+        # Walk back to the last bucket with trades
+        for age in range(self.size):
+            index = (second - age) % self.size
+            if self.times[index] == second - age:
+                return self.closes[index]
+            if second - age < self.first_time:
+                break
+        return None
@@ -0,0 +1,101 @@
+"""Module with the compact streamed state of many markets."""
+from array import array
+import math
+
+STATE_INTERVALS = ("1m", "5m", "15m")
+
+
+def parse_pair(pair: str) -> tuple[str, str]:
+    """Get the stream market and exchange of an action title.
+
+    Args:
+        pair (str): Action title as "BTCUSDT PERP" or "BTC/USDT"
+
+    Returns:
+        tuple[str, str]: Market and exchange names used by the streams
+    """
+    if pair.endswith("PERP"):
+        return pair[:-5].lower(), "binance.com-futures"
+    return pair.replace("/", "").lower(), "binance.com"
+
+
+def format_price(price: float) -> str:
+    """Format a price with up to 8 decimals and no trailing zeros."""
+    return f"{price:.8f}".rstrip("0").rstrip(".")
+
+
+class MarketState(object):
+    """Last trade price and kline change of many markets in flat arrays.
+
+    Every market owns a slot, its price is at index slot of prices and the
+    kline of interval i at index slot * len(intervals) + i of opens and
+    closes. Slots of removed markets are cleared and reused, missing values
+    are nan.
+    """
+
+    def __init__(self, intervals: tuple[str, ...] = STATE_INTERVALS) -> None:
+        """Initialize shared attributes"""
+        self.intervals = intervals
+        self._interval_index = {interval: i for i, interval in enumerate(intervals)}
+        self.slots: dict[tuple[str, str], int] = {}
+        self._free_slots: list[int] = []
+        self.prices = array("d")
+        self.opens = array("d")
+        self.closes = array("d")
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self.slots
+
+    def add(self, key: tuple[str, str]) -> int:
+        """Get the slot of the (market, exchange) key, adding it if missing."""
+        slot = self.slots.get(key)
+        if slot is not None:
+            return slot
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self.prices)
+            self.prices.append(math.nan)
+            self.opens.extend([math.nan] * len(self.intervals))
+            self.closes.extend([math.nan] * len(self.intervals))
+        self.slots[key] = slot
+        return slot
+
+    def remove(self, key: tuple[str, str]) -> None:
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return
+        self.prices[slot] = math.nan
+        start = slot * len(self.intervals)
+        for index in range(start, start + len(self.intervals)):
+            self.opens[index] = math.nan
+            self.closes[index] = math.nan
+        self._free_slots.append(slot)
+
+    def update_trade(self, slot: int, price: str) -> None:
+        self.prices[slot] = float(price)
+
+    def update_kline(
+        self, slot: int, interval: str, open_price: str, close_price: str
+    ) -> None:
+        interval_index = self._interval_index.get(interval)
+        if interval_index is None:
+            return
+        index = slot * len(self.intervals) + interval_index
+        self.opens[index] = float(open_price)
+        self.closes[index] = float(close_price)
+
+    def get_price(self, slot: int) -> float | None:
+        price = self.prices[slot]
+        return None if math.isnan(price) else price
+
+    def get_change(self, slot: int, interval: str) -> float | None:
+        """Get the percent change of the current kline, None until received."""
+        index = slot * len(self.intervals) + self._interval_index[interval]
+        open_price = self.opens[index]
+        if math.isnan(open_price) or open_price == 0:
+            return None
+        return (self.closes[index] * 100 / open_price) - 100
@@ -0,0 +1,127 @@
+"""Module with the cached market universe used to resolve coins into actions."""
+import asyncio
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.exceptions import RequestException
+
+from news_terminal._binance_data import (
+    get_futures_symbols,
+    get_spot_symbols,
+    join_actions_data,
+    parse_symbol_filters,
+)
+from news_terminal.config import CACHE_DIR, MARKET_UNIVERSE_TTL
+
+SNAPSHOT_VERSION = 2
+
+REFRESH_ERRORS = (BinanceAPIException, BinanceRequestException, RequestException)
+
+
+def read_snapshot(path: Path, version: int) -> dict | None:
+    """Read a snapshot written by write_snapshot, None if missing or outdated."""
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != version:
+        return None
+    return snapshot
+
+
+def write_snapshot(path: Path, version: int, **data) -> None:
+    """Write the data to disk, replacing the previous snapshot atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    temp_path.write_text(json.dumps({"version": version, **data}))
+    os.replace(temp_path, path)
+
+
+class MarketUniverse(object):
+    """Ticker actions and futures symbol filters backed by an on-disk snapshot.
+
+    The snapshot is read on first access so startup never waits on the network,
+    a refresh rebuilds both tables from the exchange and swaps them in at once.
+    """
+
+    def __init__(self, path: Path, ttl: float) -> None:
+        """Initialize shared attributes"""
+        self.path = path
+        self.ttl = ttl
+        self.updated = 0.0
+        self._tables: tuple[dict, dict] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def actions(self) -> dict[str, list[dict]]:
+        """Current ticker to actions table, loaded from the snapshot if needed."""
+        return self._get_tables()[0]
+
+    @property
+    def futures_filters(self) -> dict[str, dict]:
+        """Current futures symbol filters, see parse_symbol_filters."""
+        return self._get_tables()[1]
+
+    def _get_tables(self) -> tuple[dict, dict]:
+        if self._tables is None:
+            self.load()
+        return self._tables  # type: ignore
+
+    def get_actions(self, ticker: str) -> list[dict]:
+        """Get the actions of the given ticker, empty if unknown."""
+        return self.actions.get(ticker, [])
+
+    def is_stale(self) -> bool:
+        return time.time() - self.updated > self.ttl
+
+    def load(self) -> None:
+        """Load the last snapshot from disk, keeping empty tables on failure."""
+        self._tables = ({}, {})
+        snapshot = read_snapshot(self.path, SNAPSHOT_VERSION)
+        if snapshot is None:
+            return
+        self.updated = snapshot["updated"]
+        self._tables = (snapshot["actions"], snapshot["futures_filters"])
+
+    def fetch(self, force: bool = False) -> bool:
+        """Rebuild the tables from the exchange if the snapshot is stale.
+
+        Blocking, use refresh from the event loop.
+
+        Returns:
+            bool: True if new tables were swapped in
+        """
+        with self._lock:
+            if not force and self.actions and not self.is_stale():
+                return False
+            try:
+                futures_symbols = get_futures_symbols()
+                spot_symbols = get_spot_symbols()
+            except REFRESH_ERRORS as e:
+                # Keep working from the last snapshot when offline
+                print(f"Market universe refresh failed: {e}")
+                return False
+            actions = join_actions_data(spot_symbols, futures_symbols)
+            self._tables = (actions, parse_symbol_filters(futures_symbols))
+            self.updated = time.time()
+            write_snapshot(
+                self.path,
+                SNAPSHOT_VERSION,
+                updated=self.updated,
+                actions=actions,
+                futures_filters=self._tables[1],
+            )
+            return True
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Rebuild the tables in a thread if the snapshot is stale."""
+        return await asyncio.to_thread(self.fetch, force)
+
+
+MARKET_UNIVERSE = MarketUniverse(
+    Path(CACHE_DIR) / "market_universe.json", MARKET_UNIVERSE_TTL
+)
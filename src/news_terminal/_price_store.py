@@ -0,0 +1,28 @@
+"""Module with the last traded prices shared by market data and trading."""
+from decimal import Decimal
+import time
+
+from news_terminal.config import PRICE_MAX_AGE
+
+
+class LastPriceStore(object):
+    """Last traded price per futures symbol, fed by the trade stream."""
+
+    def __init__(self, max_age: float = PRICE_MAX_AGE) -> None:
+        """Initialize shared attributes"""
+        self.max_age = max_age
+        self._prices: dict[str, tuple[str, float]] = {}
+
+    def update(self, symbol: str, price: str) -> None:
+        """Store the price as received, it is only parsed when read."""
+        self._prices[symbol.upper()] = (price, time.monotonic())
+
+    def get(self, symbol: str) -> Decimal | None:
+        """Get the last price of the symbol, None if missing or stale."""
+        entry = self._prices.get(symbol.upper())
+        if entry is None or time.monotonic() - entry[1] > self.max_age:
+            return None
+        return Decimal(entry[0])
+
+
+LAST_PRICES = LastPriceStore()
@@ -0,0 +1,212 @@
+"""Module with the recorder of price reactions to headlines."""
+from array import array
+import json
+import math
+from pathlib import Path
+from statistics import median
+import sys
+
+from news_terminal.config import CACHE_DIR
+
+PRE_SECONDS = 5
+POST_SECONDS = 5 * 60
+SAMPLES = PRE_SECONDS + 1 + POST_SECONDS
+
+
+class Recording(object):
+    """Last price at each second from PRE_SECONDS before the headline."""
+
+    __slots__ = ("source", "symbol", "headline_time", "prices")
+
+    def __init__(self, source: str, symbol: str, headline_time: int) -> None:
+        """Initialize shared attributes"""
+        self.source = source
+        self.symbol = symbol
+        self.headline_time = headline_time
+        self.prices = array("d", [math.nan] * SAMPLES)
+
+    @property
+    def end_time(self) -> int:
+        return self.headline_time + POST_SECONDS
+
+    def add_trade(self, second: int, price: float) -> None:
+        offset = second - self.headline_time + PRE_SECONDS
+        if 0 <= offset < SAMPLES:
+            self.prices[offset] = price
+
+    def seed(self, trades: list[dict]) -> None:
+        """Fill the seconds missed before the stream started.
+
+        Args:
+            trades (list[dict]): Aggregated trades from the api, oldest first
+        """
+        past_prices = {}
+        for trade in trades:
+            past_prices[trade["T"] // 1000] = float(trade["p"])
+        for second, price in past_prices.items():
+            offset = second - self.headline_time + PRE_SECONDS
+            if 0 <= offset < SAMPLES and math.isnan(self.prices[offset]):
+                self.prices[offset] = price
+
+    def fill_gaps(self) -> None:
+        """Carry the last price over the seconds without trades."""
+        last_price = math.nan
+        for offset, price in enumerate(self.prices):
+            if math.isnan(price):
+                self.prices[offset] = last_price
+            else:
+                last_price = price
+
+
+class ReactionStore(object):
+    """Recorded price paths kept in columns, one row per headline.
+
+    The path of row i is prices[i * SAMPLES:(i + 1) * SAMPLES]. Rows are
+    appended to a binary file of doubles and a JSON lines file with the
+    source, symbol and time of each headline.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize shared attributes"""
+        self.path = path
+        self.sources: list[str] = []
+        self.symbols: list[str] = []
+        self.times = array("q")
+        self.prices = array("d")
+        self._loaded = False
+        self._summary: tuple[int, list[tuple]] = (0, [])
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self.sources)
+
+    def load(self) -> None:
+        """Read the rows recorded by previous sessions once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            lines = self.path.with_suffix(".jsonl").read_text().splitlines()
+            prices = array("d")
+            prices.frombytes(self.path.with_suffix(".bin").read_bytes())
+        except (OSError, ValueError):
+            return
+        rows = min(len(lines), len(prices) // SAMPLES)
+        for line in lines[:rows]:
+            row = json.loads(line)
+            self.sources.append(sys.intern(row["source"]))
+            self.symbols.append(row["symbol"])
+            self.times.append(row["time"])
+        self.prices.extend(prices[: rows * SAMPLES])
+
+    def append(self, recording: Recording) -> None:
+        self.load()
+        self.sources.append(sys.intern(recording.source))
+        self.symbols.append(recording.symbol)
+        self.times.append(recording.headline_time)
+        self.prices.extend(recording.prices)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.with_suffix(".bin").open("ab") as prices_file:
+            recording.prices.tofile(prices_file)
+        with self.path.with_suffix(".jsonl").open("a") as rows_file:
+            row = {
+                "source": recording.source,
+                "symbol": recording.symbol,
+                "time": recording.headline_time,
+            }
+            rows_file.write(f"{json.dumps(row)}\n")
+
+    def summary(self) -> list[tuple]:
+        """Summarize the reactions of each source, cached until a row is added.
+
+        Returns:
+            list[tuple]: Source, headlines, median absolute peak move in %,
+                median seconds to the peak and median move after 1 and 5 minutes
+        """
+        if self._summary[0] == len(self):
+            return self._summary[1]
+        reactions: dict[str, list[tuple[float, int, float, float]]] = {}
+        for row, source in enumerate(self.sources):
+            start = row * SAMPLES
+            base_price = self.prices[start + PRE_SECONDS]
+            if math.isnan(base_price) or base_price == 0:
+                continue
+            peak_move, peak_time = 0.0, 0
+            for second in range(1, POST_SECONDS + 1):
+                move = self.prices[start + PRE_SECONDS + second] * 100 / base_price
+                move -= 100
+                if abs(move) > abs(peak_move):
+                    peak_move, peak_time = move, second
+            minute_move = self.prices[start + PRE_SECONDS + 60] * 100 / base_price
+            end_move = self.prices[start + SAMPLES - 1] * 100 / base_price
+            reactions.setdefault(source, []).append(
+                (abs(peak_move), peak_time, minute_move - 100, end_move - 100)
+            )
+        summary = []
+        for source, rows in sorted(reactions.items(), key=lambda item: -len(item[1])):
+            summary.append(
+                (
+                    source,
+                    len(rows),
+                    median(row[0] for row in rows),
+                    median(row[1] for row in rows),
+                    median(row[2] for row in rows),
+                    median(row[3] for row in rows),
+                )
+            )
+        self._summary = (len(self), summary)
+        return summary
+
+
+class ReactionRecorder(object):
+    """Recordings in progress, fed by the trades of their markets."""
+
+    def __init__(self, store: ReactionStore, max_active: int) -> None:
+        """Initialize shared attributes"""
+        self.store = store
+        self.max_active = max_active
+        self.recordings: dict[tuple[str, str], list[Recording]] = {}
+        self._active = 0
+
+    def start(
+        self, key: tuple[str, str], source: str, headline_time: int
+    ) -> Recording | None:
+        """Start recording the (market, exchange) key around the headline.
+
+        Returns:
+            Recording | None: None if it is recorded already or too many are active
+        """
+        recordings = self.recordings.get(key, [])
+        if any(recording.headline_time == headline_time for recording in recordings):
+            return None
+        if self._active >= self.max_active:
+            return None
+        recording = Recording(source, key[0].upper(), headline_time)
+        self.recordings.setdefault(key, []).append(recording)
+        self._active += 1
+        return recording
+
+    def add_trade(self, key: tuple[str, str], second: int, price: float) -> None:
+        for recording in self.recordings.get(key, ()):
+            recording.add_trade(second, price)
+
+    def finish_expired(self, now: int) -> list[tuple[str, str]]:
+        """Store the recordings past their end.
+
+        Returns:
+            list[tuple[str, str]]: Keys without recordings left
+        """
+        finished_keys = []
+        for key, recordings in list(self.recordings.items()):
+            for recording in [r for r in recordings if r.end_time < now]:
+                recordings.remove(recording)
+                self._active -= 1
+                recording.fill_gaps()
+                self.store.append(recording)
+            if not recordings:
+                del self.recordings[key]
+                finished_keys.append(key)
+        return finished_keys
+
+
+REACTIONS = ReactionStore(Path(CACHE_DIR) / "reactions")
@@ -0,0 +1,136 @@
+"""Module with a multi pattern index to find tickers in headline text."""
+from collections import deque
+from typing import Iterable, Iterator
+
+from news_terminal._market_universe import MARKET_UNIVERSE
+from news_terminal.config import SYMBOL_ALIASES
+
+TICKER = 1
+ALIAS = 2
+CASHTAG = 3
+
+
+def parse_aliases(aliases: list[str]) -> dict[str, str]:
+    """Parse "name:TICKER" items into a lowercase name to ticker dict."""
+    parsed = {}
+    for alias in aliases:
+        name, _, ticker = alias.rpartition(":")
+        if name and ticker:
+            parsed[name.strip().lower()] = ticker.strip().upper()
+    return parsed
+
+
+def lower_aligned(text: str) -> str:
+    """Lowercase the text, keeping every character at its position."""
+    lower_text = text.lower()
+    if len(lower_text) == len(text):
+        return lower_text
+    # A few characters as "İ" lowercase to two, those are kept as they are
+    return "".join(lower if len(lower := char.lower()) == 1 else char for char in text)
+
+
+class SymbolIndex(object):
+    """Aho-Corasick automaton over tickers, $cashtags and project names.
+
+    Patterns are matched on the lowercased text in a single pass, bare
+    tickers must also be written in upper case to count. Build swaps in a
+    new automaton at once so a scan never sees a half built one, and does
+    nothing if the tickers did not change.
+    """
+
+    def __init__(self, aliases: dict[str, str]) -> None:
+        """Initialize shared attributes"""
+        self.aliases = aliases
+        self._automaton: tuple[list, list, list] | None = None
+        self._tickers: frozenset[str] = frozenset()
+
+    def build(self, tickers: Iterable[str]) -> None:
+        """Build the automaton for the given tickers and their aliases."""
+        tickers = frozenset(tickers)
+        if self._automaton is not None and tickers == self._tickers:
+            return
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[tuple[int, str, int]]] = [[]]
+
+        def add(pattern: str, symbol: str, kind: int) -> None:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((len(pattern), symbol, kind))
+
+        for ticker in tickers:
+            add(ticker.lower(), ticker, TICKER)
+            add(f"${ticker.lower()}", ticker, CASHTAG)
+        for name, ticker in self.aliases.items():
+            if ticker in tickers:
+                add(name, ticker, ALIAS)
+
+        # Breadth first so the fail state of a parent is known first
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+        self._automaton = (goto, fail, outputs)
+        self._tickers = tickers
+
+    def scan(self, text: str) -> Iterator[tuple[int, str, int]]:
+        """Find every pattern in the text.
+
+        Yields:
+            tuple[int, str, int]: Start position, ticker and kind of the match
+        """
+        if self._automaton is None:
+            self.build(MARKET_UNIVERSE.actions)
+        goto, fail, outputs = self._automaton  # type: ignore
+        lower_text = lower_aligned(text)
+        state = 0
+        for end, char in enumerate(lower_text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, symbol, kind in outputs[state]:
+                start = end - length
+                # Only whole words, as in "ETH," but not in "METHOD"
+                if start and lower_text[start - 1].isalnum():
+                    continue
+                if end < len(text) and lower_text[end].isalnum():
+                    continue
+                if kind == TICKER and not text[start:end].isupper():
+                    continue
+                yield start, symbol, kind
+
+    def rank(self, title: str, body: str = "") -> list[str]:
+        """Get the tickers found in a headline, most relevant first.
+
+        Cashtags weigh more than project names and both more than bare
+        tickers, which are ignored in titles written in upper case.
+        Matches in the title count twice.
+        """
+        scores: dict[str, float] = {}
+        first_seen: dict[str, int] = {}
+        shouting = title.isupper()
+        position = 0
+        for text, weight in ((title, 2), (body, 1)):
+            for start, symbol, kind in self.scan(text):
+                if kind == TICKER and shouting and weight == 2:
+                    continue
+                scores[symbol] = scores.get(symbol, 0) + kind * weight
+                first_seen.setdefault(symbol, position + start)
+            position += len(text) + 1
+        return sorted(scores, key=lambda symbol: (-scores[symbol], first_seen[symbol]))
+
+
+SYMBOL_INDEX = SymbolIndex(parse_aliases(SYMBOL_ALIASES))
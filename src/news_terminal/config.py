@@ -1,4 +1,6 @@
-from decouple import config
+from pathlib import Path
+
+from decouple import Csv, config
 
 TWITTER_BEARER_TOKEN = config("TWITTER_BEARER_TOKEN")
 
@@ -7,3 +9,46 @@ BINANCE_SECRET = config("BINANCE_SECRET")
 
 BINANCE_KEY_TEST = config("BINANCE_KEY_TEST")
 BINANCE_SECRET_TEST = config("BINANCE_SECRET_TEST")
+
+CACHE_DIR = config(
+    "NEWS_TERMINAL_CACHE_DIR", default=str(Path.home() / ".cache" / "news_terminal")
+)
+MARKET_UNIVERSE_TTL = config("MARKET_UNIVERSE_TTL", default=6 * 60 * 60, cast=float)
+
+NEWS_FEEDS = config("NEWS_FEEDS", default="news.treeofalpha.com/ws", cast=Csv())
+NEWS_FEED_CONNECTIONS = config("NEWS_FEED_CONNECTIONS", default=1, cast=int)
+NEWS_HISTORY = config("NEWS_HISTORY", default=5000, cast=int)
+
+# Raw messages kept for the news log, rendered only while it is shown
+NEWS_LOG_SIZE = config("NEWS_LOG_SIZE", default=2000, cast=int)
+
+# Seconds a streamed price can be used to size orders before asking the api
+PRICE_MAX_AGE = config("PRICE_MAX_AGE", default=2.0, cast=float)
+
+# Seconds between pings keeping the Binance connections open
+BINANCE_KEEPALIVE = config("BINANCE_KEEPALIVE", default=20.0, cast=float)
+
+# Maximum price tracker redraws per second, updates in between are coalesced
+PRICE_REDRAW_RATE = config("PRICE_REDRAW_RATE", default=30, cast=int)
+
+# Pairs watched from startup as "BTCUSDT PERP" or "BTC/USDT", all share one stream
+WATCHLIST = config("WATCHLIST", default="", cast=Csv())
+WATCHLIST_SIZE = config("WATCHLIST_SIZE", default=50, cast=int)
+
+# Rolling windows computed from the trade stream, as "30s", "5m" or "1h"
+CANDLE_WINDOWS = config("CANDLE_WINDOWS", default="1m,5m,15m", cast=Csv())
+
+# Headlines recorded at once, each keeps its market streamed for 5 minutes
+REACTION_MAX_ACTIVE = config("REACTION_MAX_ACTIVE", default=20, cast=int)
+
+# Project names found in headlines as "name:TICKER", matched ignoring case
+SYMBOL_ALIASES = config(
+    "SYMBOL_ALIASES",
+    default=(
+        "bitcoin:BTC,ethereum:ETH,ether:ETH,solana:SOL,ripple:XRP,dogecoin:DOGE,"
+        "cardano:ADA,polkadot:DOT,chainlink:LINK,avalanche:AVAX,polygon:MATIC,"
+        "litecoin:LTC,arbitrum:ARB,optimism:OP,uniswap:UNI,aptos:APT,tron:TRX,"
+        "shiba inu:SHIB,pepe:PEPE,cosmos:ATOM,filecoin:FIL,near protocol:NEAR"
+    ),
+    cast=Csv(),
+)
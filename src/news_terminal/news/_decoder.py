@@ -0,0 +1,23 @@
+"""Module with the JSON decoder of the news feeds.
+
+orjson is used when it is installed, the standard library otherwise.
+Both take str and bytes payloads, and raise ValueError on invalid ones.
+"""
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Key of the received payload carried by a decoded message until it is logged
+RAW_KEY = "_raw_payload"
+
+DECODERS: dict[str, Callable[[str | bytes], Any]] = {"json": json.loads}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+# Fastest decoder available
+DECODER_NAME = "orjson" if orjson is not None else "json"
+decode = DECODERS[DECODER_NAME]
@@ -0,0 +1,71 @@
+"""Module with first-arrival deduplication for redundant news connections."""
+from collections import Counter, OrderedDict, defaultdict, deque
+import hashlib
+from statistics import median
+import time
+
+CONTENT_FIELDS = ("en", "title", "body", "url", "link")
+
+
+def message_key(news_message: dict) -> str:
+    """Get the identity of a news message, hashing its content if it has no id."""
+    _id = news_message.get("_id") or news_message.get("tree_id")
+    if _id:
+        return f"id:{_id}"
+    content = "\x1f".join(str(news_message.get(field, "")) for field in CONTENT_FIELDS)
+    return f"hash:{hashlib.blake2b(content.encode(), digest_size=16).hexdigest()}"
+
+
+class FirstArrivalFilter(object):
+    """Forward the first copy of every message and drop later duplicates.
+
+    Seen keys are kept in insertion order and evicted oldest first, so lookups
+    stay O(1) and memory bounded by max_items.
+    """
+
+    def __init__(self, max_items: int = 4096, max_results: int = 1000) -> None:
+        """Initialize shared attributes"""
+        self.max_items = max_items
+        self.wins = Counter()
+        self.duplicates = 0
+        self.results: deque[tuple[str, str, str, float]] = deque(maxlen=max_results)
+        self._leads: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=max_results)
+        )
+        self._seen: OrderedDict[str, tuple[str, int]] = OrderedDict()
+
+    def accept(self, news_message: dict, connection: str) -> bool:
+        """Check if the message is the first copy, recording who won otherwise.
+
+        Args:
+            news_message (dict): Decoded message
+            connection (str): Name of the connection that received it
+
+        Returns:
+            bool: True if the message must be forwarded
+        """
+        key = message_key(news_message)
+        now = time.perf_counter_ns()
+        first = self._seen.get(key)
+        if first is None:
+            self._seen[key] = (connection, now)
+            if len(self._seen) > self.max_items:
+                self._seen.popitem(last=False)
+            self.wins[connection] += 1
+            return True
+
+        self.duplicates += 1
+        winner, arrival = first
+        if winner != connection:
+            lead_ms = (now - arrival) / 1e6
+            self._leads[winner].append(lead_ms)
+            self.results.append((key, winner, connection, lead_ms))
+        return False
+
+    def summary(self) -> str:
+        wins = []
+        for connection, count in self.wins.most_common():
+            leads = self._leads[connection]
+            lead = f" (+{median(leads):.1f}ms)" if leads else ""
+            wins.append(f"{connection} {count}{lead}")
+        return f"First arrivals: {', '.join(wins) or '-'} | dropped {self.duplicates}"
@@ -0,0 +1,98 @@
+"""Module to format news messages for display."""
+from datetime import datetime
+import re
+
+from news_terminal._symbol_index import SYMBOL_INDEX
+from news_terminal.news.data_format import NewsData, RenderedNews
+
+# Quotes as [@user] break the markup, links are turned into click actions
+_QUOTE_PATTERN = re.compile(r"\[@(\w+)\]")
+_URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+(?<![\!)\]])")
+_DOMAIN_PATTERN = re.compile(r"[\w\.]+")
+_ENCLOSING_PATTERN = re.compile(r"[{}|^[\]`]")
+
+
+def _replace_url(match: re.Match) -> str:
+    """Replace a matched url with a click action."""
+    # Remove enclosings
+    url = _ENCLOSING_PATTERN.sub("", match.group())
+    return f'[@click=app.open_link("{url}")]{_nice_link_format(url)}[/]'
+
+
+def _nice_link_format(url: str) -> str:
+    """Format the link text to a better display"""
+    start = url.find("://")
+    while start != -1:
+        domain_match = _DOMAIN_PATTERN.match(url, start + 3)
+        if domain_match:
+            end = domain_match.end()
+            if end == len(url) or url[end] == "/":
+                return f"{domain_match.group()}/..."
+        start = url.find("://", start + 3)
+    return "Link"
+
+
+def _format_text(text: str) -> str:
+    """Remove quotes, then add click actions to links.
+
+    Quotes go first since they can be part of a link, most texts have none
+    so their pass is skipped.
+    """
+    if "[@" in text:
+        text = _QUOTE_PATTERN.sub(r"@\1", text)
+    return _URL_PATTERN.sub(_replace_url, text)
+
+
+def format_news_data(news_message: dict) -> NewsData:
+    """Format data from Tree Of Alpha."""
+
+    _title = news_message.get("en", news_message.get("title", ""))
+    _link = news_message.get("url", news_message.get("link", ""))
+    _body = news_message.get("body", "")
+    _source = news_message.get("source", news_message.get("type", ""))
+    _time = datetime.fromtimestamp(news_message["time"] / 1000)
+    _coin = news_message.get("coin", "")
+    _id = news_message["_id"]
+    _actions = news_message.get("actions", [])
+
+    if not _coin and _actions:
+        _coin = _actions[-1]["title"].split("/")[0]
+
+    if news_message.get("type", None) == "direct":
+        _source = "tree-twitter"
+
+    if _source.lower() == "blogs":
+        title_split = _title.split(":")
+        _title = title_split[0].strip()
+        _body = "".join(title_split[1:]).strip()
+
+    # Tickers named in the text, for items without coin or actions
+    _symbols = SYMBOL_INDEX.rank(_title, _body)
+    if not _coin and _symbols:
+        _coin = _symbols[0]
+
+    return NewsData(
+        title=_title,
+        link=_link,
+        body=_body,
+        source=_source,
+        time=_time,
+        coin=_coin,
+        tree_id=_id,
+        actions=_actions,
+        symbols=_symbols,
+    )
+
+
+def format_news_message(news_message: NewsData) -> RenderedNews:
+    """Build the markup of a headline, use NewsData.rendered to cache it."""
+    _title = _format_text(news_message.title)
+    _body = _format_text(news_message.body) if news_message.body else ""
+
+    _link = news_message.link
+    if _link:
+        _link = f'[@click=app.open_link("{_link}")]{_nice_link_format(_link)}[/]'
+
+    _coin = f"Coin: {news_message.coin}" if news_message.coin else ""
+
+    return RenderedNews(title=_title, body=_body, link=_link, coin=_coin)
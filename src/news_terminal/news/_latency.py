@@ -0,0 +1,98 @@
+"""Module with per stage latency measurements of the news path."""
+from collections import defaultdict, deque
+import csv
+import math
+from pathlib import Path
+import time
+
+# Key of the trace carried by a decoded message until it is dequeued
+TRACE_KEY = "_latency_trace"
+
+PERCENTILES = (50, 99)
+
+
+class LatencyTrace(object):
+    """Monotonic timestamps of one message at every stage it went through."""
+
+    __slots__ = ("published", "received", "stamps")
+
+    def __init__(self, published: float | None = None) -> None:
+        """Initialize shared attributes
+
+        Args:
+            published (float | None): Publication time of the message in ms
+        """
+        self.published = published
+        self.received = time.time()
+        self.stamps = [("receive", time.perf_counter_ns())]
+
+    def stamp(self, stage: str) -> None:
+        """Record that the stage just finished."""
+        self.stamps.append((stage, time.perf_counter_ns()))
+
+    def durations(self) -> dict[str, float]:
+        """Get the ms spent in each stage, "total" from receive to the last."""
+        durations = {}
+        if self.published:
+            # Wall clock, so it includes the clock offset with the feed
+            durations["feed"] = self.received * 1000 - self.published
+        for (_, start), (stage, end) in zip(self.stamps, self.stamps[1:]):
+            durations[stage] = (end - start) / 1e6
+        durations["total"] = (self.stamps[-1][1] - self.stamps[0][1]) / 1e6
+        return durations
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Get the nearest rank percentile of already sorted values."""
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class LatencyStats(object):
+    """Rolling latency samples of every stage, per news source."""
+
+    def __init__(self, max_samples: int = 1000) -> None:
+        """Initialize shared attributes"""
+        self.max_samples = max_samples
+        self.samples: defaultdict[str, dict[str, deque[float]]] = defaultdict(dict)
+        self.count = 0
+
+    def record(self, trace: LatencyTrace, source: str) -> None:
+        stages = self.samples[source]
+        for stage, duration in trace.durations().items():
+            if stage not in stages:
+                stages[stage] = deque(maxlen=self.max_samples)
+            stages[stage].append(duration)
+        self.count += 1
+
+    def summary(self) -> list[tuple[str, str, int, float, float, float]]:
+        """Get the p50, p99 and max of every stage.
+
+        Returns:
+            list[tuple]: Source, stage, samples, p50, p99 and max in ms
+        """
+        rows = []
+        for source, stages in sorted(self.samples.items()):
+            for stage, samples in stages.items():
+                values = sorted(samples)
+                rows.append(
+                    (
+                        source,
+                        stage,
+                        len(values),
+                        *(percentile(values, percent) for percent in PERCENTILES),
+                        values[-1],
+                    )
+                )
+        return rows
+
+    def export(self, path: Path) -> None:
+        """Write the summary as CSV, one row per source and stage."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", newline="") as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow(("source", "stage", "samples", "p50", "p99", "max"))
+            writer.writerows(self.summary())
+
+
+NEWS_LATENCY = LatencyStats()
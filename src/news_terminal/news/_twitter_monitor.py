@@ -1,23 +1,94 @@
 """Module with class to monitor twitter."""
+import asyncio
 from asyncio import Queue
+import time
 
-from tweepy import Tweet, StreamRule
+from aiohttp import ClientError, ClientSession
+from tweepy import StreamResponse, StreamRule
+from tweepy.errors import TweepyException
 from tweepy.asynchronous.client import AsyncClient
 from tweepy.asynchronous.streaming import AsyncStreamingClient
 
 from news_terminal.config import TWITTER_BEARER_TOKEN
 
+AUTHOR_TTL = 6 * 60 * 60
+
+
+class AuthorCache(object):
+    """Author names by author id, so known authors need no lookup per tweet."""
+
+    def __init__(self, client: AsyncClient, ttl: float = AUTHOR_TTL) -> None:
+        """Initialize shared attributes"""
+        self.client = client
+        self.ttl = ttl
+        self._names: dict[int, tuple[str, float]] = {}
+
+    def get(self, author_id: int) -> str | None:
+        entry = self._names.get(author_id)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return entry[0]
+
+    def put(self, author_id: int, name: str) -> None:
+        self._names[author_id] = (name, time.monotonic() + self.ttl)
+
+    async def fetch(self, author_id: int) -> str:
+        """Get the author name, asking the api only if it is not cached."""
+        name = self.get(author_id)
+        if name is None:
+            user = await self.client.get_user(id=author_id)
+            name = user.data.name  # type: ignore
+            self.put(author_id, name)
+        return name
+
+    async def warm(self, usernames: list[str]) -> None:
+        """Cache the given users, up to 100 per request."""
+        for start in range(0, len(usernames), 100):
+            users = await self.client.get_users(
+                usernames=usernames[start : start + 100]
+            )
+            for user in users.data or []:  # type: ignore
+                self.put(user.id, user.name)
+
+    def evict_expired(self) -> None:
+        now = time.monotonic()
+        for author_id, (_, expires) in list(self._names.items()):
+            if expires < now:
+                del self._names[author_id]
+
+    async def warm_tracked_users(self) -> None:
+        """Cache the users tracked by the stream rules."""
+        try:
+            await self.warm(list(await get_current_rules()))
+        except (ClientError, TweepyException) as e:
+            print(f"Author cache refresh failed: {e}")
+
+    async def keep_warm(self, interval: float) -> None:
+        """Evict expired authors and refresh the tracked users forever."""
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_expired()
+            await self.warm_tracked_users()
+
 
 class NewsStream(AsyncStreamingClient):
-    def __init__(self, bearer_token, client: AsyncClient, tweet_queue: Queue, **kwargs):
+    def __init__(
+        self, bearer_token, authors: AuthorCache, tweet_queue: Queue, **kwargs
+    ):
         super().__init__(bearer_token, **kwargs)
         self.tweet_queue = tweet_queue
-        self.client = client
+        self.authors = authors
+
+    async def on_response(self, response: StreamResponse) -> None:
+        tweet = response.data
+        if tweet is None:
+            return
+        # Authors come with the payload through the author_id expansion
+        for user in response.includes.get("users", []):
+            self.authors.put(user.id, user.name)
 
-    async def on_tweet(self, tweet: Tweet) -> None:
         data = {}
-        _title = await self.client.get_user(id=tweet.author_id)
-        data["title"] = _title.data.name  # type: ignore
+        data["title"] = await self.authors.fetch(tweet.author_id)
         data["body"] = tweet.text
         data["link"] = f"https://twitter.com/twitter/statuses/{tweet.id}"
         data["source"] = "terminal-twitter"
@@ -26,35 +97,84 @@ class NewsStream(AsyncStreamingClient):
         await self.tweet_queue.put(data)
 
 
-async def subscribe_to_news_stream(news_queue: Queue):
+async def subscribe_to_news_stream(news_queue: Queue) -> None:
     twitter_client = AsyncClient(bearer_token=TWITTER_BEARER_TOKEN)
-    news_stream = NewsStream(TWITTER_BEARER_TOKEN, twitter_client, news_queue)
-    news_stream.filter(tweet_fields=["author_id", "created_at"])
+    authors = AuthorCache(twitter_client)
+    await authors.warm_tracked_users()
+    news_stream = NewsStream(TWITTER_BEARER_TOKEN, authors, news_queue)
+    news_stream.filter(
+        expansions=["author_id"],
+        tweet_fields=["author_id", "created_at"],
+        user_fields=["name"],
+    )
+    await authors.keep_warm(authors.ttl / 2)
+
+
+class TrackedUsers(object):
+    """Stream rules tracking users, kept locally after the first fetch.
+
+    A single client is reused with a long-lived HTTP session, add and remove
+    update the local rules directly instead of fetching them again.
+    """
+
+    def __init__(self, bearer_token: str) -> None:
+        """Initialize shared attributes"""
+        self.client = AsyncStreamingClient(bearer_token)
+        self._rules: dict[str, int] | None = None
+
+    def _ensure_session(self) -> None:
+        if self.client.session is None or self.client.session.closed:
+            self.client.session = ClientSession()
+
+    async def get_rules(self, refresh: bool = False) -> dict[str, int]:
+        """Get user names and rule ids, asking the api on first use only."""
+        if self._rules is None or refresh:
+            self._ensure_session()
+            rules = await self.client.get_rules()
+            self._rules = {}
+            for rule in rules.data or []:  # type: ignore
+                self._rules[rule.value.split(":")[-1]] = rule.id
+        return dict(self._rules)
+
+    async def add(self, username: str) -> None:
+        self._ensure_session()
+        response = await self.client.add_rules(StreamRule(f"from:{username}"))
+        if not response.data:  # type: ignore
+            # Rule rejected or already present, sync with the api
+            await self.get_rules(refresh=True)
+            return
+        await self.get_rules()
+        for rule in response.data:  # type: ignore
+            self._rules[rule.value.split(":")[-1]] = rule.id  # type: ignore
+
+    async def remove(self, username: str) -> None:
+        rule_id = (await self.get_rules()).get(username)
+        if rule_id is None:
+            return
+        self._ensure_session()
+        await self.client.delete_rules(ids=rule_id)
+        self._rules.pop(username, None)  # type: ignore
+
+    async def close(self) -> None:
+        if self.client.session and not self.client.session.closed:
+            await self.client.session.close()
+
+
+TRACKED_USERS = TrackedUsers(TWITTER_BEARER_TOKEN)  # type: ignore
 
 
 async def add_tweet_user(username) -> None:
-    await AsyncStreamingClient(TWITTER_BEARER_TOKEN).add_rules(
-        StreamRule(f"from:{username}")
-    )
+    await TRACKED_USERS.add(username)
 
 
 async def get_current_rules() -> dict:
-    """Get current rules from twitter api.
+    """Get current rules, fetched from twitter api only on first use.
 
     Returns:
         dict[str][float]: Dict with user name and rule id
     """
-    rules = await AsyncStreamingClient(TWITTER_BEARER_TOKEN).get_rules()
-    rule_dict = {}
-    if not rules.data:  # type: ignore
-        return {}
-    for rule in rules.data:  # type: ignore
-        rule_dict[rule.value.split(":")[-1]] = rule.id
-    return rule_dict
+    return await TRACKED_USERS.get_rules()
 
 
 async def remove_tweet_user(username) -> None:
-    current_rules = await get_current_rules()
-    await AsyncStreamingClient(TWITTER_BEARER_TOKEN).delete_rules(
-        ids=current_rules[username]
-    )
+    await TRACKED_USERS.remove(username)
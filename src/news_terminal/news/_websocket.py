@@ -1,130 +1,171 @@
 import asyncio
 from asyncio import Queue
-from datetime import datetime
-import json
-import re
+import random
+import time
+from typing import Awaitable, Callable
 
 from websockets.client import connect
-from websockets.exceptions import ConnectionClosedError, InvalidStatusCode
-
-from news_terminal.news.data_format import NewsData
-
-
-async def subscribe_to_wss(wss_queue: Queue, url: str) -> None:
-    """Subscribe to the given url and add to queue"""
-    socket_url = f"wss://{url}"
-
-    async def on_message(message):
-        json_msg = json.loads(message)
-        await wss_queue.put(json_msg)
-
-    async with connect(socket_url, ping_interval=8, ping_timeout=8) as websocket:
-        print(f"Opened {socket_url}")
-        while True:
-            try:
-                message = await websocket.recv()
-                await on_message(message)
-            except (
-                asyncio.TimeoutError,
-                ConnectionClosedError,
-                InvalidStatusCode,
-            ) as e:
-                print(e)
-                break
-    await asyncio.sleep(5)
-    print("Restarting connection")
-    await subscribe_to_wss(wss_queue, url)
-
-
-def _format_links_for_click(text):
-    """Format links to be used on click actions."""
-    _text = re.sub(r"(?:https?://|www\.)\S+(?<![\!)\]])", _replace_with_click, text)
-    return _text
-
-
-def _replace_with_click(match) -> str:
-    """Replace the matched url with a click format."""
-    url = match.group(0)
-    # Remove enclosings
-    url = re.sub(r"[{}|^[\]`]", "", url)
-    link = _nice_link_format(url)
-    return f'[@click=app.open_link("{url}")]{link}[/]'
-
-
-def _nice_link_format(url):
-    """Format the link text to a better display"""
-    domain_pattern = r"(?<=://)[\w\.]+(?=/|$)"
-    domain_match = re.search(domain_pattern, url)
-    link = "Link"
-    if domain_match:
-        link = f"{domain_match.group()}/..."
-    return link
-
-
-def _format_quotes(text):
-    """Remove [] from quotes to avoid error."""
-    _text = re.sub(
-        r"\[@(\w+)\]",
-        r"@\1",
-        text,
-    )
-    return _text
-
-
-def format_news_data(news_message: dict) -> NewsData:
-    """Format data from Tree Of Alpha."""
-
-    _title = news_message.get("en", news_message.get("title", ""))
-    _link = news_message.get("url", news_message.get("link", ""))
-    _body = news_message.get("body", "")
-    _source = news_message.get("source", news_message.get("type", ""))
-    _time = datetime.fromtimestamp(news_message["time"] / 1000)
-    _coin = news_message.get("coin", "")
-    _id = news_message["_id"]
-    _actions = news_message.get("actions", [])
-
-    if not _coin and _actions:
-        _coin = _actions[-1]["title"].split("/")[0]
-
-    if news_message.get("type", None) == "direct":
-        _source = "tree-twitter"
-
-    if _source.lower() == "blogs":
-        title_split = _title.split(":")
-        _title = title_split[0].strip()
-        _body = "".join(title_split[1:]).strip()
-
-    return NewsData(
-        title=_title,
-        link=_link,
-        body=_body,
-        source=_source,
-        time=_time,
-        coin=_coin,
-        tree_id=_id,
-        actions=_actions,
-    )
-
-
-def format_news_message(news_message: NewsData) -> NewsData:
-
-    # Remove @[Quote] to avoid conflicts
-    news_message["title"] = _format_quotes(news_message["title"])
-    # Click action on links
-    news_message["title"] = _format_links_for_click(news_message["title"])
-
-    if news_message["body"]:
-        # Remove @[Quote] to avoid conflicts
-        news_message["body"] = _format_quotes(news_message["body"])
-        # Click action on links
-        news_message["body"] = _format_links_for_click(news_message["body"])
-
-    if news_message["link"]:
-        _link = news_message["link"]
-        _link = f'[@click=app.open_link("{_link}")]{_nice_link_format(_link)}[/]'
-        news_message["link"] = _link
-
-    if news_message["coin"]:
-        news_message["coin"] = f"Coin: {news_message['coin']}"
-
-    return news_message
+from websockets.exceptions import WebSocketException
+
+from news_terminal.news._decoder import RAW_KEY, decode
+from news_terminal.news._latency import TRACE_KEY, LatencyTrace
+
+RECONNECT_ERRORS = (asyncio.TimeoutError, OSError, WebSocketException)
+
+
+class ConnectionHealth(object):
+    """Counters of a supervised connection to show on the UI."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize shared attributes"""
+        self.name = name
+        self.connected = False
+        self.reconnects = 0
+        self.downtime = 0.0
+        self.messages = 0
+        self.total_messages = 0
+        self.last_error = ""
+        self._connected_at = 0.0
+        self._down_since: float | None = time.monotonic()
+
+    @property
+    def uptime(self) -> float:
+        """Seconds since the current connection was opened."""
+        if not self.connected:
+            return 0.0
+        return time.monotonic() - self._connected_at
+
+    @property
+    def total_downtime(self) -> float:
+        """Seconds disconnected, including the current outage."""
+        if self._down_since is None:
+            return self.downtime
+        return self.downtime + time.monotonic() - self._down_since
+
+    def on_connect(self) -> None:
+        now = time.monotonic()
+        if self._down_since is not None:
+            self.downtime += now - self._down_since
+            self._down_since = None
+        self.connected = True
+        self._connected_at = now
+        self.messages = 0
+
+    def on_message(self) -> None:
+        self.messages += 1
+        self.total_messages += 1
+
+    def on_disconnect(self, error: BaseException | None) -> None:
+        if self.connected:
+            self.reconnects += 1
+            self._down_since = time.monotonic()
+        self.connected = False
+        self.last_error = repr(error) if error else "Connection closed"
+
+    def summary(self) -> str:
+        state = "UP" if self.connected else "DOWN"
+        return (
+            f"{self.name}: {state} | msgs {self.messages}/{self.total_messages}"
+            f" | reconnects {self.reconnects} | down {self.total_downtime:.1f}s"
+        )
+
+
+class Backoff(object):
+    """Exponential backoff with full jitter and a fast first retry."""
+
+    def __init__(
+        self, first: float = 0.1, base: float = 0.5, cap: float = 30.0
+    ) -> None:
+        """Initialize shared attributes"""
+        self.first = first
+        self.base = base
+        self.cap = cap
+        self.attempts = 0
+
+    def next(self) -> float:
+        """Get the delay before the next attempt."""
+        self.attempts += 1
+        if self.attempts == 1:
+            return self.first
+        return random.uniform(self.first, min(self.cap, self.base * 2**self.attempts))
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+async def supervise(
+    session: Callable[[], Awaitable[None]],
+    health: ConnectionHealth,
+    backoff: Backoff | None = None,
+    stable_after: float = 30.0,
+) -> None:
+    """Run the session forever, reconnecting with backoff when it drops.
+
+    Args:
+        session: Coroutine function that opens the connection, calls
+            health.on_connect and returns or raises once it is lost
+        health: Counters updated for every connection
+        backoff: Delays between attempts, reset after a stable connection
+        stable_after: Seconds a connection must last to reset the backoff
+    """
+    backoff = backoff or Backoff()
+    while True:
+        error = None
+        try:
+            await session()
+        except RECONNECT_ERRORS as e:
+            error = e
+        if health.uptime >= stable_after:
+            backoff.reset()
+        health.on_disconnect(error)
+        delay = backoff.next()
+        print(f"{health.name} lost ({health.last_error}), retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+
+async def subscribe_to_wss(
+    wss_queue: Queue,
+    url: str,
+    health: ConnectionHealth | None = None,
+    message_filter: Callable[[dict, str], bool] | None = None,
+) -> None:
+    """Subscribe to the given url and add to queue
+
+    Every JSON object is queued with a LatencyTrace under TRACE_KEY and the
+    received text or bytes payload under RAW_KEY, other messages are skipped.
+
+    Args:
+        wss_queue (Queue): Queue receiving decoded messages
+        url (str): Socket url, wss:// is used when it has no scheme
+        health (ConnectionHealth | None): Counters for this connection
+        message_filter (Callable | None): Called with the message and the
+            connection name, messages are dropped when it returns False
+    """
+    socket_url = url if "://" in url else f"wss://{url}"
+    health = health or ConnectionHealth(url)
+
+    async def session() -> None:
+        async with connect(socket_url, ping_interval=8, ping_timeout=8) as websocket:
+            health.on_connect()
+            print(f"Opened {socket_url}")
+            async for message in websocket:
+                trace = LatencyTrace()
+                health.on_message()
+                try:
+                    json_msg = decode(message)
+                except ValueError as e:
+                    print(f"Invalid message from {socket_url}: {e}")
+                    continue
+                if not isinstance(json_msg, dict):
+                    print(f"Skipped message from {socket_url}: {json_msg!r:.80}")
+                    continue
+                trace.stamp("decode")
+                if message_filter and not message_filter(json_msg, health.name):
+                    continue
+                trace.stamp("filter")
+                trace.published = json_msg.get("time")
+                json_msg[TRACE_KEY] = trace
+                json_msg[RAW_KEY] = message
+                await wss_queue.put(json_msg)
+
+    await supervise(session, health)
@@ -1,14 +1,85 @@
 """Module with Data format"""
 from datetime import datetime
-from typing import TypedDict
-
-
-class NewsData(TypedDict):
-    title: str
-    link: str
-    body: str
-    source: str
-    time: datetime
-    coin: str
-    tree_id: int
-    actions: list[dict]
+import sys
+
+
+class RenderedNews(object):
+    """Rich markup of a headline, as shown by the news contents."""
+
+    __slots__ = ("title", "body", "link", "coin")
+
+    def __init__(self, title: str, body: str, link: str, coin: str) -> None:
+        """Initialize shared attributes"""
+        self.title = title
+        self.body = body
+        self.link = link
+        self.coin = coin
+
+
+class NewsData(object):
+    """Immutable headline with the fields as received.
+
+    Sources are interned since a few of them repeat across the whole
+    history. The markup is built on first use and cached, the record is
+    shared by the history and every content showing it.
+    """
+
+    __slots__ = (
+        "title",
+        "link",
+        "body",
+        "source",
+        "time",
+        "coin",
+        "tree_id",
+        "actions",
+        "symbols",
+        "_rendered",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        body: str,
+        source: str,
+        time: datetime,
+        coin: str,
+        tree_id: int | str,
+        actions: tuple[dict, ...] = (),
+        symbols: tuple[str, ...] = (),
+    ) -> None:
+        """Initialize shared attributes"""
+        fields = {
+            "title": title,
+            "link": link,
+            "body": body,
+            "source": sys.intern(source),
+            "time": time,
+            "coin": coin,
+            "tree_id": tree_id,
+            "actions": tuple(actions),
+            "symbols": tuple(symbols),
+            "_rendered": None,
+        }
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"NewsData is immutable, can not set {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"NewsData is immutable, can not delete {name}")
+
+    def __repr__(self) -> str:
+        return f"NewsData(source={self.source!r}, title={self.title!r})"
+
+    @property
+    def rendered(self) -> RenderedNews:
+        """Markup of the headline, built once."""
+        if self._rendered is None:
+            # Imported here, the formatter builds NewsData
+            from news_terminal.news._formatter import format_news_message
+
+            object.__setattr__(self, "_rendered", format_news_message(self))
+        return self._rendered  # type: ignore
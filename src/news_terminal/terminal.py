@@ -1,17 +1,26 @@
 """Module containg NewsTerminal main app."""
 from subprocess import PIPE, Popen
+from typing import Sequence
 
 from rich.console import RenderableType
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Footer, Header, Input, TextLog
+from textual.widgets import DataTable, Footer, Header, Input
 
-from news_terminal._binance_data import ACTIONS_DATA
+from news_terminal._market_universe import MARKET_UNIVERSE
+from news_terminal._symbol_index import SYMBOL_INDEX
 from news_terminal.widgets._config import ConfigPanel
+from news_terminal.widgets._feed_status import FeedStatus
 from news_terminal.widgets._news_container import NewsContainer, NewsContent
+from news_terminal.widgets._news_log import NewsLog
 from news_terminal.widgets._position_manager import PositionManager
 from news_terminal.widgets._price_tracker import PriceTracker
-from news_terminal.widgets._selection_display import SelectionDisplay
+from news_terminal.widgets._selection_display import (
+    SUPPORTED_ACTION_TITLES,
+    SelectionDisplay,
+)
+from news_terminal.widgets._watchlist import WatchlistPanel
 
 
 class NewsTerminalApp(App):
@@ -20,8 +29,10 @@ class NewsTerminalApp(App):
     TITLE = "News Terminal"
     CSS_PATH = "terminal.css"
     BINDINGS = [
-        ("f1", "app.toggle_class('#news_log', '-hidden')", "News Log"),
+        ("f1", "toggle_news_log", "News Log"),
         ("f2", "app.toggle_class('ConfigPanel', '-hidden')", "Config"),
+        ("f3", "toggle_watchlist", "Watchlist"),
+        ("t", "watch_pair", "Watch Pair"),
         ("a", "focus_news", "Focus Last News"),
         ("d", "focus_search", "Focus Search"),
         ("k", "focus_long", "Focus Long"),
@@ -32,21 +43,36 @@ class NewsTerminalApp(App):
 
     def on_mount(self) -> None:
         self.action_focus_news()
+        self.refresh_market_universe()
+        self.set_interval(MARKET_UNIVERSE.ttl, self.refresh_market_universe)
 
-    def log_news(self, renderable: RenderableType) -> None:
-        self.query_one("#news_log", TextLog).write(renderable)
+    @work(exclusive=True, group="market_universe")
+    async def refresh_market_universe(self) -> None:
+        """Refresh the market universe in the background and update the search."""
+        if await MARKET_UNIVERSE.refresh():
+            SYMBOL_INDEX.build(MARKET_UNIVERSE.actions)
+            self.query_one(SelectionDisplay).update_universe()
+
+    def log_news(self, message: str | bytes | dict) -> None:
+        # Kept from compose, a query per message walks the whole DOM
+        self.news_log.add(message)
 
     def compose(self) -> ComposeResult:
-        logger = TextLog(
-            classes="-hidden", wrap=False, highlight=True, markup=True, id="news_log"
-        )
-        logger.can_focus = False
+        # Built once before any headline is formatted, the welcome one included
+        SYMBOL_INDEX.build(MARKET_UNIVERSE.actions)
+        self.news_log = NewsLog(classes="-hidden", id="news_log")
         yield ConfigPanel(classes="-hidden")
+        yield WatchlistPanel(classes="-hidden")
         yield Header(show_clock=True)
+        news_container = NewsContainer()
         yield Horizontal(
             Vertical(
-                NewsContainer(),
-                logger,
+                FeedStatus(
+                    *news_container.feed_health,
+                    first_arrival=news_container.first_arrival,
+                ),
+                news_container,
+                self.news_log,
                 id="news_feed",
             ),
             Vertical(
@@ -61,12 +87,33 @@ class NewsTerminalApp(App):
         Popen(["wslview", link], stdout=PIPE, stderr=PIPE)
 
     def on_news_content_selected(self, message: NewsContent.Selected) -> None:
-        actions = message.data["actions"]
-        if not actions:
-            coin = message.data["coin"].split(":")[-1].strip()
-            actions = ACTIONS_DATA[coin]
+        data = message.data
+        actions = data.actions or self._find_actions(data.coin, data.symbols)
+        if actions:
+            self.query_one(PriceTracker).set_headline_time(data.time)
         self.update_ticker(actions)
 
+    def on_news_container_headlines_received(
+        self, message: NewsContainer.HeadlinesReceived
+    ) -> None:
+        price_tracker = self.query_one(PriceTracker)
+        for record in message.records:
+            actions = record.actions or self._find_actions(record.coin, record.symbols)
+            for action in actions:
+                if action["title"][-4:] in SUPPORTED_ACTION_TITLES:
+                    price_tracker.record_reaction(
+                        action["title"], record.source, record.time
+                    )
+                    break
+
+    def _find_actions(self, coin: str, symbols: Sequence[str]) -> list[dict]:
+        """Get the actions of the coin, or else of the first tradeable symbol."""
+        for ticker in (coin, *symbols):
+            actions = MARKET_UNIVERSE.get_actions(ticker)
+            if actions:
+                return actions
+        return []
+
     def on_selection_display_button_selected(
         self, message: SelectionDisplay.ButtonSelected
     ) -> None:
@@ -77,10 +124,40 @@ class NewsTerminalApp(App):
     def on_selection_display_search_complete(
         self, message: SelectionDisplay.SearchComplete
     ) -> None:
+        self.query_one(PriceTracker).set_headline_time(None)
         self.update_ticker(message.actions)
         self.set_focus(None)
 
-    def update_ticker(self, actions: list[dict]) -> None:
+    def on_watchlist_panel_pair_selected(
+        self, message: WatchlistPanel.PairSelected
+    ) -> None:
+        self.query_one(PriceTracker).set_headline_time(None)
+        selection_display = self.query_one(SelectionDisplay)
+        selection_display.selected_pair = message.pair
+        self.subscribe_to_action(message.pair)
+
+    def on_watchlist_panel_pair_removed(
+        self, message: WatchlistPanel.PairRemoved
+    ) -> None:
+        self.query_one(PriceTracker).unwatch_pair(message.pair)
+
+    def on_price_tracker_watchlist_changed(
+        self, message: PriceTracker.WatchlistChanged
+    ) -> None:
+        price_tracker = self.query_one(PriceTracker)
+        self.query_one(WatchlistPanel).set_pairs(
+            price_tracker.watchlist, price_tracker.market_state
+        )
+
+    def on_price_tracker_watchlist_updated(
+        self, message: PriceTracker.WatchlistUpdated
+    ) -> None:
+        price_tracker = self.query_one(PriceTracker)
+        self.query_one(WatchlistPanel).update_pairs(
+            message.pairs, price_tracker.watchlist, price_tracker.market_state
+        )
+
+    def update_ticker(self, actions: Sequence[dict]) -> None:
         if not actions:
             return
         selection_display = self.query_one(SelectionDisplay)
@@ -97,11 +174,41 @@ class NewsTerminalApp(App):
         self.query_one(PositionManager).log_binance(renderable)
 
     def action_focus_news(self) -> None:
+        if self.query_one(NewsContainer).show_latest():
+            # Focus once the newest headlines are mounted
+            self.call_after_refresh(self.action_focus_news)
+            return
         self.set_focus(self.query(NewsContent).first())
 
     def action_focus_search(self):
         self.query_one(SelectionDisplay).query_one(Input).focus()
 
+    def action_toggle_news_log(self) -> None:
+        self.news_log.toggle_class("-hidden")
+        if not self.news_log.has_class("-hidden"):
+            self.news_log.show_latest()
+
+    def action_toggle_watchlist(self) -> None:
+        watchlist_panel = self.query_one(WatchlistPanel)
+        watchlist_panel.toggle_class("-hidden")
+        if watchlist_panel.has_class("-hidden"):
+            self.action_focus_news()
+            return
+        price_tracker = self.query_one(PriceTracker)
+        watchlist_panel.set_pairs(price_tracker.watchlist, price_tracker.market_state)
+        watchlist_panel.query_one(DataTable).focus()
+
+    def action_watch_pair(self) -> None:
+        """Add the selected pair to the watchlist, or remove it if watched."""
+        pair = self.query_one(SelectionDisplay).selected_pair
+        if not pair:
+            return
+        price_tracker = self.query_one(PriceTracker)
+        if pair in price_tracker.watchlist:
+            price_tracker.unwatch_pair(pair)
+        else:
+            price_tracker.watch_pair(pair)
+
     def action_focus_long(self) -> None:
         self.query_one("PositionManager #open_long").focus()
 
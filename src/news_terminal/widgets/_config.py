@@ -3,6 +3,8 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import TabPane, TabbedContent
 
+from news_terminal.widgets._latency_panel import LatencyPanel
+from news_terminal.widgets._reaction_summary import ReactionSummary
 from news_terminal.widgets._twitter_config import TwitterConfig
 
 
@@ -11,3 +13,7 @@ class ConfigPanel(Container):
         with TabbedContent():
             with TabPane("Twitter", id="twitter_tab"):
                 yield TwitterConfig()
+            with TabPane("Reactions", id="reactions_tab"):
+                yield ReactionSummary()
+            with TabPane("Latency", id="latency_tab"):
+                yield LatencyPanel()
@@ -0,0 +1,34 @@
+"""Module with a widget to show news connection health."""
+from textual.widgets import Static
+
+from news_terminal.news._dedup import FirstArrivalFilter
+from news_terminal.news._websocket import ConnectionHealth
+
+
+class FeedStatus(Static):
+    """Widget to show the health of news connections."""
+
+    def __init__(
+        self,
+        *health: ConnectionHealth,
+        first_arrival: FirstArrivalFilter | None = None,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self.health = list(health)
+        self.first_arrival = first_arrival
+
+    def on_mount(self) -> None:
+        self.update_status()
+        self.set_interval(1, self.update_status)
+
+    def update_status(self) -> None:
+        lines = [health.summary() for health in self.health]
+        if self.first_arrival and len(self.health) > 1:
+            lines.append(self.first_arrival.summary())
+        self.update("\n".join(lines))
+        self.set_class(
+            not all(health.connected for health in self.health), "-disconnected"
+        )
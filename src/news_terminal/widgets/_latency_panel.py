@@ -0,0 +1,54 @@
+"""Module with a debug panel of the news path latency."""
+from datetime import datetime
+from pathlib import Path
+
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.widgets import Button, Static
+
+from news_terminal.config import CACHE_DIR
+from news_terminal.news._latency import NEWS_LATENCY, LatencyStats
+
+
+class LatencyPanel(Container):
+    """Panel with the p50, p99 and max latency of every stage per source."""
+
+    def __init__(
+        self,
+        stats: LatencyStats = NEWS_LATENCY,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self.stats = stats
+        self._shown_count = -1
+
+    def compose(self) -> ComposeResult:
+        yield Button("Export", id="export_latency")
+        yield Static(id="latency_table")
+
+    def on_mount(self) -> None:
+        self.update_table()
+        self.set_interval(2, self.update_table)
+
+    def update_table(self) -> None:
+        # Nothing to draw while the config panel is out of screen
+        if any(node.has_class("-hidden") for node in self.ancestors):
+            return
+        if self.stats.count == self._shown_count:
+            return
+        self._shown_count = self.stats.count
+        table = Table("Source", "Stage", "N", "p50", "p99", "max", expand=True)
+        for source, stage, count, p50, p99, max_ms in self.stats.summary():
+            table.add_row(
+                source, stage, str(count), f"{p50:.1f}", f"{p99:.1f}", f"{max_ms:.1f}"
+            )
+        self.query_one("#latency_table", Static).update(table)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = Path(CACHE_DIR) / f"latency-{timestamp}.csv"
+        self.stats.export(path)
+        event.button.label = f"Exported to {path}"
@@ -1,6 +1,8 @@
 """Module with Tree News widgets."""
 import asyncio
+from collections import deque
 from datetime import datetime
+import itertools
 
 from textual import work
 from textual.app import ComposeResult, events
@@ -9,18 +11,28 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Label
 
+from news_terminal.config import NEWS_FEED_CONNECTIONS, NEWS_FEEDS, NEWS_HISTORY
+from news_terminal.news._decoder import RAW_KEY
+from news_terminal.news._dedup import FirstArrivalFilter
+from news_terminal.news._formatter import format_news_data
+from news_terminal.news._latency import NEWS_LATENCY, TRACE_KEY, LatencyTrace
 from news_terminal.news._twitter_monitor import subscribe_to_news_stream
-from news_terminal.news._websocket import (
-    format_news_data,
-    format_news_message,
-    subscribe_to_wss,
-)
+from news_terminal.news._websocket import ConnectionHealth, subscribe_to_wss
 from news_terminal.news.data_format import NewsData
 
+VISIBLE_NEWS = 25
+
 
 class NewsContainer(Container):
     """Container for News Content."""
 
+    class HeadlinesReceived(Message):
+        """Message sent after new headlines are added"""
+
+        def __init__(self, records: list[NewsData]) -> None:
+            super().__init__()
+            self.records = records
+
     def __init__(
         self,
         *children: Widget,
@@ -33,33 +45,9 @@ class NewsContainer(Container):
             *children, name=name, id=id, classes=classes, disabled=disabled
         )
         self.news_queue = asyncio.Queue()
-        self._task_list = {}
-        self._task_list["subscribe_to_wss"] = asyncio.create_task(
-            subscribe_to_wss(self.news_queue, "news.treeofalpha.com/ws")
-        )
-        # self._task_list["subscribe_to_news_stream"] = asyncio.create_task(
-        #     subscribe_to_news_stream(self.news_queue)
-        # )
-        self._add_new_entry()
-
-    @work
-    async def _add_new_entry(self) -> None:
-        while True:
-            json_msg = await self.news_queue.get()
-            self.app.log_news(json_msg)  # type: ignore
-            news_message = format_news_data(json_msg)
-            new_news = NewsContent(news_message)
-            self.mount(new_news, before=0)
-            content_query = self.query(NewsContent)
-            # Focus new content if a content is already in focus
-            if isinstance(self.screen.focused, NewsContent):
-                content_query.first().focus()
-
-            if len(self.children) > 25:
-                await content_query.last().remove()
-
-    def compose(self) -> ComposeResult:
-        yield NewsContent(
+        # Newest first, only VISIBLE_NEWS of them are mounted as widgets
+        self.history: deque[NewsData] = deque(maxlen=NEWS_HISTORY)
+        self.history.append(
             format_news_data(
                 {
                     "title": "News Terminal!",
@@ -72,6 +60,153 @@ class NewsContainer(Container):
                 }
             )
         )
+        self._offset = 0
+        self.feed_health = []
+        self.first_arrival = FirstArrivalFilter()
+        self._task_list = {}
+        for url in NEWS_FEEDS:
+            for index in range(NEWS_FEED_CONNECTIONS):
+                health = ConnectionHealth(f"{url} #{index + 1}")
+                self.feed_health.append(health)
+                self._task_list[health.name] = asyncio.create_task(
+                    subscribe_to_wss(
+                        self.news_queue, url, health, self.first_arrival.accept
+                    )
+                )
+        # self._task_list["subscribe_to_news_stream"] = asyncio.create_task(
+        #     subscribe_to_news_stream(self.news_queue)
+        # )
+        self._add_new_entry()
+
+    @work
+    async def _add_new_entry(self) -> None:
+        while True:
+            json_msgs = [await self.news_queue.get()]
+            # Drain the burst so it is mounted in a single refresh
+            while not self.news_queue.empty():
+                json_msgs.append(self.news_queue.get_nowait())
+            traces = [json_msg.pop(TRACE_KEY, None) for json_msg in json_msgs]
+            self._stamp(traces, "queue")
+
+            with self.app.batch_update():
+                records = []
+                for json_msg in json_msgs:
+                    # Only buffered, rendered when the news log is shown.
+                    # Messages not read from a feed are logged as dicts
+                    raw = json_msg.pop(RAW_KEY, json_msg)
+                    self.app.log_news(raw)  # type: ignore
+                    records.append(format_news_data(json_msg))
+                self._stamp(traces, "format")
+                self.history.extendleft(records)
+                # Handled after this batch is on screen
+                self.post_message(self.HeadlinesReceived(records))
+
+                if self._offset:
+                    # Keep the scrolled back window on the same headlines
+                    self._offset += len(records)
+                    if self._offset + len(self.children) > len(self.history):
+                        self._offset = len(self.history) - len(self.children)
+                        self._render_window()
+                    self._update_scroll_status()
+                    self._record_latency(traces, records)
+                    continue
+
+                new_news = [NewsContent(record) for record in records[-VISIBLE_NEWS:]]
+                self._stamp(traces, "render")
+                # Newest message on top, trimming the overflow in the same pass
+                overflow = self.children[max(0, VISIBLE_NEWS - len(new_news)) :]
+                await self.mount(
+                    *reversed(new_news), before=0 if self.children else None
+                )
+                await asyncio.gather(*(content.remove() for content in overflow))
+                self._stamp(traces, "mount")
+
+                # Focus new content if a content is already in focus
+                if isinstance(self.screen.focused, NewsContent):
+                    new_news[-1].focus()
+
+            self.call_after_refresh(self._on_first_paint, traces, records)
+
+    @staticmethod
+    def _stamp(traces: list[LatencyTrace | None], stage: str) -> None:
+        for trace in traces:
+            if trace is not None:
+                trace.stamp(stage)
+
+    def _on_first_paint(
+        self, traces: list[LatencyTrace | None], records: list[NewsData]
+    ) -> None:
+        self._stamp(traces, "paint")
+        self._record_latency(traces, records)
+
+    def _record_latency(
+        self, traces: list[LatencyTrace | None], records: list[NewsData]
+    ) -> None:
+        for trace, record in zip(traces, records):
+            if trace is not None:
+                NEWS_LATENCY.record(trace, record.source)
+
+    def compose(self) -> ComposeResult:
+        yield from (NewsContent(record) for record in self.history)
+
+    async def move_focus(self, content: "NewsContent", direction: int) -> None:
+        """Focus the next or previous content, scrolling the history at the edges.
+
+        Args:
+            content (NewsContent): Content currently in focus
+            direction (int): 1 to move to older headlines, -1 to newer ones
+        """
+        index = self.children.index(content) + direction
+        if 0 <= index < len(self.children):
+            self.children[index].focus()
+            return
+
+        with self.app.batch_update():
+            if direction > 0:
+                older_index = self._offset + len(self.children)
+                if older_index >= len(self.history):
+                    return
+                new_content = NewsContent(self.history[older_index])
+                await self.mount(new_content)
+                self.children[0].remove()
+                self._offset += 1
+            else:
+                if not self._offset:
+                    return
+                self._offset -= 1
+                new_content = NewsContent(self.history[self._offset])
+                await self.mount(new_content, before=0)
+                self.children[-1].remove()
+            new_content.focus()
+        self._update_scroll_status()
+
+    def show_latest(self) -> bool:
+        """Go back to the newest headlines if the history is scrolled.
+
+        Returns:
+            bool: True if the contents were replaced
+        """
+        if not self._offset:
+            return False
+        self._offset = 0
+        self._render_window()
+        self._update_scroll_status()
+        return True
+
+    def _render_window(self) -> None:
+        """Replace the contents with the visible slice of the history."""
+        window = itertools.islice(
+            self.history, self._offset, self._offset + VISIBLE_NEWS
+        )
+        self.query(NewsContent).remove()
+        self.mount(*(NewsContent(record) for record in window))
+
+    def _update_scroll_status(self) -> None:
+        self.app.sub_title = (
+            f"{self._offset} newer headlines above (A to go back)"
+            if self._offset
+            else ""
+        )
 
     def clear_selection(self):
         self.query(NewsContent).remove_class("selected")
@@ -90,26 +225,26 @@ class NewsContent(Widget):
     def __init__(self, data: NewsData) -> None:
         """Initialize shared variables."""
         self.data = data
-        self.formated_data = format_news_message(data)
+        # Built here, so the "render" latency stage covers the markup
+        self.rendered = data.rendered
         self.can_focus = True
         super().__init__()
 
     def compose(self) -> ComposeResult:
         """Compose Widget"""
+        rendered = self.rendered
         yield Horizontal(
-            Label(f"Source: {self.formated_data['source']}", id="source"),
+            Label(f"Source: {self.data.source}", id="source"),
             Vertical(
-                Label(self.formated_data["title"], id="title", shrink=True),
-                Label(self.formated_data["body"], id="body", shrink=True),
-                Label(self.formated_data["link"], id="link"),
+                Label(rendered.title, id="title", shrink=True),
+                Label(rendered.body, id="body", shrink=True),
+                Label(rendered.link, id="link"),
                 Horizontal(
-                    Label(
-                        self.formated_data["time"].strftime("%H:%M:%S:%f"), id="time"
-                    ),
-                    Label(self.formated_data["coin"], id="coin"),
+                    Label(self.data.time.strftime("%H:%M:%S:%f"), id="time"),
+                    Label(rendered.coin, id="coin"),
                 ),
                 Label(
-                    f"Terminal delay: {(datetime.now() - self.formated_data['time']).total_seconds()*1000}ms",
+                    f"Terminal delay: {(datetime.now() - self.data.time).total_seconds()*1000}ms",
                     id="delay",
                 ),
             ),
@@ -124,9 +259,9 @@ class NewsContent(Widget):
         if event.key == "enter":
             self._select()
         elif event.key == "w":
-            self.screen.focus_previous("NewsContent")
+            await self.parent.move_focus(self, -1)  # type: ignore
         elif event.key == "s":
-            self.screen.focus_next("NewsContent")
+            await self.parent.move_focus(self, 1)  # type: ignore
 
     def _select(self) -> None:
         """Select content."""
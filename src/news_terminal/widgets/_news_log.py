@@ -0,0 +1,103 @@
+"""Module with the raw news log, rendered only when it is on screen."""
+from collections import deque
+import json
+
+from rich.highlighter import JSONHighlighter
+from rich.segment import Segment
+from rich.text import Text
+from textual._cache import LRUCache
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from news_terminal.config import NEWS_LOG_SIZE
+
+
+class NewsLog(ScrollView):
+    """Ring buffer of raw news messages shown one per row.
+
+    Messages are kept as the payload received from the feed, or as dicts
+    when there is none. Adding a message only appends it to the buffer.
+    Rows are highlighted when they are drawn, so only the ones in view are
+    ever rendered and nothing at all while the log is hidden.
+    """
+
+    DEFAULT_CSS = """
+    NewsLog {
+        overflow-y: scroll;
+    }
+    """
+
+    def __init__(
+        self,
+        size: int = NEWS_LOG_SIZE,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        """Initialize shared attributes"""
+        super().__init__(name=name, id=id, classes=classes)
+        self.messages: deque[str | bytes | dict] = deque(maxlen=size)
+        # Messages pushed out of the buffer, keeps cache keys stable
+        self._dropped = 0
+        self._max_width = 0
+        self._row_cache: LRUCache[int, Strip] = LRUCache(256)
+        self._highlighter = JSONHighlighter()
+
+    def add(self, message: str | bytes | dict) -> None:
+        """Keep the message, it is rendered once it scrolls into view."""
+        if len(self.messages) == self.messages.maxlen:
+            self._dropped += 1
+        self.messages.append(message)
+        if not self.has_class("-hidden"):
+            self._update_size()
+
+    def show_latest(self) -> None:
+        """Size the log to the buffer and scroll to the newest message."""
+        self._update_size(follow=True)
+
+    def _update_size(self, follow: bool = False) -> None:
+        # Follow new messages only while the newest one is in view
+        at_end = self.scroll_offset.y >= self.max_scroll_y
+        self.virtual_size = Size(self._max_width, len(self.messages))
+        if follow or at_end:
+            self.scroll_end(animate=False)
+
+    def notify_style_update(self) -> None:
+        self._row_cache.clear()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        index = scroll_y + y
+        if index >= len(self.messages):
+            return Strip.blank(width, self.rich_style)
+        row = self._render_row(index)
+        return (
+            row.adjust_cell_length(max(row.cell_length, scroll_x + width))
+            .crop(scroll_x, scroll_x + width)
+            .apply_style(self.rich_style)
+        )
+
+    def _render_row(self, index: int) -> Strip:
+        key = self._dropped + index
+        row = self._row_cache.get(key)
+        if row is None:
+            message = self.messages[index]
+            if isinstance(message, dict):
+                message = json.dumps(message, default=str)
+            elif isinstance(message, bytes):
+                message = message.decode(errors="replace")
+            # Newlines can only be whitespace between JSON tokens
+            text = self._highlighter(Text(message.replace("\n", " "), no_wrap=True))
+            console = self.app.console
+            segments = console.render(
+                text, console.options.update(no_wrap=True, overflow="ignore")
+            )
+            row = Strip(next(Segment.split_lines(segments), []))
+            self._row_cache[key] = row
+            if row.cell_length > self._max_width:
+                self._max_width = row.cell_length
+                # Not while rendering, widens the scrollable area afterwards
+                self.call_later(self._update_size)
+        return row
@@ -1,10 +1,11 @@
 """Module with a widget to open positions on exchange."""
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 import functools
 from typing import Callable
 
 from rich.console import RenderableType
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
@@ -21,7 +22,13 @@ from textual.widgets import (
     TextLog,
 )
 
-from news_terminal._binance_trade import BinanceTrader
+from news_terminal._binance_trade import (
+    TRADER_POOL,
+    AsyncBinanceTrader,
+    OrderValidationError,
+)
+from news_terminal._market_universe import REFRESH_ERRORS
+from news_terminal.config import BINANCE_KEEPALIVE
 from news_terminal.widgets._label_item import LabelItem
 
 
@@ -37,6 +44,11 @@ class PositionManager(Widget):
     ) -> None:
         super().__init__(*children, name=name, id=id, classes=classes)
         self.current_pair = ""
+        self.binance_trader: AsyncBinanceTrader | None = None
+        # Orders by side, sized for _armed_for (symbol, bid, leverage)
+        self.armed_orders: dict[str, dict] = {}
+        self._armed_for: tuple[str, str, int] | None = None
+        self._leverage_set: tuple[str, int] | None = None
         self.open_long = Button(
             "OPEN LONG (K)", variant="success", disabled=True, id="open_long"
         )
@@ -51,7 +63,8 @@ class PositionManager(Widget):
 
     def on_mount(self) -> None:
         self.set_binance_trader(True)
-        self.update_exchange_holdings()
+        self.set_interval(0.25, self.arm_orders)
+        self.set_interval(BINANCE_KEEPALIVE, self.keep_traders_warm)
 
     def compose(self) -> ComposeResult:
         yield self.confirm_dialog
@@ -94,41 +107,83 @@ class PositionManager(Widget):
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        current_leverage = self.query_one(RadioBox).highlighted_child.text  # type: ignore
-        bid = self.query_one("#bid_input", Input).value
+        if not self.binance_trader:
+            self.log_binance("Binance trader is not ready yet")
+            return
         if event.button.id == "open_long":
-            long_partial = functools.partial(
-                self.binance_trader.create_leverage_trade,
-                self.current_pair.split(" ")[0].strip(),
-                self.binance_trader.client.SIDE_BUY,
-                self.binance_trader.client.FUTURE_ORDER_TYPE_MARKET,
-                Decimal(bid),
-                int(current_leverage),
-            )
-            self.confirm_dialog.confirm_text = "".join(
-                f"[bold]LONG[/bold] position [bold yellow]{self.current_pair}[/bold yellow],"
-                f" size: [bold yellow]{bid}[/bold yellow], leverage: [bold yellow]{current_leverage}[/bold yellow]"
-            )
-            self.confirm_dialog.confirm_func = long_partial
-            self.confirm_dialog.show(True)
+            self._confirm_position("LONG", self.binance_trader.client.SIDE_BUY)
         elif event.button.id == "open_short":
-            short_partial = functools.partial(
-                self.binance_trader.create_leverage_trade,
-                self.current_pair.split(" ")[0].strip(),
-                self.binance_trader.client.SIDE_SELL,
-                self.binance_trader.client.FUTURE_ORDER_TYPE_MARKET,
-                Decimal(bid),
-                int(current_leverage),
-            )
-            self.confirm_dialog.confirm_text = "".join(
-                f"[bold]SHORT[/bold] position [bold yellow]{self.current_pair}[/bold yellow],"
-                f" size: [bold yellow]{bid}[/bold yellow], leverage: [bold yellow]{current_leverage}[/bold yellow]"
-            )
-            self.confirm_dialog.confirm_func = short_partial
-            self.confirm_dialog.show(True)
+            self._confirm_position("SHORT", self.binance_trader.client.SIDE_SELL)
         elif event.button.id == "update_holdings":
             self.update_exchange_holdings()
 
+    def _confirm_position(self, position: str, side: str) -> None:
+        current_leverage = self.query_one(RadioBox).highlighted_child.text  # type: ignore
+        bid = self.query_one("#bid_input", Input).value
+        symbol = self.current_pair.split(" ")[0].strip()
+        armed_order = self.armed_orders.get(side)
+        size = f"{bid}"
+        if armed_order and self._armed_for == (symbol, bid, int(current_leverage)):
+            size = f"{bid} ({armed_order['quantity']} armed)"
+        self.confirm_dialog.confirm_text = "".join(
+            f"[bold]{position}[/bold] position [bold yellow]{self.current_pair}[/bold yellow],"
+            f" size: [bold yellow]{size}[/bold yellow], leverage: [bold yellow]{current_leverage}[/bold yellow]"
+        )
+        self.confirm_dialog.confirm_func = functools.partial(
+            self._submit_position, symbol, side, bid, int(current_leverage)
+        )
+        self.confirm_dialog.show(True)
+
+    async def _submit_position(
+        self, symbol: str, side: str, bid: str, leverage: int
+    ) -> dict:
+        """Send the armed order if it is still current, otherwise size it now."""
+        armed_order = self.armed_orders.get(side)
+        if armed_order and self._armed_for == (symbol, bid, leverage):
+            return await self.binance_trader.submit_order(armed_order)  # type: ignore
+        return await self.binance_trader.create_leverage_trade(  # type: ignore
+            symbol,
+            side,
+            self.binance_trader.client.FUTURE_ORDER_TYPE_MARKET,  # type: ignore
+            Decimal(bid),
+            leverage,
+        )
+
+    def arm_orders(self) -> None:
+        """Keep long and short orders sized from the live price, ready to send."""
+        self.armed_orders = {}
+        self._armed_for = None
+        trader = self.binance_trader
+        if not trader or not self.current_pair.endswith("PERP"):
+            return
+        symbol = self.current_pair.split(" ")[0].strip()
+        leverage = int(self.query_one(RadioBox).highlighted_child.text)  # type: ignore
+        # Only arm once the exchange accepted the selected leverage
+        if self._leverage_set != (symbol, leverage):
+            return
+        bid = self.query_one("#bid_input", Input).value
+        try:
+            money_to_spend = Decimal(bid)
+        except InvalidOperation:
+            return
+        token_price = trader.get_streamed_price(symbol)
+        if token_price is None or not trader.has_symbol(symbol):
+            return
+        try:
+            for side in (trader.client.SIDE_BUY, trader.client.SIDE_SELL):
+                self.armed_orders[side] = trader.prepare_leverage_trade(
+                    symbol,
+                    side,
+                    trader.client.FUTURE_ORDER_TYPE_MARKET,
+                    money_to_spend,
+                    leverage,
+                    token_price,
+                )
+        except OrderValidationError:
+            self.armed_orders = {}
+            return
+        self._armed_for = (symbol, bid, leverage)
+
     def on_switch_changed(self, event: Switch.Changed) -> None:
         self.set_binance_trader(testnet=event.value)
 
@@ -137,16 +192,25 @@ class PositionManager(Widget):
             return
         self.update_binance_leverage()
 
-    def update_binance_leverage(self) -> None:
+    @work(exclusive=True, group="leverage")
+    async def update_binance_leverage(self) -> None:
+        if not self.binance_trader:
+            return
         pair = self.current_pair.split(" ")[0].strip()
         current_leverage = int(self.query_one(RadioBox).highlighted_child.text)  # type: ignore
-        leverage_change = self.binance_trader.change_leverage(
-            symbol=pair, leverage=current_leverage
-        )
+        try:
+            leverage_change = await self.binance_trader.change_leverage(
+                symbol=pair, leverage=current_leverage
+            )
+        except REFRESH_ERRORS as e:
+            self.log_binance(f"[bold red]Leverage update failed:[/bold red] {e}")
+            return
         if not leverage_change:
             self.reduce_leverage()
             return
 
+        self._leverage_set = (pair, current_leverage)
+        self.arm_orders()
         leverage_change["maxNotionalValue"] = (
             int(leverage_change["maxNotionalValue"]) / current_leverage
         )
@@ -165,15 +229,41 @@ class PositionManager(Widget):
         """Reduce leverage index."""
         self.query_one(RadioBox).action_cursor_up()
 
-    def update_exchange_holdings(self) -> None:
+    @work(exclusive=True, group="holdings")
+    async def update_exchange_holdings(self) -> None:
         """Update exchange holdings"""
-        holdings = str(self.binance_trader.get_futures_balance("USDT"))
-        self.query_one("#current_usdt", Static).update(holdings)
+        if not self.binance_trader:
+            return
+        try:
+            holdings = await self.binance_trader.get_futures_balance("USDT")
+        except REFRESH_ERRORS as e:
+            self.log_binance(f"[bold red]Balance update failed:[/bold red] {e}")
+            return
+        self.query_one("#current_usdt", Static).update(str(holdings))
 
-    def set_binance_trader(self, testnet: bool) -> None:
-        self.binance_trader = BinanceTrader(testnet=testnet)
+    @work(exclusive=True, group="trader")
+    async def set_binance_trader(self, testnet: bool) -> None:
+        self._leverage_set = None
+        try:
+            self.binance_trader = await TRADER_POOL.get(testnet=testnet)
+        except REFRESH_ERRORS as e:
+            # Never leave orders going to the network the switch left
+            self.binance_trader = None
+            self.log_binance(f"[bold red]Binance trader failed:[/bold red] {e}")
+            return
         self.log_binance(f"Initialized Binance trader with TESTNET: {testnet}")
         self.update_exchange_holdings()
+        if self.current_pair:
+            self.update_binance_leverage()
+        # Have the other network ready to switch without setting it up
+        try:
+            await TRADER_POOL.get(testnet=not testnet)
+        except REFRESH_ERRORS as e:
+            self.log_binance(f"Could not prepare TESTNET: {not testnet} trader: {e}")
+
+    @work(exclusive=True, group="keepalive")
+    async def keep_traders_warm(self) -> None:
+        await TRADER_POOL.keep_warm()
 
     def log_binance(self, renderable: RenderableType) -> None:
         self.query_one("#binance_log", TextLog).write(renderable)
@@ -256,12 +346,24 @@ class ConfirmPositionDialog(Widget):
 
     def _confirm(self) -> None:
         if self.confirm_func:
-            value = self.confirm_func()
-            buy_time = datetime.fromtimestamp(value["updateTime"] / 1000)
-            value["buyTime"] = buy_time.strftime("%H:%M:%S:%f")
-            self.app.log_binance(value)  # type: ignore
+            self._send_order(self.confirm_func)
         self.show(False)
 
+    @work(group="orders")
+    async def _send_order(self, confirm_func: Callable) -> None:
+        """Send the order without blocking the UI and log the result."""
+        try:
+            value = await confirm_func()
+        except OrderValidationError as e:
+            self.app.log_binance(f"[bold red]Order rejected:[/bold red] {e}")  # type: ignore
+            return
+        except REFRESH_ERRORS as e:
+            self.app.log_binance(f"[bold red]Order failed:[/bold red] {e}")  # type: ignore
+            return
+        buy_time = datetime.fromtimestamp(value["updateTime"] / 1000)
+        value["buyTime"] = buy_time.strftime("%H:%M:%S:%f")
+        self.app.log_binance(value)  # type: ignore
+
     def show(self, on: bool) -> None:
         if on:
             self.can_focus = True
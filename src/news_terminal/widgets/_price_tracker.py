@@ -1,18 +1,67 @@
 """Module with a widget to watch prices"""
 import asyncio
+from datetime import datetime
+import math
+import time
 from textual import work
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static
-from unicorn_binance_websocket_api.manager import BinanceWebSocketApiManager
 
-from news_terminal._binance_data import subscribe_to_market
+from news_terminal._binance_data import (
+    REACTION_CHANNELS,
+    MarketDataManager,
+    get_agg_trades,
+    get_recent_klines,
+)
+from news_terminal._candles import (
+    RollingCandles,
+    WindowStats,
+    parse_window,
+    trade_price_at,
+)
+from news_terminal._market_state import MarketState, format_price, parse_pair
+from news_terminal._market_universe import REFRESH_ERRORS
+from news_terminal._price_store import LAST_PRICES
+from news_terminal._reactions import (
+    PRE_SECONDS,
+    REACTIONS,
+    ReactionRecorder,
+    Recording,
+)
+from news_terminal.config import (
+    CANDLE_WINDOWS,
+    PRICE_REDRAW_RATE,
+    REACTION_MAX_ACTIVE,
+    WATCHLIST,
+    WATCHLIST_SIZE,
+)
 
 
 class PriceTracker(Widget):
-    """Widget to show price for tokens."""
+    """Widget to show price for tokens.
+
+    The selected market and every market of the watchlist share the streams
+    of one MarketDataManager, their values are kept in a MarketState so a
+    watched market is shown at once when selected.
+    """
+
+    class WatchlistChanged(Message):
+        """Message sent when pairs are added to or removed from the watchlist"""
+
+        def __init__(self, pairs: list[str]) -> None:
+            super().__init__()
+            self.pairs = pairs
+
+    class WatchlistUpdated(Message):
+        """Message sent when watched pairs received new values"""
+
+        def __init__(self, pairs: list[str]) -> None:
+            super().__init__()
+            self.pairs = pairs
 
     def __init__(
         self,
@@ -22,9 +71,20 @@ class PriceTracker(Widget):
         classes: str | None = None,
     ) -> None:
         super().__init__(*children, name=name, id=id, classes=classes)
-        self._main_stream = None
-        self._binance_api_manager: None | BinanceWebSocketApiManager = None
-        self._current_market = None
+        self._market_data = MarketDataManager(process_stream_data=self._on_stream_data)
+        self._stream_queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.market_state = MarketState()
+        self.watchlist: dict[str, tuple[str, str]] = {}
+        self._current_key: tuple[str, str] | None = None
+        self._windows = sorted(CANDLE_WINDOWS, key=parse_window)
+        self._window_seconds = [parse_window(window) for window in self._windows]
+        self._candles: RollingCandles | None = None
+        self.headline_time: int | None = None
+        # Market and headline time of the requested headline price
+        self._headline_request: tuple[tuple[str, str], int] | None = None
+        self._headline_price: float | None = None
+        self.reactions = ReactionRecorder(REACTIONS, REACTION_MAX_ACTIVE)
 
     def compose(self) -> ComposeResult:
         yield Horizontal(
@@ -33,99 +93,331 @@ class PriceTracker(Widget):
         )
         yield Horizontal(
             Vertical(
-                Static("Candle", classes="header"),
-                Static("1m", classes="header"),
-                Static("5m", classes="header"),
-                Static("15m", classes="header"),
+                Static("Window", classes="header"),
+                *[Static(window, classes="header") for window in self._windows],
                 id="header_col",
             ),
             Vertical(
                 Static("Percent Change", classes="header"),
-                Static("", id="m1_change", classes="up"),
-                Static("", id="m5_change", classes="up"),
-                Static("", id="m15_change", classes="up"),
+                *[
+                    Static("", id=f"change_{window}", classes="up")
+                    for window in self._windows
+                ],
             ),
             id="table_layout",
         )
+        yield Horizontal(
+            Static("", id="vwap_value"),
+            Static("", id="volume_spike"),
+            Static("", id="headline_move"),
+            id="metrics_layout",
+        )
 
     def on_mount(self) -> None:
+        self._loop = asyncio.get_running_loop()
         self.clear_values()
         self._update_values()
+        self.set_interval(1, self.finish_reactions)
+        for pair in WATCHLIST:
+            self.watch_pair(pair)
 
-    def subscribe_to_action(self, market: str) -> None:
-        if market.endswith("PERP"):
-            market = market[:-5].lower()
-            exchange = "binance.com-futures"
-        else:
-            market = market.replace("/", "").lower()
-            exchange = "binance.com"
+    def subscribe_to_action(self, pair: str) -> None:
+        key = parse_pair(pair)
+        if key == self._current_key:
+            return
 
-        if market == self._current_market:
+        previous_key = self._current_key
+        self._current_key = key
+        if previous_key is not None and previous_key not in self.watchlist.values():
+            self.market_state.remove(previous_key)
+            self._release(previous_key)
+        self.market_state.add(key)
+        self._candles = RollingCandles(self._window_seconds[-1] + 60)
+        self._backfill_candles(key, self._candles)
+        # Watched markets already have values, the others start empty
+        self._show_current()
+
+        market, exchange = key
+        switch_time = self._market_data.switch(market, exchange, keep=self._kept_keys())
+        if market not in self._market_data.markets[exchange]:
+            self.log(f"Could not subscribe to {market} on {exchange}")
             return
+        self.log(f"Subscribed to {market} on {exchange} in {switch_time:.1f}ms")
 
-        self._current_market = market
-        self.clear_values()
+    def watch_pair(self, pair: str) -> bool:
+        """Add the pair to the watchlist, subscribing to its market.
 
-        self._binance_api_manager, self._main_stream = subscribe_to_market(
-            self._binance_api_manager, self._main_stream, market, exchange
-        )
+        Returns:
+            bool: False if the watchlist is full or the subscription failed
+        """
+        if pair in self.watchlist:
+            return True
+        if len(self.watchlist) >= WATCHLIST_SIZE:
+            self.log(f"Watchlist is full, {pair} not added")
+            return False
+        key = parse_pair(pair)
+        if not self._market_data.subscribe(*key):
+            self.log(f"Could not subscribe to {pair}, not added")
+            return False
+        self.watchlist[pair] = key
+        self.market_state.add(key)
+        self.post_message(self.WatchlistChanged(list(self.watchlist)))
+        return True
+
+    def unwatch_pair(self, pair: str) -> None:
+        key = self.watchlist.pop(pair, None)
+        if key is None:
+            return
+        if key != self._current_key:
+            self.market_state.remove(key)
+            self._release(key)
+        self.post_message(self.WatchlistChanged(list(self.watchlist)))
+
+    def _release(self, key: tuple[str, str]) -> None:
+        """Drop the streams of a market no longer shown, keeping recorded trades."""
+        if key == self._current_key or key in self.watchlist.values():
+            return
+        self._market_data.unsubscribe(*key)
+        if key in self.reactions.recordings:
+            self._market_data.subscribe(*key, channels=REACTION_CHANNELS)
+
+    def _kept_keys(self) -> set[tuple[str, str]]:
+        """Markets streamed apart from the current one."""
+        return set(self.watchlist.values()) | set(self.reactions.recordings)
+
+    def record_reaction(self, pair: str, source: str, headline_time: datetime) -> None:
+        """Record the price path of the pair around a new headline."""
+        second = int(headline_time.timestamp())
+        if time.time() - second > 60:
+            # Headlines from the history or a replay
+            return
+        key = parse_pair(pair)
+        recording = self.reactions.start(key, source, second)
+        if recording is None:
+            return
+        if not self._market_data.subscribe(*key, channels=REACTION_CHANNELS):
+            self.log(f"Could not subscribe to {key[0]}, reaction without trades")
+        self._backfill_reaction(key, recording)
+
+    @work(group="reactions")
+    async def _backfill_reaction(
+        self, key: tuple[str, str], recording: Recording
+    ) -> None:
+        """Seed the seconds before the headline with aggregated trades."""
+        start = (recording.headline_time - PRE_SECONDS) * 1000
+        end = int(time.time() * 1000)
+        try:
+            trades = await asyncio.to_thread(get_agg_trades, *key, start, end)
+        except REFRESH_ERRORS as e:
+            self.log(f"Reaction backfill of {key[0]} failed: {e}")
+            return
+        recording.seed(trades)
+
+    def finish_reactions(self) -> None:
+        """Store the finished recordings and drop their subscriptions."""
+        for key in self.reactions.finish_expired(int(time.time())):
+            if key != self._current_key and key not in self._kept_keys():
+                self._market_data.unsubscribe(*key)
+
+    def set_headline_time(self, headline_time: datetime | None) -> None:
+        """Set the time of the selected headline, None if not from the news."""
+        if headline_time is None:
+            self.headline_time = None
+        else:
+            self.headline_time = int(headline_time.timestamp())
 
     def clear_values(self) -> None:
         self.query_one("#price_value", Static).update("--")
-        self.query_one("#m1_change", Static).update("--")
-        self.query_one("#m5_change", Static).update("--")
-        self.query_one("#m15_change", Static).update("--")
+        for window in self._windows:
+            self.query_one(f"#change_{window}", Static).update("--")
+        self.query_one("#vwap_value", Static).update("")
+        self.query_one("#volume_spike", Static).update("")
+        self.query_one("#headline_move", Static).update("")
 
-    @work(exclusive=True)
-    async def _update_values(self):
+    @work(exclusive=True, group="candles")
+    async def _backfill_candles(
+        self, key: tuple[str, str], candles: RollingCandles
+    ) -> None:
+        """Seed the rolling candles with the klines of the longest window."""
+        limit = min(math.ceil(self._window_seconds[-1] / 60) + 1, 1000)
+        try:
+            klines = await asyncio.to_thread(get_recent_klines, *key, limit)
+        except REFRESH_ERRORS as e:
+            self.log(f"Klines backfill of {key[0]} failed: {e}")
+            return
+        if candles is not self._candles:
+            return
+        for kline in klines:
+            candles.add_kline(kline)
+        self._show_current()
 
-        price_label = self.query_one("#price_value", Static)
-        m1_change = self.query_one("#m1_change", Static)
-        m5_change = self.query_one("#m5_change", Static)
-        m15_change = self.query_one("#m15_change", Static)
+    def _on_stream_data(self, stream_data: dict, exchange: str) -> None:
+        """Hand stream data from the websocket threads over to the event loop."""
+        try:
+            self._loop.call_soon_threadsafe(  # type: ignore
+                self._stream_queue.put_nowait, (exchange, stream_data)
+            )
+        except RuntimeError:
+            # The event loop is closed while the streams shut down
+            pass
+
+    def _drain_stream_queue(self, first_item: tuple[str, dict]) -> set[int]:
+        """Take every queued message, storing the newest of each kind.
+
+        Returns:
+            set[int]: Market state slots with new values
+        """
+        latest_trades = {}
+        latest_klines = {}
+        current_slot = self._current_slot()
+        recordings = self.reactions.recordings
+        item = first_item
         while True:
-            await asyncio.sleep(0.1)
-            if not self._binance_api_manager:
-                continue
+            exchange, stream_data = item
+            # Subscription results and messages of dropped markets are skipped
+            market = stream_data.get("stream", "").split("@")[0]
+            key = (market, exchange)
+            if key in recordings and stream_data["data"].get("e") == "trade":
+                data = stream_data["data"]
+                self.reactions.add_trade(key, data["T"] // 1000, float(data["p"]))
+            slot = self.market_state.slots.get(key)
+            if slot is not None:
+                data = stream_data["data"]
+                if data.get("e") == "trade":
+                    latest_trades[slot] = (exchange, data)
+                    if slot == current_slot and self._candles is not None:
+                        # Every trade counts for the volume of the candles
+                        self._candles.add_trade(
+                            data["T"] // 1000, float(data["p"]), float(data["q"])
+                        )
+                elif data.get("e") == "kline":
+                    latest_klines[(slot, data["k"]["i"])] = data["k"]
+            try:
+                item = self._stream_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
 
-            if not self._binance_api_manager.get_active_stream_list():
-                continue
+        for slot, (exchange, trade) in latest_trades.items():
+            if exchange == "binance.com-futures":
+                LAST_PRICES.update(trade["s"], trade["p"])
+            self.market_state.update_trade(slot, trade["p"])
+        for (slot, interval), kline in latest_klines.items():
+            self.market_state.update_kline(slot, interval, kline["o"], kline["c"])
+        return set(latest_trades) | {slot for slot, _ in latest_klines}
+
+    def _current_slot(self) -> int | None:
+        if self._current_key is None:
+            return None
+        return self.market_state.slots.get(self._current_key)
+
+    def _show_current(self) -> None:
+        """Show the values of the current market from the market state."""
+        slot = self._current_slot()
+        if slot is None:
+            self.clear_values()
+            return
+        candles = self._candles
+        price = self.market_state.get_price(slot)
+        if price is None and candles is not None:
+            price = candles.last_price
+        price_label = self.query_one("#price_value", Static)
+        if price is None:
+            price_label.update("--")
+        else:
+            price_label.update(f"Current price: ${format_price(price)}")
 
-            if self._binance_api_manager.is_manager_stopping():
-                exit(0)
+        stats = []
+        if candles is not None:
+            now = max(candles.last_time, int(time.time()))
+            stats = candles.window_stats(self._window_seconds, now)
+        for index, window in enumerate(self._windows):
+            change_label = self.query_one(f"#change_{window}", Static)
+            change = stats[index].change if stats else None
+            if change is None and window in self.market_state.intervals:
+                # Until the candles cover the window use the streamed kline
+                change = self.market_state.get_change(slot, window)
+            if change is None:
+                change_label.update("--")
+                continue
+            change_label.update(f"{change:.3f}%")
+            self._update_change_background(change_label, change)
+        if candles is not None:
+            self._show_metrics(stats, candles)
 
-            oldest_data = self._binance_api_manager.pop_stream_data_from_stream_buffer(
-                mode="LIFO"
+    def _show_metrics(self, stats: list[WindowStats], candles: RollingCandles) -> None:
+        """Show the VWAP, volume spike and move since the headline."""
+        vwap = stats[-1].vwap
+        if vwap is not None:
+            self.query_one("#vwap_value", Static).update(
+                f"VWAP {self._windows[-1]}: {format_price(vwap)}"
+            )
+        if len(stats) > 1 and stats[-1].volume:
+            # Volume of the shortest window against its average in the longest
+            ratio = (
+                stats[0].volume
+                * self._window_seconds[-1]
+                / (stats[-1].volume * self._window_seconds[0])
             )
-            if oldest_data:
-                if not oldest_data.get("stream", "").startswith(self._current_market):
-                    continue
-                try:
-                    oldest_data = oldest_data["data"]
-                    if oldest_data["e"] == "trade":
-                        price_label.update(f"Current price: ${oldest_data['p']}")
-                    if oldest_data["e"] == "kline":
-                        oldest_data = oldest_data["k"]
-                        if oldest_data["i"] == "1m":
-                            change = (
-                                float(oldest_data["c"]) * 100 / float(oldest_data["o"])
-                            ) - 100
-                            m1_change.update(f"{change:.3f}%")
-                            self._update_change_background(m1_change, change)
-                        elif oldest_data["i"] == "5m":
-                            change = (
-                                float(oldest_data["c"]) * 100 / float(oldest_data["o"])
-                            ) - 100
-                            m5_change.update(f"{change:.3f}%")
-                            self._update_change_background(m5_change, change)
-                        elif oldest_data["i"] == "15m":
-                            change = (
-                                float(oldest_data["c"]) * 100 / float(oldest_data["o"])
-                            ) - 100
-                            m15_change.update(f"{change:.3f}%")
-                            self._update_change_background(m15_change, change)
-                except KeyError:
-                    pass
+            self.query_one("#volume_spike", Static).update(
+                f"Volume {self._windows[0]}: x{ratio:.1f}"
+            )
+        headline_move = self.query_one("#headline_move", Static)
+        headline_price = self._get_headline_price()
+        if headline_price and candles.last_price is not None:
+            move = (candles.last_price * 100 / headline_price) - 100
+            headline_move.update(f"Since news: {move:+.2f}%")
+        else:
+            headline_move.update("")
+
+    def _get_headline_price(self) -> float | None:
+        """Get the price at the selected headline, requested on first use."""
+        if self.headline_time is None or self._current_key is None:
+            return None
+        request = (self._current_key, self.headline_time)
+        if request != self._headline_request:
+            self._headline_request = request
+            self._headline_price = None
+            self._backfill_headline_price(*request)
+        return self._headline_price
+
+    @work(exclusive=True, group="headline")
+    async def _backfill_headline_price(
+        self, key: tuple[str, str], headline_time: int
+    ) -> None:
+        """Get the price at the headline from the aggregated trades around it.
+
+        Backfilled klines only have the close of the headline minute, which
+        already includes the reaction.
+        """
+        start = (headline_time - 5) * 1000
+        end = min(headline_time + 60, int(time.time())) * 1000
+        try:
+            trades = await asyncio.to_thread(get_agg_trades, *key, start, end)
+        except REFRESH_ERRORS as e:
+            self.log(f"Headline price of {key[0]} failed: {e}")
+            return
+        if (key, headline_time) != self._headline_request:
+            return
+        self._headline_price = trade_price_at(trades, headline_time)
+        self._show_current()
+
+    @work(exclusive=True)
+    async def _update_values(self):
+        while True:
+            item = await self._stream_queue.get()
+            updated_slots = self._drain_stream_queue(item)
+            current_slot = self._current_slot()
+            if current_slot is not None and current_slot in updated_slots:
+                self._show_current()
+            updated_pairs = [
+                pair
+                for pair, key in self.watchlist.items()
+                if self.market_state.slots[key] in updated_slots
+            ]
+            if updated_pairs:
+                self.post_message(self.WatchlistUpdated(updated_pairs))
+            # Messages arriving meanwhile are coalesced into the next redraw
+            await asyncio.sleep(1 / PRICE_REDRAW_RATE)
 
     def _update_change_background(
         self, change_widget: Static, change_value: float
@@ -140,5 +432,4 @@ class PriceTracker(Widget):
                 change_widget.add_class("down")
 
     def close_binance_manager(self):
-        if self._binance_api_manager:
-            self._binance_api_manager.stop_manager_with_all_streams()
+        self._market_data.stop()
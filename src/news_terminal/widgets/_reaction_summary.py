@@ -0,0 +1,39 @@
+"""Module with a widget to summarize headline reactions by source."""
+from rich.table import Table
+from textual.widgets import Static
+
+from news_terminal._reactions import REACTIONS, ReactionStore
+
+
+class ReactionSummary(Static):
+    """Widget with the typical price reaction to the headlines of each source."""
+
+    def __init__(
+        self,
+        store: ReactionStore = REACTIONS,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self.store = store
+
+    def on_mount(self) -> None:
+        self.update_summary()
+        self.set_interval(5, self.update_summary)
+
+    def update_summary(self) -> None:
+        # Nothing to draw while the config panel is out of screen
+        if any(node.has_class("-hidden") for node in self.ancestors):
+            return
+        table = Table("Source", "N", "Peak", "At", "1m", "5m", expand=True)
+        for source, count, peak, peak_time, minute, end in self.store.summary():
+            table.add_row(
+                source,
+                str(count),
+                f"{peak:.2f}%",
+                f"{peak_time:.0f}s",
+                f"{minute:+.2f}%",
+                f"{end:+.2f}%",
+            )
+        self.update(table)
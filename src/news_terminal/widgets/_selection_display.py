@@ -1,4 +1,6 @@
 """Module with a widget to show selected coin and actions."""
+from typing import Sequence
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.css.query import NoMatches
@@ -8,7 +10,7 @@ from textual.widget import Widget
 from textual.widgets import Button, Input, Static
 from textual_autocomplete import AutoComplete, Dropdown, DropdownItem
 
-from news_terminal._binance_data import ACTIONS_DATA
+from news_terminal._market_universe import MARKET_UNIVERSE
 
 SUPPORTED_ACTION_TITLES = ["PERP", "USDT", "BUSD"]
 
@@ -42,26 +44,28 @@ class SelectionDisplay(Widget):
         super().__init__(
             *children, name=name, id=id, classes=classes, disabled=disabled
         )
-        self.action_data = ACTIONS_DATA
 
     def compose(self) -> ComposeResult:
-        dropdown_items = [
-            DropdownItem(main=ticker) for ticker in self.action_data.keys()
-        ]
-
         yield AutoComplete(
             Input(placeholder="Type to select ticker..."),
-            Dropdown(items=dropdown_items),
+            Dropdown(items=self._dropdown_items()),
         )
         yield Horizontal(id="button_actions")
         yield Static(f"NO PAIR SELECTED", id="pair_text")
 
+    def _dropdown_items(self) -> list[DropdownItem]:
+        return [DropdownItem(main=ticker) for ticker in MARKET_UNIVERSE.actions]
+
+    def update_universe(self) -> None:
+        """Update search items after the market universe is refreshed."""
+        self.query_one(Dropdown).items = self._dropdown_items()
+
     async def watch_selected_pair(self, new_pair: str) -> None:
         if new_pair:
             self.query_one("#pair_text", Static).update(new_pair)
             self.add_class("-valid-pair")
 
-    def update_actions(self, actions: list[dict]) -> None:
+    def update_actions(self, actions: Sequence[dict]) -> None:
         try:
             self.query("#button_actions > Button").remove()
         except NoMatches:
@@ -80,7 +84,7 @@ class SelectionDisplay(Widget):
                 self.query_one("#button_actions", Horizontal).mount(action_button)
 
     def on_auto_complete_selected(self, message: AutoComplete.Selected) -> None:
-        actions = self.action_data[str(message.item.main)]
+        actions = MARKET_UNIVERSE.get_actions(str(message.item.main))
         self.query_one(Input).value = ""
         self.post_message(self.SearchComplete(actions))
 
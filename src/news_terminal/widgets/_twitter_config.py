@@ -11,6 +11,9 @@ class TwitterConfig(Container):
     async def on_mount(self):
         await self.update_tracked_users()
 
+    async def on_unmount(self):
+        await _twitter_monitor.TRACKED_USERS.close()
+
     async def update_tracked_users(self) -> None:
         tracked_users = await _twitter_monitor.get_current_rules()
         user_list = self.query_one("#tracked_users", ListView)
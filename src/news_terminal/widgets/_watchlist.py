@@ -0,0 +1,84 @@
+"""Module with a panel to show the watched markets."""
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.message import Message
+from textual.widgets import DataTable
+
+from news_terminal._market_state import STATE_INTERVALS, MarketState, format_price
+
+
+class WatchlistPanel(Container):
+    """Panel with the price and kline change of every watched pair."""
+
+    BINDINGS = [Binding("x", "unwatch_pair", "Unwatch Pair")]
+
+    class PairSelected(Message):
+        """Message sent when a watched pair is selected"""
+
+        def __init__(self, pair: str) -> None:
+            super().__init__()
+            self.pair = pair
+
+    class PairRemoved(Message):
+        """Message sent when a pair is removed from the watchlist"""
+
+        def __init__(self, pair: str) -> None:
+            super().__init__()
+            self.pair = pair
+
+    def compose(self) -> ComposeResult:
+        table = DataTable(show_row_labels=False)
+        table.cursor_type = "row"
+        table.add_column("Pair", key="pair")
+        table.add_column("Price", key="price")
+        for interval in STATE_INTERVALS:
+            table.add_column(interval, key=interval)
+        yield table
+
+    def set_pairs(
+        self, watchlist: dict[str, tuple[str, str]], market_state: MarketState
+    ) -> None:
+        """Show the rows of the watched pairs, in the order they were added."""
+        table = self.query_one(DataTable)
+        table.clear()
+        for pair in watchlist:
+            table.add_row(pair, "--", "--", "--", "--", key=pair)
+        self.update_pairs(list(watchlist), watchlist, market_state)
+
+    def update_pairs(
+        self,
+        pairs: list[str],
+        watchlist: dict[str, tuple[str, str]],
+        market_state: MarketState,
+    ) -> None:
+        """Update the rows of the given pairs from the market state."""
+        if self.has_class("-hidden"):
+            # Rows are refreshed by set_pairs when the panel is shown
+            return
+        table = self.query_one(DataTable)
+        for pair in pairs:
+            slot = market_state.slots[watchlist[pair]]
+            price = market_state.get_price(slot)
+            if price is not None:
+                table.update_cell(pair, "price", format_price(price))
+            for interval in market_state.intervals:
+                change = market_state.get_change(slot, interval)
+                if change is not None:
+                    table.update_cell(pair, interval, f"{change:+.2f}%")
+
+    def _cursor_pair(self) -> str | None:
+        table = self.query_one(DataTable)
+        if not table.row_count:
+            return None
+        return str(table.get_row_at(table.cursor_row)[0])
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        pair = self._cursor_pair()
+        if pair:
+            self.post_message(self.PairSelected(pair))
+
+    def action_unwatch_pair(self) -> None:
+        pair = self._cursor_pair()
+        if pair:
+            self.post_message(self.PairRemoved(pair))
@@ -0,0 +1,15 @@
+"""Settings required by news_terminal.config, set before it is imported."""
+import os
+import tempfile
+
+for _key in (
+    "TWITTER_BEARER_TOKEN",
+    "BINANCE_KEY",
+    "BINANCE_SECRET",
+    "BINANCE_KEY_TEST",
+    "BINANCE_SECRET_TEST",
+):
+    os.environ.setdefault(_key, "test")
+os.environ.setdefault("NEWS_TERMINAL_CACHE_DIR", tempfile.mkdtemp(prefix="news_test_"))
+# No live feeds, widget tests put messages on the queues themselves
+os.environ.setdefault("NEWS_FEEDS", "")
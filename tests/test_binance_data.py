@@ -0,0 +1,204 @@
+import pytest
+
+from news_terminal import _binance_data
+from news_terminal._binance_data import (
+    DEFAULT_CHANNELS,
+    REACTION_CHANNELS,
+    MarketDataManager,
+    join_actions_data,
+)
+
+
+def _spot(base: str, quote: str = "USDT") -> dict:
+    return {"symbol": f"{base}{quote}", "baseAsset": base, "quoteAsset": quote}
+
+
+def _perp(base: str, quote: str = "USDT", contract: str = "PERPETUAL") -> dict:
+    return {
+        "symbol": f"{base}{quote}",
+        "baseAsset": base,
+        "quoteAsset": quote,
+        "contractType": contract,
+    }
+
+
+def test_join_puts_perpetuals_first_and_skips_duplicates():
+    actions = join_actions_data(
+        [_spot("BTC"), _spot("BTC", "BUSD"), _spot("BTC")],
+        [_perp("BTC"), _perp("BTC", "BUSD"), _perp("BTC", contract="CURRENT_QUARTER")],
+    )
+    assert actions == {
+        "BTC": [
+            {"title": "BTCUSDT PERP"},
+            {"title": "BTCBUSD PERP"},
+            {"title": "BTC/USDT"},
+            {"title": "BTC/BUSD"},
+        ]
+    }
+
+
+def test_join_matches_1000_contracts_to_their_base_asset():
+    actions = join_actions_data([_spot("PEPE")], [_perp("1000PEPE")])
+    assert actions["PEPE"][0] == {"title": "1000PEPEUSDT PERP"}
+
+
+def test_join_skips_stable_leveraged_and_unsupported_quotes():
+    actions = join_actions_data(
+        [_spot("USDC"), _spot("BTCUP"), _spot("ETH", "BTC"), _spot("ARB2")],
+        [_perp("ETH")],
+    )
+    assert actions == {}
+
+
+def test_join_skips_perpetuals_without_spot_pairs():
+    assert join_actions_data([_spot("ETH")], [_perp("SOL")]) == {
+        "ETH": [{"title": "ETH/USDT"}]
+    }
+
+
+class _Manager(object):
+    created = []
+    accept = True
+
+    def __init__(self, exchange: str, **kwargs) -> None:
+        self.exchange = exchange
+        self.calls = []
+        self.callback = None
+        self.streams = 0
+        _Manager.created.append(self)
+
+    def create_stream(self, channels, markets, process_stream_data=None) -> str:
+        self.calls.append(("create", markets, *channels))
+        self.callback = process_stream_data
+        self.streams += 1
+        return "stream" if self.streams == 1 else f"stream {self.streams}"
+
+    def subscribe_to_stream(self, stream_id, channels, markets) -> bool:
+        self.calls.append(("subscribe", *markets))
+        return self.accept
+
+    def unsubscribe_from_stream(self, stream_id, channels=None, markets=None) -> bool:
+        # Channels would drop every market of the stream
+        assert channels is None
+        self.calls.append(("unsubscribe", *markets))
+        return True
+
+
+@pytest.fixture
+def managers(monkeypatch):
+    _Manager.created = []
+    _Manager.accept = True
+    monkeypatch.setattr(_binance_data, "BinanceWebSocketApiManager", _Manager)
+    return _Manager.created
+
+
+def test_one_manager_per_exchange_switches_subscriptions(managers):
+    received = []
+    market_data = MarketDataManager(
+        process_stream_data=lambda data, exchange: received.append((data, exchange))
+    )
+    market_data.switch("btcusdt", "binance.com-futures")
+    market_data.switch("ethusdt", "binance.com-futures")
+    market_data.switch("ethusdt", "binance.com-futures")
+    market_data.switch("solusdt", "binance.com")
+    futures, spot = managers
+    assert futures.calls == [
+        ("create", "btcusdt", *DEFAULT_CHANNELS),
+        ("unsubscribe", "btcusdt"),
+        ("subscribe", "ethusdt"),
+        ("unsubscribe", "ethusdt"),
+    ]
+    assert spot.calls == [("create", "solusdt", *DEFAULT_CHANNELS)]
+    futures.callback({"data": 1})
+    assert received == [({"data": 1}, "binance.com-futures")]
+
+
+def test_switch_keeps_the_requested_subscriptions(managers):
+    market_data = MarketDataManager()
+    market_data.subscribe("btcusdt", "binance.com-futures")
+    market_data.switch(
+        "ethusdt", "binance.com-futures", keep={("btcusdt", "binance.com-futures")}
+    )
+    assert market_data.markets["binance.com-futures"] == {"btcusdt", "ethusdt"}
+    assert ("unsubscribe", "btcusdt") not in managers[0].calls
+
+
+def test_markets_past_the_stream_limit_open_another_stream(managers, monkeypatch):
+    monkeypatch.setitem(
+        _binance_data.CONNECTION_SETTINGS, "binance.com-futures", (8, "", "", "")
+    )
+    market_data = MarketDataManager()
+    assert market_data.max_markets("binance.com-futures") == 2
+    for market in ("btcusdt", "ethusdt", "solusdt"):
+        assert market_data.subscribe(market, "binance.com-futures")
+    market_data.unsubscribe("ethusdt", "binance.com-futures")
+    market_data.subscribe("xrpusdt", "binance.com-futures")
+    markets = ("btcusdt", "solusdt", "xrpusdt")
+
+    assert managers[0].calls == [
+        ("create", "btcusdt", *DEFAULT_CHANNELS),
+        ("subscribe", "ethusdt"),
+        ("create", "solusdt", *DEFAULT_CHANNELS),
+        ("unsubscribe", "ethusdt"),
+        ("subscribe", "xrpusdt"),
+    ]
+    streams = market_data._market_streams
+    assert [streams[(market, "binance.com-futures")][1] for market in markets] == [
+        "stream",
+        "stream 2",
+        "stream",
+    ]
+
+
+def test_failed_subscription_is_not_kept(managers):
+    market_data = MarketDataManager()
+    market_data.subscribe("btcusdt", "binance.com-futures")
+    _Manager.accept = False
+
+    assert not market_data.subscribe("ethusdt", "binance.com-futures")
+    assert market_data.markets["binance.com-futures"] == {"btcusdt"}
+    market_data.unsubscribe("ethusdt", "binance.com-futures")
+    assert managers[0].calls[-1] == ("subscribe", "ethusdt")
+
+
+def test_trade_only_markets_share_their_own_stream(managers):
+    market_data = MarketDataManager()
+    market_data.subscribe("btcusdt", "binance.com", channels=REACTION_CHANNELS)
+    market_data.subscribe("ethusdt", "binance.com")
+    market_data.subscribe("ethusdt", "binance.com", channels=REACTION_CHANNELS)
+    market_data.subscribe("btcusdt", "binance.com")
+
+    assert managers[0].calls == [
+        ("create", "btcusdt", "trade"),
+        ("create", "ethusdt", *DEFAULT_CHANNELS),
+        ("unsubscribe", "btcusdt"),
+        ("subscribe", "btcusdt"),
+    ]
+    assert market_data.max_markets("binance.com-futures", REACTION_CHANNELS) == 200
+
+
+class _PublicClient(object):
+    created = 0
+
+    def __init__(self) -> None:
+        _PublicClient.created += 1
+
+    def futures_klines(self, symbol: str, interval: str, limit: int) -> list:
+        return [[symbol, interval, limit]]
+
+    def get_aggregate_trades(self, symbol: str, startTime: int, endTime: int) -> list:
+        return [{"s": symbol, "T": startTime}]
+
+
+def test_market_data_requests_share_one_client(monkeypatch):
+    _PublicClient.created = 0
+    monkeypatch.setattr(_binance_data, "Client", _PublicClient)
+    monkeypatch.setattr(_binance_data, "_public_client", None)
+
+    klines = _binance_data.get_recent_klines("btcusdt", "binance.com-futures", 2)
+    trades = _binance_data.get_agg_trades("ethusdt", "binance.com", 1000, 2000)
+    _binance_data.get_recent_klines("btcusdt", "binance.com-futures", 2)
+
+    assert klines == [["BTCUSDT", "1m", 2]]
+    assert trades == [{"s": "ETHUSDT", "T": 1000}]
+    assert _PublicClient.created == 1
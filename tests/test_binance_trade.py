@@ -0,0 +1,250 @@
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+import requests
+
+from news_terminal import _binance_trade
+from news_terminal._binance_data import parse_symbol_filters
+from news_terminal._binance_trade import (
+    AsyncBinanceTrader,
+    BinanceTrader,
+    OrderValidationError,
+)
+from news_terminal._market_universe import MARKET_UNIVERSE
+from news_terminal._price_store import LastPriceStore
+
+
+class _PingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Client(object):
+    def __init__(self, url: str) -> None:
+        self.FUTURES_URL = self.FUTURES_TESTNET_URL = url
+        self.session = requests.Session()
+
+    def futures_create_order(self, **order) -> dict:
+        self.session.get(f"{self.FUTURES_URL}/v1/order").raise_for_status()
+        return dict(order)
+
+
+@pytest.fixture
+def trader():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    trader = BinanceTrader.__new__(BinanceTrader)
+    trader.testnet = False
+    trader.client = _Client(f"http://127.0.0.1:{server.server_port}/fapi")
+    yield trader
+    trader.client.session.close()
+    server.shutdown()
+
+
+def test_first_order_opens_a_connection_and_the_next_reuses_it(trader):
+    assert trader.submit_order({"symbol": "BTCUSDT"})["connection"].startswith("new")
+    assert trader.submit_order({"symbol": "BTCUSDT"})["connection"] == "warm"
+
+
+def test_counting_connections_does_not_add_pools(trader):
+    trader.submit_order({"symbol": "BTCUSDT"})
+    pools = trader.client.session.get_adapter(trader.client.FUTURES_URL).poolmanager
+    assert len(pools.pools) == 1
+
+
+def test_order_is_sent_when_connections_can_not_be_counted(trader, monkeypatch):
+    def urlsplit(url: str) -> None:
+        raise AttributeError("pools changed")
+
+    monkeypatch.setattr(_binance_trade, "urlsplit", urlsplit)
+
+    trade = trader.submit_order({"symbol": "BTCUSDT"})
+
+    assert (trade["symbol"], trade["connection"]) == ("BTCUSDT", "unknown")
+
+
+class _PriceClient(object):
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def futures_mark_price(self, symbol: str) -> dict:
+        self.requests += 1
+        return {"symbol": symbol, "markPrice": "99.5"}
+
+
+@pytest.fixture
+def prices(monkeypatch):
+    prices = LastPriceStore(max_age=60)
+    monkeypatch.setattr(_binance_trade, "LAST_PRICES", prices)
+    return prices
+
+
+def _price_trader(testnet: bool) -> BinanceTrader:
+    trader = BinanceTrader.__new__(BinanceTrader)
+    trader.testnet = testnet
+    trader.client = _PriceClient()
+    return trader
+
+
+def test_last_prices_are_parsed_on_read_and_expire():
+    prices = LastPriceStore(max_age=60)
+    prices.update("btcusdt", "100.10")
+    assert prices.get("BTCUSDT") == Decimal("100.10")
+    assert prices.get("ETHUSDT") is None
+    stale = LastPriceStore(max_age=-1)
+    stale.update("BTCUSDT", "1")
+    assert stale.get("BTCUSDT") is None
+
+
+def test_mainnet_orders_use_the_streamed_price(prices):
+    trader = _price_trader(testnet=False)
+    prices.update("BTCUSDT", "100")
+    assert trader.get_price("BTCUSDT") == Decimal("100")
+    assert trader.client.requests == 0
+    assert trader.get_price("ETHUSDT") == Decimal("99.5")
+    assert trader.client.requests == 1
+
+
+def test_testnet_orders_always_ask_the_mark_price(prices):
+    trader = _price_trader(testnet=True)
+    prices.update("BTCUSDT", "100")
+    assert trader.get_price("BTCUSDT") == Decimal("99.5")
+    assert trader.client.requests == 1
+
+
+FILTERS = {
+    "quantity_precision": 3,
+    "tick_size": "0.1",
+    "step_size": "0.001",
+    "min_qty": "0.001",
+    "max_qty": "1000",
+    "min_notional": "5",
+}
+
+
+class _LeverageClient(object):
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def futures_leverage_bracket(self) -> list[dict]:
+        self.requests += 1
+        return [{"symbol": "BTCUSDT", "brackets": [{"initialLeverage": 125}]}]
+
+
+@pytest.fixture
+def filtered_trader(monkeypatch, tmp_path):
+    monkeypatch.setattr(MARKET_UNIVERSE, "_tables", ({}, {"BTCUSDT": FILTERS}))
+    monkeypatch.setattr(_binance_trade, "CACHE_DIR", str(tmp_path))
+    trader = BinanceTrader.__new__(BinanceTrader)
+    trader.testnet = False
+    trader.client = _LeverageClient()
+    trader.max_leverage = {"BTCUSDT": 20}
+    return trader
+
+
+def test_symbol_filters_are_parsed_once_from_the_exchange_info():
+    futures_symbol = {
+        "symbol": "BTCUSDT",
+        "quantityPrecision": 3,
+        "filters": [
+            {"filterType": "PRICE_FILTER", "tickSize": "0.1"},
+            {"filterType": "LOT_SIZE", "stepSize": "0.01", "minQty": "0.01"},
+            {"filterType": "MARKET_LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+            {"filterType": "MIN_NOTIONAL", "notional": "5"},
+        ],
+    }
+    filters = parse_symbol_filters([futures_symbol])["BTCUSDT"]
+    # Market orders are bound by MARKET_LOT_SIZE
+    assert (filters["step_size"], filters["min_qty"]) == ("0.001", "0.001")
+    assert filters["max_qty"] == "0"
+
+
+@pytest.mark.parametrize(
+    "symbol, quantity, leverage, error",
+    [
+        ("BTCUSDT", "0.0001", 10, "below 0.001"),
+        ("BTCUSDT", "2000", 10, "above 1000"),
+        ("BTCUSDT", "0.01", 10, "notional 1.00 below 5"),
+        ("BTCUSDT", "1", 25, "leverage 25 above 20"),
+        ("ETHUSDT", "1", 10, "Unknown futures symbol"),
+    ],
+)
+def test_orders_are_validated_locally(
+    filtered_trader, symbol, quantity, leverage, error
+):
+    with pytest.raises(OrderValidationError, match=error):
+        filtered_trader.validate_order(
+            symbol, Decimal(quantity), Decimal(100), leverage
+        )
+
+
+def test_valid_order_is_prepared_without_a_request(filtered_trader):
+    order = filtered_trader.prepare_leverage_trade(
+        "BTCUSDT", "BUY", "MARKET", Decimal(100), 10, token_price=Decimal("30000")
+    )
+    assert order == {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "MARKET",
+        "quantity": Decimal("0.033"),
+    }
+
+
+def test_max_leverage_is_read_from_disk_until_stale(filtered_trader):
+    assert filtered_trader.get_max_leverage() == {"BTCUSDT": 125}
+    assert filtered_trader.get_max_leverage() == {"BTCUSDT": 125}
+    assert filtered_trader.client.requests == 1
+    filtered_trader.get_max_leverage(refresh=True)
+    assert filtered_trader.client.requests == 2
+
+
+class _TestnetClient(_LeverageClient):
+    def futures_exchange_info(self) -> dict:
+        self.requests += 1
+        lot_size = {"filterType": "LOT_SIZE", "stepSize": "0.1", "minQty": "0.1"}
+        return {
+            "symbols": [
+                {"symbol": "TSTUSDT", "quantityPrecision": 1, "filters": [lot_size]}
+            ]
+        }
+
+
+def test_testnet_orders_use_the_testnet_filters(filtered_trader):
+    filtered_trader.testnet = True
+    filtered_trader.client = _TestnetClient()
+    filtered_trader.testnet_filters = filtered_trader.get_testnet_filters()
+    assert filtered_trader.get_testnet_filters() == filtered_trader.testnet_filters
+    assert filtered_trader.client.requests == 1
+
+    assert AsyncBinanceTrader(filtered_trader).has_symbol("TSTUSDT")
+    with pytest.raises(OrderValidationError, match="Unknown futures symbol"):
+        filtered_trader.validate_order("BTCUSDT", Decimal(1), Decimal(100), 1)
+    quantity = filtered_trader.calculate_position_side(
+        "TSTUSDT", Decimal(10), 1, token_price=Decimal(3)
+    )
+    assert quantity == Decimal("3.3")
+
+
+def test_testnet_filters_refresh_once_stale(filtered_trader, monkeypatch):
+    filtered_trader.testnet = True
+    filtered_trader.client = _TestnetClient()
+    filtered_trader.testnet_filters = filtered_trader.get_testnet_filters()
+    filtered_trader.max_leverage_updated = _binance_trade.time.time()
+    filtered_trader.refresh_snapshots()
+    assert filtered_trader.client.requests == 1
+
+    monkeypatch.setattr(_binance_trade, "MARKET_UNIVERSE_TTL", 0)
+    filtered_trader.refresh_snapshots()
+    # Leverage brackets and exchange info
+    assert filtered_trader.client.requests == 3
+    assert set(filtered_trader.symbol_filters) == {"TSTUSDT"}
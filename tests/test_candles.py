@@ -0,0 +1,124 @@
+import math
+
+import pytest
+
+from news_terminal._candles import (
+    RollingCandles,
+    WindowStats,
+    parse_window,
+    trade_price_at,
+)
+
+NOW = 1_700_000_000
+
+
+def _kline(second: int, open_price: str, close_price: str, volume: str) -> list:
+    quote_volume = str(float(close_price) * float(volume))
+    return [second * 1000, open_price, "0", "0", close_price, volume, 0, quote_volume]
+
+
+@pytest.mark.parametrize("window, seconds", [("30s", 30), ("5m", 300), ("1h", 3600)])
+def test_parse_window(window, seconds):
+    assert parse_window(window) == seconds
+
+
+def test_window_stats_without_trades_have_no_change():
+    stats = WindowStats()
+    assert stats.change is None
+    assert stats.vwap is None
+    assert math.isnan(stats.open_price)
+
+
+def test_trades_of_one_second_share_a_bucket():
+    candles = RollingCandles(120)
+    candles.add_trade(NOW, 10.0, 1.0)
+    candles.add_trade(NOW, 12.0, 3.0)
+    candles.add_trade(NOW - 1, 9.0, 1.0)
+
+    index = NOW % candles.size
+    assert (candles.opens[index], candles.closes[index]) == (10.0, 12.0)
+    assert (candles.volumes[index], candles.quote_volumes[index]) == (4.0, 46.0)
+    assert (candles.first_time, candles.last_time, candles.last_price) == (
+        NOW - 1,
+        NOW,
+        12.0,
+    )
+
+
+def test_old_seconds_are_overwritten():
+    candles = RollingCandles(60)
+    candles.add_trade(NOW - 60, 5.0, 10.0)
+    candles.add_trade(NOW, 6.0, 1.0)
+
+    index = NOW % candles.size
+    assert (candles.opens[index], candles.volumes[index]) == (6.0, 1.0)
+    assert candles.price_at(NOW - 60) is None
+
+
+def test_klines_seed_the_buckets_without_replacing_trades():
+    candles = RollingCandles(600)
+    candles.add_trade(NOW - 60, 11.0, 2.0)
+    candles.add_kline(_kline(NOW - 120, "9", "10", "5"))
+    candles.add_kline(_kline(NOW - 60, "1", "1", "100"))
+    candles.add_kline(_kline(NOW - 700, "1", "1", "100"))
+
+    assert candles.volumes[(NOW - 60) % candles.size] == 2.0
+    assert candles.volumes[(NOW - 120) % candles.size] == 5.0
+    assert candles.first_time == NOW - 120
+    assert candles.last_price == 11.0
+
+
+def test_window_stats_of_every_window_in_one_pass():
+    candles = RollingCandles(600)
+    candles.add_kline(_kline(NOW - 299, "100", "100", "1"))
+    candles.add_trade(NOW - 50, 102.0, 1.0)
+    candles.add_trade(NOW - 10, 110.0, 2.0)
+
+    one_minute, five_minutes, fifteen_minutes = candles.window_stats(
+        [60, 300, 900], NOW
+    )
+
+    assert one_minute.change == pytest.approx((110 / 102 - 1) * 100)
+    assert one_minute.volume == 3.0
+    assert one_minute.vwap == pytest.approx((102 + 220) / 3)
+    assert five_minutes.change == pytest.approx(10)
+    assert five_minutes.volume == 4.0
+    # The buckets do not reach back fifteen minutes
+    assert fifteen_minutes.change is None
+
+
+def test_window_without_trades_keeps_the_last_price():
+    candles = RollingCandles(600)
+    candles.add_trade(NOW - 200, 50.0, 1.0)
+
+    stats = candles.window_stats([60, 300], NOW)
+
+    assert stats[0].change == 0
+    assert stats[0].volume == 0
+    # Trades started within the longer window
+    assert stats[1].change is None
+
+
+def test_price_at_walks_back_to_the_last_trade():
+    candles = RollingCandles(600)
+    candles.add_trade(NOW - 30, 20.0, 1.0)
+    candles.add_trade(NOW, 21.0, 1.0)
+
+    assert candles.price_at(NOW - 31) is None
+    assert candles.price_at(NOW - 30) == 20.0
+    assert candles.price_at(NOW - 1) == 20.0
+    assert candles.price_at(NOW) == 21.0
+
+
+def test_trade_price_at_the_second_or_the_first_after():
+    trades = [
+        {"p": "100", "T": (NOW - 3) * 1000},
+        {"p": "101", "T": NOW * 1000 + 999},
+        {"p": "105", "T": (NOW + 5) * 1000},
+    ]
+
+    assert trade_price_at(trades, NOW) == 101
+    assert trade_price_at(trades, NOW - 1) == 100
+    assert trade_price_at(trades, NOW - 10) == 100
+    assert trade_price_at(trades, NOW + 10) == 105
+    assert trade_price_at([], NOW) is None
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from news_terminal.news.data_format import NewsData, RenderedNews
+
+
+def _record(**fields) -> NewsData:
+    values = {
+        "title": "Binance will list BTC",
+        "link": "https://www.binance.com",
+        "body": "",
+        "source": "".join(["Binance", " EN"]),
+        "time": datetime(2024, 1, 1),
+        "coin": "BTC",
+        "tree_id": 1,
+    }
+    values.update(fields)
+    return NewsData(**values)
+
+
+def test_record_is_immutable():
+    record = _record()
+
+    with pytest.raises(AttributeError):
+        record.title = "changed"
+    with pytest.raises(AttributeError):
+        del record.coin
+    with pytest.raises(AttributeError):
+        record.extra = 1
+    assert record.title == "Binance will list BTC"
+    assert not hasattr(record, "__dict__")
+
+
+def test_sources_are_interned_and_sequences_are_tuples():
+    first = _record(actions=[{"title": "BTCUSDT PERP"}], symbols=["BTC"])
+    second = _record()
+
+    assert first.source is second.source
+    assert first.actions == ({"title": "BTCUSDT PERP"},)
+    assert (first.symbols, second.symbols) == (("BTC",), ())
+
+
+def test_markup_is_built_once():
+    record = _record(title="[@a] lists BTC", link="")
+
+    assert record._rendered is None
+    rendered = record.rendered
+    assert isinstance(rendered, RenderedNews)
+    assert rendered.title == "@a lists BTC"
+    assert record.rendered is rendered
@@ -0,0 +1,37 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from news_terminal.news import _decoder
+
+
+@pytest.fixture
+def without_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(_decoder)
+    monkeypatch.undo()
+    importlib.reload(_decoder)
+
+
+def test_fastest_available_decoder_is_used():
+    pytest.importorskip("orjson")
+    assert _decoder.DECODER_NAME == "orjson"
+    assert set(_decoder.DECODERS) == {"json", "orjson"}
+
+
+def test_standard_library_without_orjson(without_orjson):
+    assert without_orjson.DECODER_NAME == "json"
+    assert without_orjson.DECODERS == {"json": json.loads}
+    assert without_orjson.decode is json.loads
+
+
+@pytest.mark.parametrize("name", sorted(_decoder.DECODERS))
+def test_decoders_take_text_and_bytes(name):
+    decoder = _decoder.DECODERS[name]
+    payload = '{"title": "Binance lists BTC", "time": 1}'
+
+    assert decoder(payload) == decoder(payload.encode()) == json.loads(payload)
+    with pytest.raises(ValueError):
+        decoder(payload[:-1])
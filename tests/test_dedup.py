@@ -0,0 +1,28 @@
+from news_terminal.news._dedup import FirstArrivalFilter, message_key
+
+
+def test_message_key_prefers_ids_then_hashes_content():
+    assert message_key({"_id": "a", "title": "x"}) == "id:a"
+    assert message_key({"title": "x"}) == message_key({"title": "x", "source": "y"})
+    assert message_key({"title": "x"}) != message_key({"title": "y"})
+
+
+def test_only_the_first_copy_is_accepted():
+    dedup = FirstArrivalFilter()
+    assert dedup.accept({"_id": 1}, "a")
+    assert not dedup.accept({"_id": 1}, "b")
+    assert not dedup.accept({"_id": 1}, "a")
+    assert dedup.accept({"_id": 2}, "b")
+    assert dedup.wins == {"a": 1, "b": 1}
+    assert dedup.duplicates == 2
+    # Only copies from another connection measure the lead of the winner
+    assert [result[1:3] for result in dedup.results] == [("a", "b")]
+    assert dedup.summary().endswith("dropped 2")
+
+
+def test_seen_keys_are_bounded_oldest_first():
+    dedup = FirstArrivalFilter(max_items=2)
+    for _id in (1, 2, 3):
+        dedup.accept({"_id": _id}, "a")
+    assert dedup.accept({"_id": 1}, "a")
+    assert not dedup.accept({"_id": 3}, "a")
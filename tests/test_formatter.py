@@ -0,0 +1,73 @@
+import pytest
+
+from news_terminal._symbol_index import SYMBOL_INDEX
+from news_terminal.news._formatter import (
+    _format_text,
+    format_news_data,
+    format_news_message,
+)
+
+
+@pytest.fixture(autouse=True)
+def symbol_index():
+    SYMBOL_INDEX.build(["BTC", "ETH"])
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("[@cz_binance] says hi", "@cz_binance says hi"),
+        (
+            "see https://x.com/a now",
+            'see [@click=app.open_link("https://x.com/a")]x.com/...[/] now',
+        ),
+        (
+            "see https://x.com/[@foo] now",
+            'see [@click=app.open_link("https://x.com/@foo")]x.com/...[/] now',
+        ),
+        (
+            "(via https://x.com/[@foo]/status/1)",
+            '(via [@click=app.open_link("https://x.com/@foo/status/1")]x.com/...[/])',
+        ),
+        (
+            "go www.example.org/a!",
+            'go [@click=app.open_link("www.example.org/a")]Link[/]!',
+        ),
+        ("no links here", "no links here"),
+    ],
+)
+def test_format_text(text, expected):
+    assert _format_text(text) == expected
+
+
+def _message(**fields) -> dict:
+    return {
+        "title": "",
+        "url": "",
+        "source": "Binance EN",
+        "time": 1e12,
+        "_id": 1,
+    } | fields
+
+
+def test_format_news_data_blogs_split_title_and_body():
+    record = format_news_data(_message(title="Blog: the post", source="Blogs"))
+    assert (record.title, record.body) == ("Blog", "the post")
+
+
+def test_format_news_data_coin_from_actions_then_symbols():
+    record = format_news_data(_message(actions=[{"title": "ETH/USDT"}]))
+    assert record.coin == "ETH"
+    record = format_news_data(_message(title="$BTC breaks out"))
+    assert (record.coin, record.symbols) == ("BTC", ("BTC",))
+
+
+def test_format_news_message_builds_markup_from_raw_fields():
+    record = format_news_data(
+        _message(title="[@a] on BTC", url="https://x.com/a", coin="BTC")
+    )
+    rendered = format_news_message(record)
+    assert rendered.title == "@a on BTC"
+    assert rendered.link == '[@click=app.open_link("https://x.com/a")]x.com/...[/]'
+    assert rendered.coin == "Coin: BTC"
+    assert record.title == "[@a] on BTC"
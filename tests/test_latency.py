@@ -0,0 +1,79 @@
+import csv
+
+import pytest
+
+from news_terminal.news._latency import LatencyStats, LatencyTrace, percentile
+
+
+def _trace(*stages: tuple[str, float], published: float | None = None) -> LatencyTrace:
+    """Trace with the stages finished at the given ms after receive."""
+    trace = LatencyTrace(published)
+    trace.stamps = [("receive", 0)]
+    trace.stamps.extend((stage, int(ms * 1e6)) for stage, ms in stages)
+    return trace
+
+
+def test_durations_of_each_stage_and_total():
+    trace = _trace(("decode", 0.5), ("format", 2.0), ("render", 2.5))
+
+    assert trace.durations() == {
+        "decode": 0.5,
+        "format": 1.5,
+        "render": 0.5,
+        "total": 2.5,
+    }
+
+
+def test_feed_delay_from_the_publication_time():
+    trace = LatencyTrace(published=1.0)
+    trace.received = 0.25
+
+    assert trace.durations()["feed"] == 249.0
+    assert "feed" not in LatencyTrace().durations()
+
+
+def test_stamp_keeps_the_stage_order():
+    trace = LatencyTrace()
+    trace.stamp("decode")
+    trace.stamp("queue")
+
+    assert [stage for stage, _ in trace.stamps] == ["receive", "decode", "queue"]
+    assert list(trace.durations()) == ["decode", "queue", "total"]
+
+
+@pytest.mark.parametrize(
+    "percent, value", [(0, 1.0), (50, 5.0), (99, 10.0), (100, 10.0)]
+)
+def test_nearest_rank_percentile(percent, value):
+    assert percentile([float(value) for value in range(1, 11)], percent) == value
+
+
+def test_stats_keep_the_latest_samples_per_source():
+    stats = LatencyStats(max_samples=3)
+    for ms in (9.0, 1.0, 2.0, 3.0):
+        stats.record(_trace(("format", ms)), "Binance")
+    stats.record(_trace(("format", 7.0)), "Bloomberg")
+
+    assert stats.count == 5
+    assert stats.summary() == [
+        ("Binance", "format", 3, 2.0, 3.0, 3.0),
+        ("Binance", "total", 3, 2.0, 3.0, 3.0),
+        ("Bloomberg", "format", 1, 7.0, 7.0, 7.0),
+        ("Bloomberg", "total", 1, 7.0, 7.0, 7.0),
+    ]
+
+
+def test_export_writes_the_summary(tmp_path):
+    stats = LatencyStats()
+    stats.record(_trace(("format", 4.0)), "Binance")
+    path = tmp_path / "latency" / "news.csv"
+
+    stats.export(path)
+
+    with path.open(newline="") as export_file:
+        rows = list(csv.reader(export_file))
+    assert rows == [
+        ["source", "stage", "samples", "p50", "p99", "max"],
+        ["Binance", "format", "1", "4.0", "4.0", "4.0"],
+        ["Binance", "total", "1", "4.0", "4.0", "4.0"],
+    ]
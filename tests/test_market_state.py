@@ -0,0 +1,60 @@
+import pytest
+
+from news_terminal._market_state import MarketState, format_price, parse_pair
+
+
+@pytest.mark.parametrize(
+    "pair, key",
+    [
+        ("BTCUSDT PERP", ("btcusdt", "binance.com-futures")),
+        ("1000PEPEUSDT PERP", ("1000pepeusdt", "binance.com-futures")),
+        ("BTC/USDT", ("btcusdt", "binance.com")),
+    ],
+)
+def test_parse_pair(pair, key):
+    assert parse_pair(pair) == key
+
+
+@pytest.mark.parametrize(
+    "price, text", [(30000.0, "30000"), (0.00001234, "0.00001234"), (1.5, "1.5")]
+)
+def test_format_price_drops_trailing_zeros(price, text):
+    assert format_price(price) == text
+
+
+def test_values_are_missing_until_received():
+    state = MarketState()
+    slot = state.add(("btcusdt", "binance.com"))
+
+    assert state.get_price(slot) is None
+    assert state.get_change(slot, "1m") is None
+
+    state.update_trade(slot, "101.5")
+    state.update_kline(slot, "15m", "100", "110")
+    state.update_kline(slot, "1h", "100", "200")
+    assert state.get_price(slot) == 101.5
+    assert state.get_change(slot, "15m") == pytest.approx(10)
+    assert state.get_change(slot, "5m") is None
+
+
+def test_removed_slots_are_cleared_and_reused():
+    state = MarketState()
+    btc = state.add(("btcusdt", "binance.com"))
+    eth = state.add(("ethusdt", "binance.com"))
+    state.update_trade(btc, "1")
+    state.update_kline(btc, "1m", "1", "2")
+    assert state.add(("btcusdt", "binance.com")) == btc
+
+    state.remove(("btcusdt", "binance.com"))
+    state.remove(("btcusdt", "binance.com"))
+    sol = state.add(("solusdt", "binance.com"))
+
+    assert sol == btc
+    assert len(state) == 2
+    assert len(state.prices) == 2
+    assert state.get_price(sol) is None
+    assert state.get_change(sol, "1m") is None
+    assert state.slots == {
+        ("ethusdt", "binance.com"): eth,
+        ("solusdt", "binance.com"): sol,
+    }
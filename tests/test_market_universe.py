@@ -0,0 +1,93 @@
+import time
+
+import pytest
+import requests
+
+from news_terminal import _market_universe
+from news_terminal._market_universe import (
+    SNAPSHOT_VERSION,
+    MarketUniverse,
+    read_snapshot,
+    write_snapshot,
+)
+
+FUTURES = [
+    {
+        "symbol": "BTCUSDT",
+        "baseAsset": "BTC",
+        "quoteAsset": "USDT",
+        "contractType": "PERPETUAL",
+        "quantityPrecision": 3,
+        "filters": [],
+    }
+]
+SPOT = [{"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT"}]
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    calls = []
+
+    def futures_symbols() -> list[dict]:
+        calls.append("futures")
+        return FUTURES
+
+    monkeypatch.setattr(_market_universe, "get_futures_symbols", futures_symbols)
+    monkeypatch.setattr(_market_universe, "get_spot_symbols", lambda: SPOT)
+    return calls
+
+
+def test_snapshot_round_trip_and_version(tmp_path):
+    path = tmp_path / "snapshot.json"
+    write_snapshot(path, 1, updated=5.0, actions={"BTC": []})
+    assert read_snapshot(path, 1) == {
+        "version": 1,
+        "updated": 5.0,
+        "actions": {"BTC": []},
+    }
+    assert read_snapshot(path, 2) is None
+    assert read_snapshot(tmp_path / "missing.json", 1) is None
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_tables_are_loaded_from_disk_without_a_request(tmp_path, exchange):
+    path = tmp_path / "universe.json"
+    write_snapshot(
+        path,
+        SNAPSHOT_VERSION,
+        updated=time.time(),
+        actions={"ETH": [{"title": "ETH/USDT"}]},
+        futures_filters={},
+    )
+    universe = MarketUniverse(path, ttl=60)
+    assert universe.get_actions("ETH") == [{"title": "ETH/USDT"}]
+    assert universe.fetch() is False
+    assert exchange == []
+
+
+def test_stale_tables_are_fetched_and_written(tmp_path, exchange):
+    path = tmp_path / "universe.json"
+    universe = MarketUniverse(path, ttl=60)
+    assert universe.get_actions("BTC") == []
+    assert universe.fetch() is True
+    assert universe.get_actions("BTC") == [
+        {"title": "BTCUSDT PERP"},
+        {"title": "BTC/USDT"},
+    ]
+    assert "BTCUSDT" in universe.futures_filters
+    assert MarketUniverse(path, ttl=60).get_actions("BTC") == universe.get_actions(
+        "BTC"
+    )
+    assert exchange == ["futures"]
+
+
+def test_offline_refresh_keeps_the_last_tables(tmp_path, exchange, monkeypatch):
+    universe = MarketUniverse(tmp_path / "universe.json", ttl=0)
+    universe.fetch()
+
+    def offline() -> list[dict]:
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(_market_universe, "get_futures_symbols", offline)
+    assert universe.fetch(force=True) is False
+    assert universe.get_actions("BTC")
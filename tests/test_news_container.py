@@ -0,0 +1,147 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from textual.app import App, ComposeResult
+
+from news_terminal._symbol_index import SYMBOL_INDEX
+from news_terminal.news._decoder import RAW_KEY
+from news_terminal.news.data_format import NewsData
+from news_terminal.widgets import _news_container
+from news_terminal.widgets._news_container import (
+    VISIBLE_NEWS,
+    NewsContainer,
+    NewsContent,
+)
+
+
+class _NewsApp(App):
+    def __init__(self) -> None:
+        super().__init__()
+        self.logged = []
+        self.received = []
+
+    def compose(self) -> ComposeResult:
+        yield NewsContainer()
+
+    def log_news(self, message) -> None:
+        self.logged.append(message)
+
+    def on_news_container_headlines_received(
+        self, message: NewsContainer.HeadlinesReceived
+    ) -> None:
+        self.received.append(message.records)
+
+
+def _message(index: int) -> dict:
+    return {
+        "title": f"headline {index}",
+        "url": "",
+        "source": "Binance EN",
+        "time": datetime.now().timestamp() * 1000,
+        "_id": index,
+    }
+
+
+def _titles(app: App) -> list[str]:
+    return [content.data.title for content in app.query(NewsContent)]
+
+
+def _run(scenario) -> None:
+    async def run() -> None:
+        app = _NewsApp()
+        async with app.run_test() as pilot:
+            await scenario(app, app.query_one(NewsContainer), pilot)
+
+    asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def symbol_index():
+    SYMBOL_INDEX.build(["BTC"])
+
+
+def test_a_burst_is_mounted_in_one_batch_newest_first():
+    async def scenario(app, container, pilot):
+        for index in range(30):
+            container.news_queue.put_nowait(_message(index))
+        await pilot.pause(0.5)
+        assert [len(records) for records in app.received] == [30]
+        assert len(app.logged) == 30
+        titles = _titles(app)
+        assert len(titles) == VISIBLE_NEWS
+        assert (titles[0], titles[-1]) == ("headline 29", "headline 5")
+
+    _run(scenario)
+
+
+def test_raw_payload_is_logged_instead_of_the_message():
+    async def scenario(app, container, pilot):
+        payload = b'{"title": "headline 0"}'
+        container.news_queue.put_nowait(dict(_message(0), **{RAW_KEY: payload}))
+        container.news_queue.put_nowait(_message(1))
+        await pilot.pause(0.5)
+        assert app.logged[0] is payload
+        assert app.logged[1]["title"] == "headline 1"
+        assert container.history[1].title == "headline 0"
+
+    _run(scenario)
+
+
+def test_history_is_bounded(monkeypatch):
+    monkeypatch.setattr(_news_container, "NEWS_HISTORY", 40)
+
+    async def scenario(app, container, pilot):
+        for index in range(60):
+            container.news_queue.put_nowait(_message(index))
+        await pilot.pause(0.5)
+        assert len(container.history) == 40
+        assert container.history[0].title == "headline 59"
+        assert len(_titles(app)) == VISIBLE_NEWS
+
+    _run(scenario)
+
+
+def test_scrolled_back_window_stays_on_the_same_headlines():
+    async def scenario(app, container, pilot):
+        for index in range(30):
+            container.news_queue.put_nowait(_message(index))
+        await pilot.pause(0.5)
+        await container.move_focus(app.query(NewsContent).last(), 1)
+        titles = _titles(app)
+        assert (titles[0], titles[-1], len(titles)) == (
+            "headline 28",
+            "headline 4",
+            VISIBLE_NEWS,
+        )
+
+        container.news_queue.put_nowait(_message(30))
+        container.news_queue.put_nowait(_message(31))
+        await pilot.pause(0.5)
+        assert container._offset == 3
+        assert _titles(app)[0] == "headline 28"
+        assert app.sub_title.startswith("3 newer headlines")
+
+        assert container.show_latest()
+        await pilot.pause(0.5)
+        assert _titles(app)[0] == "headline 31"
+        assert not app.sub_title
+
+    _run(scenario)
+
+
+def test_news_content_builds_the_markup_when_created():
+    record = NewsData(
+        title="[@a] on BTC",
+        link="https://x.com/a",
+        body="",
+        source="Binance EN",
+        time=datetime.now(),
+        coin="BTC",
+        tree_id=1,
+    )
+    content = NewsContent(record)
+    # Counted in the "render" latency stage, not later in "mount"
+    assert record._rendered is not None
+    assert content.rendered is record.rendered
+    assert content.rendered.title == "@a on BTC"
@@ -0,0 +1,64 @@
+import asyncio
+
+from textual.app import App, ComposeResult
+
+from news_terminal.widgets._news_log import NewsLog
+
+
+class _LogApp(App):
+    CSS = """
+    .-hidden {
+        display: none;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        self.news_log = NewsLog(size=3, classes="-hidden")
+        yield self.news_log
+
+
+def _run(scenario) -> None:
+    async def run() -> None:
+        app = _LogApp()
+        async with app.run_test() as pilot:
+            await scenario(app.news_log, pilot)
+
+    asyncio.run(run())
+
+
+def test_hidden_log_renders_nothing():
+    async def scenario(news_log: NewsLog, pilot) -> None:
+        for index in range(5):
+            news_log.add({"index": index})
+        await pilot.pause(0.1)
+
+        assert len(news_log._row_cache) == 0
+        assert news_log.virtual_size.height == 0
+        assert [message["index"] for message in news_log.messages] == [2, 3, 4]
+        assert news_log._dropped == 2
+
+    _run(scenario)
+
+
+def test_shown_log_renders_rows_of_every_payload_kind():
+    async def scenario(news_log: NewsLog, pilot) -> None:
+        news_log.add('{"kind":\n"str"}')
+        news_log.add(b'{"kind": "bytes"}')
+        news_log.add({"kind": "dict"})
+        news_log.remove_class("-hidden")
+        news_log.show_latest()
+        await pilot.pause(0.1)
+
+        assert news_log.virtual_size.height == 3
+        assert set(news_log._row_cache.keys()) == {0, 1, 2}
+        rows = [news_log._render_row(index).text for index in range(3)]
+        assert rows == ['{"kind": "str"}', '{"kind": "bytes"}', '{"kind": "dict"}']
+
+        news_log.add({"kind": "new"})
+        await pilot.pause(0.1)
+
+        # Rows keep their key once older messages are dropped
+        assert news_log._render_row(0) is news_log._row_cache.get(1)
+        assert news_log._render_row(2).text == '{"kind": "new"}'
+
+    _run(scenario)
@@ -0,0 +1,203 @@
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import requests
+from textual.app import App, ComposeResult
+from textual.widgets import TextLog
+
+from news_terminal import _binance_trade
+from news_terminal._binance_trade import AsyncBinanceTrader, BinanceTrader
+from news_terminal._market_universe import MARKET_UNIVERSE
+from news_terminal._price_store import LastPriceStore
+from news_terminal.widgets import _position_manager
+from news_terminal.widgets._position_manager import PositionManager
+
+
+class _Trader(object):
+    client = SimpleNamespace(
+        SIDE_BUY="BUY", SIDE_SELL="SELL", FUTURE_ORDER_TYPE_MARKET="MARKET"
+    )
+
+    async def get_futures_balance(self, symbol: str = "USDT") -> Decimal:
+        return Decimal("100")
+
+    async def change_leverage(self, symbol: str, leverage: int) -> dict:
+        return {}
+
+
+class _Pool(object):
+    """Trader pool whose other network can not be reached."""
+
+    def __init__(self, trader: _Trader) -> None:
+        self.trader = trader
+
+    async def get(self, testnet: bool) -> _Trader:
+        if not testnet:
+            raise requests.ConnectionError("mainnet unreachable")
+        return self.trader
+
+    async def keep_warm(self) -> dict:
+        return {}
+
+
+class _PositionApp(App):
+    def compose(self) -> ComposeResult:
+        yield PositionManager()
+
+    def log_binance(self, renderable) -> None:
+        self.query_one(PositionManager).log_binance(renderable)
+
+
+def _logged(app: App) -> str:
+    return "\n".join(line.text for line in app.query_one("#binance_log", TextLog).lines)
+
+
+def _run(trader: _Trader, interact=None) -> tuple[bool, str]:
+    async def run() -> tuple[bool, str]:
+        app = _PositionApp()
+        async with app.run_test() as pilot:
+            await pilot.pause(0.3)
+            if interact:
+                await interact(app, pilot)
+                await pilot.pause(0.3)
+            return app.is_running, _logged(app)
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def trader(monkeypatch):
+    trader = _Trader()
+    monkeypatch.setattr(_position_manager, "TRADER_POOL", _Pool(trader))
+    return trader
+
+
+def test_unreachable_other_network_is_logged_not_fatal(trader):
+    running, logged = _run(trader)
+    assert running
+    assert "Initialized Binance trader with TESTNET: True" in logged
+    assert "mainnet unreachable" in logged
+
+
+class _OfflineTrader(_Trader):
+    async def get_futures_balance(self, symbol: str = "USDT") -> Decimal:
+        raise requests.ConnectionError("balance unreachable")
+
+    async def change_leverage(self, symbol: str, leverage: int) -> dict:
+        raise requests.Timeout("leverage timed out")
+
+
+@pytest.fixture
+def offline_trader(monkeypatch):
+    trader = _OfflineTrader()
+    monkeypatch.setattr(_position_manager, "TRADER_POOL", _Pool(trader))
+    return trader
+
+
+def test_failed_balance_and_leverage_calls_are_logged(offline_trader):
+    async def select_pair(app, pilot):
+        app.query_one(PositionManager).pair_selected("BTCUSDT PERP")
+        app.query_one(PositionManager).update_binance_leverage()
+
+    running, logged = _run(offline_trader, select_pair)
+    assert running
+    assert "Balance update failed: balance unreachable" in logged
+    assert "Leverage update failed: leverage timed out" in logged
+
+
+def test_failed_order_is_logged(trader):
+    async def send_order(app, pilot):
+        async def confirm() -> dict:
+            raise requests.ConnectionError("order unreachable")
+
+        app.query_one(PositionManager).confirm_dialog._send_order(confirm)
+
+    running, logged = _run(trader, send_order)
+    assert running
+    assert "Order failed: order unreachable" in logged
+
+
+def test_unreachable_active_network_leaves_no_trader(monkeypatch):
+    class _Offline(_Pool):
+        async def get(self, testnet: bool) -> _Trader:
+            raise requests.ConnectionError("testnet unreachable")
+
+    monkeypatch.setattr(_position_manager, "TRADER_POOL", _Offline(_Trader()))
+
+    async def check(app, pilot):
+        assert app.query_one(PositionManager).binance_trader is None
+
+    running, logged = _run(_Trader(), check)
+    assert running
+    assert "Binance trader failed: testnet unreachable" in logged
+
+
+class _OrderClient(object):
+    SIDE_BUY = "BUY"
+    SIDE_SELL = "SELL"
+    FUTURE_ORDER_TYPE_MARKET = "MARKET"
+
+    def futures_change_leverage(self, symbol: str, leverage: int) -> dict:
+        return {"symbol": symbol, "leverage": leverage, "maxNotionalValue": "1000000"}
+
+    def futures_account_balance(self) -> list[dict]:
+        return [{"asset": "USDT", "balance": "1000"}]
+
+
+@pytest.fixture
+def armed_trader(monkeypatch):
+    prices = LastPriceStore(max_age=60)
+    prices.update("BTCUSDT", "100")
+    monkeypatch.setattr(_binance_trade, "LAST_PRICES", prices)
+    filters = {
+        "quantity_precision": 3,
+        "tick_size": "0.1",
+        "step_size": "0.001",
+        "min_qty": "0.001",
+        "max_qty": "0",
+        "min_notional": "5",
+    }
+    monkeypatch.setattr(MARKET_UNIVERSE, "_tables", ({}, {"BTCUSDT": filters}))
+    trader = BinanceTrader.__new__(BinanceTrader)
+    trader.testnet = False
+    trader.client = _OrderClient()
+    trader.max_leverage = {"BTCUSDT": 50}
+    async_trader = AsyncBinanceTrader(trader)
+
+    class _ArmedPool(_Pool):
+        async def get(self, testnet: bool) -> AsyncBinanceTrader:
+            return async_trader
+
+    monkeypatch.setattr(_position_manager, "TRADER_POOL", _ArmedPool(async_trader))
+    return async_trader
+
+
+def test_orders_are_armed_once_the_leverage_is_set_and_sent_as_armed(armed_trader):
+    sent = []
+
+    async def submit_order(order: dict) -> dict:
+        sent.append(order)
+        return order
+
+    armed_trader.submit_order = submit_order
+
+    async def select_and_send(app, pilot):
+        position_manager = app.query_one(PositionManager)
+        position_manager.pair_selected("BTCUSDT PERP")
+        assert position_manager.armed_orders == {}
+        position_manager.update_binance_leverage()
+        await pilot.pause(0.3)
+        assert position_manager.armed_orders["BUY"] == {
+            "symbol": "BTCUSDT",
+            "side": "BUY",
+            "type": "MARKET",
+            "quantity": Decimal("100.000"),
+        }
+        assert position_manager.armed_orders["SELL"]["side"] == "SELL"
+        await position_manager._submit_position("BTCUSDT", "BUY", "1000", 10)
+        assert sent == [position_manager.armed_orders["BUY"]]
+
+    running, logged = _run(armed_trader, select_and_send)
+    assert running
@@ -0,0 +1,271 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+from textual.app import App, ComposeResult
+
+from news_terminal._binance_data import DEFAULT_CHANNELS
+from news_terminal._price_store import LastPriceStore
+from news_terminal.widgets import _price_tracker
+from news_terminal.widgets._price_tracker import PriceTracker
+
+
+def _trade(market: str, price: str, second: int = 1_700_000_000) -> dict:
+    return {
+        "stream": f"{market}@trade",
+        "data": {
+            "e": "trade",
+            "s": market.upper(),
+            "p": price,
+            "q": "1",
+            "T": second * 1000,
+        },
+    }
+
+
+def _kline(market: str, interval: str, open_price: str, close_price: str) -> dict:
+    return {
+        "stream": f"{market}@kline_{interval}",
+        "data": {
+            "e": "kline",
+            "k": {"i": interval, "o": open_price, "c": close_price},
+        },
+    }
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.setattr(_price_tracker, "LAST_PRICES", LastPriceStore())
+    return PriceTracker()
+
+
+def test_drain_takes_every_queued_message_and_keeps_the_newest(tracker):
+    slot = tracker.market_state.add(("btcusdt", "binance.com"))
+    for price in ("2", "3"):
+        tracker._stream_queue.put_nowait(("binance.com", _trade("btcusdt", price)))
+    tracker._stream_queue.put_nowait(
+        ("binance.com", _kline("btcusdt", "5m", "100", "110"))
+    )
+
+    updated = tracker._drain_stream_queue(("binance.com", _trade("btcusdt", "1")))
+
+    assert updated == {slot}
+    assert tracker._stream_queue.empty()
+    assert tracker.market_state.get_price(slot) == 3
+    assert tracker.market_state.get_change(slot, "5m") == pytest.approx(10)
+
+
+def test_drain_skips_results_and_markets_without_a_slot(tracker):
+    slot = tracker.market_state.add(("btcusdt", "binance.com"))
+    tracker._stream_queue.put_nowait(("binance.com", _trade("ethusdt", "5")))
+    tracker._stream_queue.put_nowait(("binance.com", {"result": None, "id": 1}))
+
+    updated = tracker._drain_stream_queue(
+        ("binance.com-futures", _trade("btcusdt", "7"))
+    )
+
+    assert updated == set()
+    assert tracker.market_state.get_price(slot) is None
+
+
+def test_drain_feeds_every_trade_of_the_current_market_to_the_candles(tracker):
+    tracker._current_key = ("btcusdt", "binance.com")
+    tracker.market_state.add(tracker._current_key)
+    tracker._candles = _price_tracker.RollingCandles(600)
+    for price in ("2", "3"):
+        tracker._stream_queue.put_nowait(("binance.com", _trade("btcusdt", price)))
+
+    tracker._drain_stream_queue(("binance.com", _trade("btcusdt", "1")))
+
+    candles = tracker._candles
+    assert candles.volumes[1_700_000_000 % candles.size] == 3
+    assert (candles.opens[1_700_000_000 % candles.size], candles.last_price) == (1, 3)
+
+
+def test_drain_shares_futures_prices_with_the_order_sizing(tracker):
+    futures_slot = tracker.market_state.add(("btcusdt", "binance.com-futures"))
+    tracker.market_state.add(("ethusdt", "binance.com"))
+    tracker._stream_queue.put_nowait(("binance.com", _trade("ethusdt", "2000")))
+
+    tracker._drain_stream_queue(("binance.com-futures", _trade("btcusdt", "30000.5")))
+
+    assert tracker.market_state.get_price(futures_slot) == 30000.5
+    assert str(_price_tracker.LAST_PRICES.get("BTCUSDT")) == "30000.5"
+    assert _price_tracker.LAST_PRICES.get("ETHUSDT") is None
+
+
+class _MarketData(object):
+    def __init__(self) -> None:
+        self.channels: dict[tuple[str, str], tuple[str, ...]] = {}
+        self.rejected: set[str] = set()
+
+    @property
+    def subscribed(self) -> set[tuple[str, str]]:
+        return set(self.channels)
+
+    @property
+    def markets(self) -> dict[str, set[str]]:
+        markets = defaultdict(set)
+        for market, exchange in self.channels:
+            markets[exchange].add(market)
+        return markets
+
+    def subscribe(
+        self, market: str, exchange: str, channels: list[str] | None = None
+    ) -> bool:
+        if market in self.rejected:
+            return False
+        channels_key = tuple(channels or DEFAULT_CHANNELS)
+        subscribed = self.channels.get((market, exchange), ())
+        if not set(channels_key) <= set(subscribed):
+            self.channels[(market, exchange)] = channels_key
+        return True
+
+    def unsubscribe(self, market: str, exchange: str) -> None:
+        self.channels.pop((market, exchange), None)
+
+    def switch(self, market: str, exchange: str, keep: set) -> float:
+        for key in list(self.channels):
+            if key != (market, exchange) and key not in keep:
+                self.unsubscribe(*key)
+        self.subscribe(market, exchange)
+        return 0.0
+
+
+class _TrackerApp(App):
+    def __init__(self) -> None:
+        super().__init__()
+        self.changes: list[list[str]] = []
+
+    def compose(self) -> ComposeResult:
+        self.tracker = PriceTracker()
+        self.tracker._market_data = _MarketData()
+        yield self.tracker
+
+    def on_price_tracker_watchlist_changed(
+        self, message: PriceTracker.WatchlistChanged
+    ) -> None:
+        self.changes.append(message.pairs)
+
+
+def _watch(interact) -> _TrackerApp:
+    async def run() -> _TrackerApp:
+        app = _TrackerApp()
+        async with app.run_test() as pilot:
+            interact(app.tracker)
+            await pilot.pause(0.1)
+        return app
+
+    return asyncio.run(run())
+
+
+def test_watched_pairs_share_the_streams_until_the_list_is_full(monkeypatch):
+    monkeypatch.setattr(_price_tracker, "WATCHLIST_SIZE", 2)
+    added = []
+
+    def interact(tracker: PriceTracker) -> None:
+        for pair in ("BTCUSDT PERP", "ETH/USDT", "ETH/USDT", "SOL/USDT"):
+            added.append(tracker.watch_pair(pair))
+
+    app = _watch(interact)
+
+    tracker = app.tracker
+    keys = {("btcusdt", "binance.com-futures"), ("ethusdt", "binance.com")}
+    assert added == [True, True, True, False]
+    assert tracker._market_data.subscribed == keys
+    assert set(tracker.market_state.slots) == keys
+    assert app.changes == [["BTCUSDT PERP"], ["BTCUSDT PERP", "ETH/USDT"]]
+
+
+def test_unwatched_pair_keeps_its_stream_while_selected():
+    def interact(tracker: PriceTracker) -> None:
+        tracker.watch_pair("BTC/USDT")
+        tracker.watch_pair("ETH/USDT")
+        tracker._current_key = ("btcusdt", "binance.com")
+        tracker.unwatch_pair("BTC/USDT")
+        tracker.unwatch_pair("ETH/USDT")
+
+    app = _watch(interact)
+
+    tracker = app.tracker
+    assert tracker._market_data.subscribed == {("btcusdt", "binance.com")}
+    assert ("btcusdt", "binance.com") in tracker.market_state
+    assert ("ethusdt", "binance.com") not in tracker.market_state
+    assert app.changes[-1] == []
+
+
+def test_pair_failing_to_subscribe_is_not_watched():
+    added = []
+
+    def interact(tracker: PriceTracker) -> None:
+        tracker._market_data.rejected.add("ethusdt")
+        added.append(tracker.watch_pair("ETH/USDT"))
+
+    app = _watch(interact)
+
+    assert added == [False]
+    assert app.tracker.watchlist == {}
+    assert len(app.tracker.market_state) == 0
+    assert app.changes == []
+
+
+def test_reaction_markets_stream_trades_only(monkeypatch):
+    monkeypatch.setattr(_price_tracker, "get_agg_trades", lambda *args: [])
+    monkeypatch.setattr(_price_tracker, "get_recent_klines", lambda *args: [])
+    btc, eth = ("btcusdt", "binance.com"), ("ethusdt", "binance.com")
+    channels = []
+
+    def interact(tracker: PriceTracker) -> None:
+        tracker.record_reaction("BTC/USDT", "Binance", datetime.now())
+        channels.append(dict(tracker._market_data.channels))
+        tracker.subscribe_to_action("BTC/USDT")
+        channels.append(dict(tracker._market_data.channels))
+        tracker.subscribe_to_action("ETH/USDT")
+        channels.append(dict(tracker._market_data.channels))
+
+    _watch(interact)
+
+    full = tuple(DEFAULT_CHANNELS)
+    assert channels == [
+        {btc: ("trade",)},
+        {btc: full},
+        {btc: ("trade",), eth: full},
+    ]
+
+
+def test_move_since_news_starts_at_the_price_of_the_headline(monkeypatch):
+    headline = datetime.now().replace(microsecond=0)
+    second = int(headline.timestamp())
+    minute = second - 10
+    requests = []
+
+    def get_recent_klines(market: str, exchange: str, limit: int) -> list:
+        # The headline minute went from 100 to 110
+        return [[minute * 1000, "100", "110", "100", "110", "5", 0, "525"]]
+
+    def get_agg_trades(market: str, exchange: str, start: int, end: int) -> list:
+        requests.append((market, start // 1000 - second, end // 1000 - second))
+        return [
+            {"p": "100", "T": (second - 2) * 1000},
+            {"p": "105", "T": (second + 5) * 1000},
+        ]
+
+    monkeypatch.setattr(_price_tracker, "get_recent_klines", get_recent_klines)
+    monkeypatch.setattr(_price_tracker, "get_agg_trades", get_agg_trades)
+    moves = []
+
+    async def run() -> None:
+        app = _TrackerApp()
+        async with app.run_test() as pilot:
+            app.tracker.set_headline_time(headline)
+            app.tracker.subscribe_to_action("BTCUSDT PERP")
+            await pilot.pause(0.3)
+            moves.append(app.tracker.query_one("#headline_move").renderable)
+
+    asyncio.run(run())
+
+    assert str(moves[0]) == "Since news: +10.00%"
+    # Only up to now, the minute after the headline has not passed yet
+    assert [request[:2] for request in requests] == [("btcusdt", -5)]
+    assert requests[0][2] <= 1
@@ -0,0 +1,121 @@
+import math
+
+import pytest
+
+from news_terminal._reactions import (
+    POST_SECONDS,
+    PRE_SECONDS,
+    SAMPLES,
+    ReactionRecorder,
+    ReactionStore,
+    Recording,
+)
+
+HEADLINE = 1_700_000_000
+
+
+def _recording(source: str, moves: dict[int, float]) -> Recording:
+    """Recording at 100 before the headline with the price after each second."""
+    recording = Recording(source, "BTCUSDT", HEADLINE)
+    recording.add_trade(HEADLINE, 100.0)
+    for second, price in moves.items():
+        recording.add_trade(HEADLINE + second, price)
+    recording.fill_gaps()
+    return recording
+
+
+def test_recording_keeps_the_seconds_around_the_headline():
+    recording = Recording("Binance", "BTCUSDT", HEADLINE)
+    recording.add_trade(HEADLINE - PRE_SECONDS - 1, 1.0)
+    recording.add_trade(HEADLINE - PRE_SECONDS, 2.0)
+    recording.add_trade(HEADLINE + POST_SECONDS, 3.0)
+    recording.add_trade(HEADLINE + POST_SECONDS + 1, 4.0)
+
+    assert recording.end_time == HEADLINE + POST_SECONDS
+    assert (recording.prices[0], recording.prices[-1]) == (2.0, 3.0)
+    assert sum(not math.isnan(price) for price in recording.prices) == 2
+
+
+def test_seed_fills_only_the_missed_seconds():
+    recording = Recording("Binance", "BTCUSDT", HEADLINE)
+    recording.add_trade(HEADLINE, 10.0)
+    recording.seed(
+        [
+            {"T": (HEADLINE - 1) * 1000, "p": "8"},
+            {"T": (HEADLINE - 1) * 1000 + 500, "p": "9"},
+            {"T": HEADLINE * 1000, "p": "1"},
+        ]
+    )
+    recording.fill_gaps()
+
+    assert recording.prices[PRE_SECONDS - 1] == 9.0
+    assert recording.prices[PRE_SECONDS] == 10.0
+    assert recording.prices[-1] == 10.0
+    assert math.isnan(recording.prices[0])
+
+
+def test_store_appends_rows_read_by_the_next_session(tmp_path):
+    store = ReactionStore(tmp_path / "reactions")
+    store.append(_recording("Binance", {10: 105.0}))
+    store.append(_recording("Upbit", {}))
+
+    loaded = ReactionStore(tmp_path / "reactions")
+
+    assert len(loaded) == 2
+    assert loaded.sources == ["Binance", "Upbit"]
+    assert list(loaded.times) == [HEADLINE, HEADLINE]
+    assert len(loaded.prices) == 2 * SAMPLES
+    assert loaded.prices[PRE_SECONDS + 10] == 105.0
+
+
+def test_store_skips_a_partly_written_row(tmp_path):
+    store = ReactionStore(tmp_path / "reactions")
+    store.append(_recording("Binance", {}))
+    with (tmp_path / "reactions.jsonl").open("a") as rows_file:
+        rows_file.write('{"source": "Upbit", "symbol": "ETHUSDT", "time": 1}\n')
+
+    assert len(ReactionStore(tmp_path / "reactions")) == 1
+    assert len(ReactionStore(tmp_path / "missing")) == 0
+
+
+def test_summary_per_source_is_cached_until_a_row_is_added(tmp_path):
+    store = ReactionStore(tmp_path / "reactions")
+    store.append(_recording("Binance", {10: 104.0, 60: 102.0, POST_SECONDS: 101.0}))
+    store.append(_recording("Binance", {20: 94.0, 60: 98.0, POST_SECONDS: 97.0}))
+    store.append(_recording("Upbit", {30: 110.0}))
+
+    summary = store.summary()
+
+    assert summary[0][:2] == ("Binance", 2)
+    assert summary[0][2:] == pytest.approx((5, 15, 0, -1))
+    assert summary[1] == pytest.approx(("Upbit", 1, 10, 30, 10, 10))
+    assert store.summary() is summary
+    store.append(_recording("Upbit", {}))
+    assert store.summary()[1][1] == 2
+
+
+def test_recorder_limits_the_active_recordings(tmp_path):
+    recorder = ReactionRecorder(ReactionStore(tmp_path / "reactions"), max_active=2)
+    key = ("btcusdt", "binance.com")
+
+    assert recorder.start(key, "Binance", HEADLINE) is not None
+    assert recorder.start(key, "Upbit", HEADLINE) is None
+    assert recorder.start(key, "Upbit", HEADLINE + 1) is not None
+    assert recorder.start(("ethusdt", "binance.com"), "Binance", HEADLINE) is None
+
+
+def test_recorder_stores_expired_recordings(tmp_path):
+    store = ReactionStore(tmp_path / "reactions")
+    recorder = ReactionRecorder(store, max_active=2)
+    btc, eth = ("btcusdt", "binance.com"), ("ethusdt", "binance.com-futures")
+    recorder.start(btc, "Binance", HEADLINE)
+    recorder.start(eth, "Binance", HEADLINE + 10)
+    recorder.add_trade(btc, HEADLINE, 100.0)
+
+    assert recorder.finish_expired(HEADLINE + POST_SECONDS) == []
+    assert recorder.finish_expired(HEADLINE + POST_SECONDS + 1) == [btc]
+
+    assert list(recorder.recordings) == [eth]
+    assert store.symbols == ["BTCUSDT"]
+    assert store.prices[-1] == 100.0
+    assert recorder.start(btc, "Binance", HEADLINE + 20) is not None
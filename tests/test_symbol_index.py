@@ -0,0 +1,39 @@
+from news_terminal._symbol_index import SymbolIndex, parse_aliases
+
+
+def _index(*tickers: str) -> SymbolIndex:
+    index = SymbolIndex(parse_aliases(["bitcoin:BTC", "ethereum:ETH"]))
+    index.build(tickers)
+    return index
+
+
+def test_build_is_skipped_for_the_same_tickers():
+    index = _index("BTC", "ETH")
+    automaton = index._automaton
+    index.build(["ETH", "BTC"])
+    assert index._automaton is automaton
+    index.build(["BTC", "ETH", "SOL"])
+    assert index._automaton is not automaton
+    assert index.rank("SOL rallies") == ["SOL"]
+
+
+def test_tickers_need_upper_case_and_whole_words():
+    index = _index("BTC", "ETH")
+    assert index.rank("ETH, BTC and METHOD") == ["ETH", "BTC"]
+    assert index.rank("eth is up") == []
+
+
+def test_cashtags_and_aliases_outweigh_bare_tickers():
+    index = _index("BTC", "ETH")
+    assert index.rank("BTC and $eth") == ["ETH", "BTC"]
+    assert index.rank("BTC rallies", "Ethereum upgrade") == ["BTC", "ETH"]
+    assert index.rank("BTC LISTS ETH", "Bitcoin") == ["BTC"]
+
+
+def test_text_changing_length_when_lowercased():
+    index = _index("BTC", "ETH")
+    # "İ" lowercases to two characters, "ß" and other letters to one
+    assert index.rank("İstanbul lists ETH and BTC") == ["ETH", "BTC"]
+    assert list(index.scan("İİ ETH")) == [(3, "ETH", 1)]
+    assert index.rank("Straße lists $btc, ETH") == ["BTC", "ETH"]
+    assert index.rank("İ ethereum") == ["ETH"]
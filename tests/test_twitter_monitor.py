@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from news_terminal.news._twitter_monitor import AuthorCache, NewsStream, TrackedUsers
+
+
+class _UsersClient(object):
+    def __init__(self) -> None:
+        self.requests = []
+
+    async def get_user(self, id: int) -> SimpleNamespace:
+        self.requests.append(("get_user", id))
+        return SimpleNamespace(data=SimpleNamespace(id=id, name=f"user {id}"))
+
+    async def get_users(self, usernames: list[str]) -> SimpleNamespace:
+        self.requests.append(("get_users", len(usernames)))
+        users = [
+            SimpleNamespace(id=index, name=name) for index, name in enumerate(usernames)
+        ]
+        return SimpleNamespace(data=users)
+
+
+def test_authors_are_requested_once_until_they_expire():
+    client = _UsersClient()
+    authors = AuthorCache(client)  # type: ignore
+    assert asyncio.run(authors.fetch(7)) == "user 7"
+    assert asyncio.run(authors.fetch(7)) == "user 7"
+    assert client.requests == [("get_user", 7)]
+
+    expired = AuthorCache(client, ttl=-1)  # type: ignore
+    expired.put(7, "old name")
+    assert expired.get(7) is None
+    expired.evict_expired()
+    assert expired._names == {}
+
+
+def test_warm_requests_users_by_hundreds():
+    client = _UsersClient()
+    authors = AuthorCache(client)  # type: ignore
+    asyncio.run(authors.warm([f"name{index}" for index in range(250)]))
+    assert client.requests == [
+        ("get_users", 100),
+        ("get_users", 100),
+        ("get_users", 50),
+    ]
+    assert authors.get(49) == "name249"
+
+
+def test_stream_takes_authors_from_the_payload():
+    client = _UsersClient()
+    queue = asyncio.Queue()
+    stream = NewsStream("token", AuthorCache(client), queue)  # type: ignore
+    tweet = SimpleNamespace(
+        id=1, author_id=7, text="hello", created_at=datetime.fromtimestamp(1000)
+    )
+    response = SimpleNamespace(
+        data=tweet, includes={"users": [SimpleNamespace(id=7, name="cz")]}
+    )
+    asyncio.run(stream.on_response(response))  # type: ignore
+    message = queue.get_nowait()
+    assert (message["title"], message["body"], message["time"]) == ("cz", "hello", 1e6)
+    assert client.requests == []
+
+
+class _RulesClient(object):
+    def __init__(self, rules: list[tuple[str, int]]) -> None:
+        self.session = SimpleNamespace(closed=False)
+        self.rules = rules
+        self.requests = []
+
+    async def get_rules(self) -> SimpleNamespace:
+        self.requests.append("get_rules")
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(value=f"from:{name}", id=id) for name, id in self.rules
+            ]
+        )
+
+    async def add_rules(self, rule) -> SimpleNamespace:
+        self.requests.append("add_rules")
+        if rule.value == "from:rejected":
+            return SimpleNamespace(data=None)
+        return SimpleNamespace(data=[SimpleNamespace(value=rule.value, id=99)])
+
+    async def delete_rules(self, ids: int) -> None:
+        self.requests.append(("delete_rules", ids))
+
+
+def _tracked_users(rules: list[tuple[str, int]]) -> tuple[TrackedUsers, _RulesClient]:
+    tracked = TrackedUsers("token")
+    client = _RulesClient(rules)
+    tracked.client = client  # type: ignore
+    return tracked, client
+
+
+def test_rules_are_fetched_once_and_updated_locally():
+    tracked, client = _tracked_users([("cz_binance", 1)])
+
+    async def scenario() -> dict:
+        await tracked.get_rules()
+        await tracked.add("tree_news")
+        await tracked.remove("cz_binance")
+        await tracked.remove("unknown")
+        return await tracked.get_rules()
+
+    assert asyncio.run(scenario()) == {"tree_news": 99}
+    assert client.requests == ["get_rules", "add_rules", ("delete_rules", 1)]
+
+
+def test_rejected_rule_syncs_with_the_api():
+    tracked, client = _tracked_users([("cz_binance", 1)])
+    assert asyncio.run(tracked.add("rejected")) is None
+    assert client.requests == ["add_rules", "get_rules"]
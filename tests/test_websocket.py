@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import pytest
+from websockets.server import serve
+
+from news_terminal.news._decoder import RAW_KEY
+from news_terminal.news._dedup import FirstArrivalFilter
+from news_terminal.news._latency import TRACE_KEY
+from news_terminal.news._websocket import (
+    Backoff,
+    ConnectionHealth,
+    subscribe_to_wss,
+    supervise,
+)
+
+
+def test_backoff_retries_fast_once_then_grows_within_the_cap():
+    backoff = Backoff(first=0.1, base=0.5, cap=3.0)
+    assert backoff.next() == 0.1
+    delays = [backoff.next() for _ in range(20)]
+    assert all(0.1 <= delay <= 3.0 for delay in delays)
+    backoff.reset()
+    assert backoff.next() == 0.1
+
+
+def test_health_counts_messages_reconnects_and_downtime():
+    health = ConnectionHealth("feed")
+    health.on_connect()
+    health.on_message()
+    health.on_message()
+    assert (health.connected, health.messages, health.total_messages) == (True, 2, 2)
+    health.on_disconnect(OSError("reset"))
+    assert (health.connected, health.reconnects) == (False, 1)
+    assert health.last_error == "OSError('reset')"
+    health.on_disconnect(None)
+    assert health.reconnects == 1
+    health.on_connect()
+    assert health.messages == 0
+    assert health.total_messages == 2
+    assert health.total_downtime == health.downtime > 0
+    assert "feed: UP" in health.summary()
+
+
+def test_supervise_reconnects_after_errors_and_closes(capsys):
+    health = ConnectionHealth("feed")
+    sessions = []
+
+    async def session() -> None:
+        sessions.append(len(sessions))
+        if len(sessions) == 4:
+            raise asyncio.CancelledError
+        health.on_connect()
+        if len(sessions) % 2:
+            raise OSError("reset")
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(supervise(session, health, Backoff(first=0, base=0, cap=0)))
+    assert len(sessions) == 4
+    assert health.reconnects == 3
+    assert "retrying" in capsys.readouterr().out
+
+
+def test_supervise_does_not_catch_unexpected_errors():
+    async def session() -> None:
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        asyncio.run(supervise(session, ConnectionHealth("feed")))
+
+
+def _receive(frames: list, count: int, **kwargs) -> tuple[list, ConnectionHealth]:
+    """Serve the frames on a local ws:// url and collect the queued messages."""
+
+    async def run() -> tuple[list, ConnectionHealth]:
+        async def send_frames(websocket) -> None:
+            for frame in frames:
+                await websocket.send(frame)
+            await websocket.wait_closed()
+
+        async with serve(send_frames, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            queue = asyncio.Queue()
+            health = ConnectionHealth("replay")
+            task = asyncio.create_task(
+                subscribe_to_wss(queue, f"ws://localhost:{port}", health, **kwargs)
+            )
+            messages = [await asyncio.wait_for(queue.get(), 5) for _ in range(count)]
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        return messages, health
+
+    return asyncio.run(run())
+
+
+def test_local_feed_is_queued_with_a_trace(capsys):
+    frames = [json.dumps({"title": "A", "time": 1}), "not json", '{"title": "B"}']
+
+    messages, health = _receive(frames, 2)
+
+    assert [message["title"] for message in messages] == ["A", "B"]
+    assert messages[0][TRACE_KEY].published == 1
+    assert [stage for stage, _ in messages[1][TRACE_KEY].stamps] == [
+        "receive",
+        "decode",
+        "filter",
+    ]
+    assert health.total_messages == 3
+    out = capsys.readouterr().out
+    assert "Opened ws://localhost" in out
+    assert "Invalid message" in out
+
+
+def test_filtered_messages_are_not_queued():
+    frames = [json.dumps({"title": title}) for title in ("skip", "keep")]
+
+    def message_filter(message: dict, name: str) -> bool:
+        return name == "replay" and message["title"] == "keep"
+
+    messages, _ = _receive(frames, 1, message_filter=message_filter)
+
+    assert messages[0]["title"] == "keep"
+
+
+def test_received_payload_is_kept_as_sent():
+    text = json.dumps({"title": "text"})
+    binary = json.dumps({"title": "binary"}).encode()
+
+    messages, _ = _receive([text, binary], 2)
+
+    assert (messages[0][RAW_KEY], messages[1][RAW_KEY]) == (text, binary)
+
+
+def test_frames_other_than_objects_are_skipped_before_filtering(capsys):
+    frames = ["[]", '"ping"', "1", "null", json.dumps({"_id": 1, "title": "A"})]
+
+    messages, health = _receive(frames, 1, message_filter=FirstArrivalFilter().accept)
+
+    assert messages[0]["title"] == "A"
+    assert (health.connected, health.reconnects) == (True, 0)
+    assert capsys.readouterr().out.count("Skipped message") == 4